@@ -1,9 +1,17 @@
-from .api.DualSenseController import DualSenseController, Mapping, DeviceInfo, ConnectionType
+from .api.DualSenseController import DualSenseController, Mapping, DeviceInfo, ConnectionType, HidTransport, \
+    InReportOverflowPolicy
 from .api.contextmanager import active_dualsense_controller
 from .api.enum import UpdateLevel
 from .api.property import TriggerProperty
 from .core.Benchmarker import Benchmark
-from .core.exception import InvalidDeviceIndexException
-from .core.state.read_state.value_type import Accelerometer, Battery, Connection, Gyroscope, JoyStick, Orientation, \
-    TouchFinger
-from .core.state.typedef import Number
+from .core.HidReactor import HidReactor
+from .core.ReportTracker import ReportStatistics
+from .core.exception import DeviceTimeoutException, InvalidDeviceIndexException
+from .core.hotplug.HotplugWatcher import HotplugWatcher
+from .core.report.in_report.batch import decode_batch
+from .core.report.in_report.enum import InReportGroup
+from .core.state.read_state.StateHistory import StateHistory
+from .core.state.read_state.enum import ReadStateName
+from .core.state.read_state.value_type import Accelerometer, Battery, Connection, ControllerSnapshot, Gyroscope, \
+    JoyStick, Orientation, Reconnection, ReportTimestamps, TouchFinger
+from .core.state.typedef import FrameChanges, Number
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import warnings
-from typing import Final
+from typing import Any, Callable, Final
 
 from dualsense_controller.api.Properties import Properties
 from dualsense_controller.api.enum import UpdateLevel
@@ -10,6 +10,7 @@ from dualsense_controller.api.property.BatteryProperty import BatteryProperty
 from dualsense_controller.api.property.BenchmarkProperty import BenchmarkProperty
 from dualsense_controller.api.property.ButtonProperty import ButtonProperty
 from dualsense_controller.api.property.ConnectionProperty import ConnectionProperty
+from dualsense_controller.api.property.DerivedProperty import DerivedProperty
 from dualsense_controller.api.property.ExceptionProperty import ExceptionProperty
 from dualsense_controller.api.property.GyroscopeProperty import GyroscopeProperty
 from dualsense_controller.api.property.JoyStickProperty import JoyStickProperty
@@ -17,15 +18,28 @@ from dualsense_controller.api.property.LightbarProperty import LightbarProperty
 from dualsense_controller.api.property.MicrophoneProperty import MicrophoneProperty
 from dualsense_controller.api.property.OrientationProperty import OrientationProperty
 from dualsense_controller.api.property.PlayerLedsProperty import PlayerLedsProperty
+from dualsense_controller.api.property.ReconnectionProperty import ReconnectionProperty
+from dualsense_controller.api.property.ReportStatisticsProperty import ReportStatisticsProperty
+from dualsense_controller.api.property.ReportTimestampsProperty import ReportTimestampsProperty
 from dualsense_controller.api.property.RumbleProperty import RumbleProperty
 from dualsense_controller.api.property.TouchFingerProperty import TouchFingerProperty
 from dualsense_controller.api.property.TriggerProperty import TriggerProperty
 from dualsense_controller.api.typedef import PropertyChangeCallback
 from dualsense_controller.core.DualSenseControllerCore import DualSenseControllerCore
-from dualsense_controller.core.enum import ConnectionType
-from dualsense_controller.core.hidapi import DeviceInfo
+from dualsense_controller.core.HidReactor import HidReactor
+from dualsense_controller.core.InReportRingBuffer import InReportRingBufferStats
+from dualsense_controller.core.ReportTracker import ReportStatistics
+from dualsense_controller.core.enum import ConnectionType, HidTransport, InReportOverflowPolicy
+from dualsense_controller.core.exception import DeviceTimeoutException
+from dualsense_controller.core.hotplug.HotplugWatcher import HotplugWatcher
+from dualsense_controller.core.report.in_report.enum import InReportGroup
 from dualsense_controller.core.state.mapping.enum import StateValueMapping as Mapping
-from dualsense_controller.core.state.typedef import Number
+from dualsense_controller.core.state.read_state.StateHistory import StateHistory
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from dualsense_controller.core.state.read_state.value_type import ControllerSnapshot
+from dualsense_controller.core.state.typedef import DeriveFn, FrameChangesCallback, Number, StateName
+from dualsense_controller.core.typedef import DeviceInfo
+from dualsense_controller.core.util import call_all_parallel
 
 
 class DualSenseController:
@@ -33,8 +47,21 @@ class DualSenseController:
     # ################################################# STATIC STUFF ##################################################
 
     @staticmethod
-    def enumerate_devices() -> list[DeviceInfo]:
-        return DualSenseControllerCore.enumerate_devices()
+    def enumerate_devices(transport: HidTransport = HidTransport.HIDAPI, refresh: bool = False) -> list[DeviceInfo]:
+        return DualSenseControllerCore.enumerate_devices(transport, refresh)
+
+    @staticmethod
+    def invalidate_device_cache() -> None:
+        DualSenseControllerCore.invalidate_device_cache()
+
+    @staticmethod
+    def activate_all(controllers: list[DualSenseController], timeout: float | None = None) -> None:
+        # all or nothing, controllers already activated are deactivated again if one of them fails
+        call_all_parallel(
+            controllers,
+            lambda controller: controller.activate(timeout),
+            lambda controller: controller.deactivate(),
+        )
 
     # ################################################# GETTERS  MISC ##################################################
 
@@ -46,6 +73,22 @@ class DualSenseController:
     def is_active(self) -> bool:
         return self._core.is_initialized
 
+    @property
+    def skipped_in_reports(self) -> int:
+        return self._core.skipped_in_reports
+
+    @property
+    def report_statistics(self) -> ReportStatistics:
+        return self._core.report_statistics
+
+    @property
+    def changed_in_report_groups(self) -> InReportGroup:
+        return self._core.changed_in_report_groups
+
+    @property
+    def in_report_buffer_stats(self) -> InReportRingBufferStats | None:
+        return self._core.in_report_buffer_stats
+
     # ############################################# GETTERS READ PROPS ##############################################
 
     # ############ MAIN
@@ -61,6 +104,18 @@ class DualSenseController:
     def exceptions(self) -> ExceptionProperty:
         return self._properties.exceptions
 
+    @property
+    def reconnection(self) -> ReconnectionProperty:
+        return self._properties.reconnection
+
+    @property
+    def report_anomalies(self) -> ReportStatisticsProperty:
+        return self._properties.report_anomalies
+
+    @property
+    def report_timestamps(self) -> ReportTimestampsProperty:
+        return self._properties.report_timestamps
+
     @property
     def battery(self) -> BatteryProperty:
         return self._properties.battery
@@ -229,6 +284,8 @@ class DualSenseController:
             self,
             # CORE
             device_index_or_device_info: int | DeviceInfo = 0,
+            transport: HidTransport = HidTransport.HIDAPI,
+            reactor: HidReactor | None = None,
             left_joystick_deadzone: Number = 0.05,
             right_joystick_deadzone: Number = 0.05,
             left_trigger_deadzone: Number = 0,
@@ -241,12 +298,25 @@ class DualSenseController:
             # OPTS
             microphone_initially_muted: bool = True,
             microphone_invert_led: bool = False,
+            independent_writer: bool = False,
+            max_write_rate: float | None = None,
+            skip_queued_in_reports: bool = False,
+            in_report_buffer_size: int = 0,
+            in_report_overflow_policy: InReportOverflowPolicy = InReportOverflowPolicy.DROP_OLDEST,
+            auto_reconnect: bool = False,
+            hotplug_watcher: HotplugWatcher | None = None,
+            lock_free_states: bool = False,
     ):
 
         warnings.filterwarnings("always", category=UserWarning)
 
         self._core: DualSenseControllerCore = DualSenseControllerCore(
             device_index_or_device_info=device_index_or_device_info,
+            transport=transport,
+            reactor=reactor,
+            skip_queued_in_reports=skip_queued_in_reports,
+            in_report_buffer_size=in_report_buffer_size,
+            in_report_overflow_policy=in_report_overflow_policy,
             left_joystick_deadzone=left_joystick_deadzone,
             right_joystick_deadzone=right_joystick_deadzone,
             left_trigger_deadzone=left_trigger_deadzone,
@@ -257,6 +327,11 @@ class DualSenseController:
             state_value_mapping=mapping,
             enforce_update=update_level.value.enforce_update,
             can_update_itself=update_level.value.can_update_itself,
+            lock_free_states=lock_free_states,
+            independent_writer=independent_writer,
+            max_write_rate=max_write_rate,
+            auto_reconnect=auto_reconnect,
+            hotplug_watcher=hotplug_watcher,
         )
 
         self._properties: Properties = Properties(
@@ -264,6 +339,9 @@ class DualSenseController:
             self._core.connection_state,
             self._core.update_benchmark_state,
             self._core.exception_state,
+            self._core.reconnection_state,
+            self._core.report_anomaly_state,
+            self._core.report_timestamps_state,
             self._core.read_states,
             self._core.write_states,
             # OPTS
@@ -275,17 +353,65 @@ class DualSenseController:
     def on_error(self, callback: PropertyChangeCallback):
         self._properties.exceptions.on_change(callback)
 
-    def wait_until_updated(self) -> None:
-        return self._core.wait_until_updated()
+    # raw values of a numeric state (e.g. LEFT_STICK_X), recorded once per report from now on
+    def enable_state_history(self, state_name: ReadStateName, capacity: int = 1000) -> StateHistory:
+        return self._core.enable_state_history(state_name, capacity)
+
+    def disable_state_history(self, state_name: ReadStateName) -> None:
+        self._core.disable_state_history(state_name)
+
+    # state calculated by derive_fn from the (mapped) values of the inputs (e.g. ReadStateName.LEFT_STICK),
+    # only for reports which changed one of them. Derived states can be inputs of derived states added later
+    def add_derived_state(self, name: str, inputs: list[StateName], derive_fn: DeriveFn) -> DerivedProperty:
+        return DerivedProperty(self._core.add_derived_state(name, inputs, derive_fn))
+
+    def remove_derived_state(self, name: str) -> None:
+        self._core.remove_derived_state(name)
+
+    # called once per report with (state name, old value, new value) of all states changed by it
+    def on_frame_changes(self, callback: FrameChangesCallback) -> None:
+        self._core.on_frame_changes(callback)
 
-    def activate(self) -> None:
-        self._core.init()
+    def once_frame_changes(self, callback: FrameChangesCallback) -> None:
+        self._core.once_frame_changes(callback)
+
+    def remove_frame_changes_listener(self, callback: FrameChangesCallback | None = None) -> None:
+        self._core.remove_frame_changes_listener(callback)
+
+    def wait_until_updated(self, timeout: float | None = None) -> bool:
+        return self._core.wait_until_updated(timeout)
+
+    # from now on all input values are captured once per report, see snapshot. this calculates the values of all
+    # changed parts of each report, also of states nobody listens to
+    def enable_snapshots(self) -> None:
+        self._core.enable_snapshots()
+
+    # all input values of the latest processed report, None before the first one after enable_snapshots.
+    # created by the reader thread, safe to read from any thread
+    def snapshot(self) -> ControllerSnapshot | None:
+        return self._core.snapshot()
+
+    def wait_for_next_report(self, timeout: float | None = None) -> bool:
+        return self._core.wait_for_next_report(timeout) is not None
+
+    def wait_for_state(
+            self,
+            state_name: ReadStateName,
+            predicate: Callable[[Any], bool],
+            timeout: float | None = None,
+    ) -> bool:
+        return self._core.wait_for_state(state_name, predicate, timeout)
+
+    def activate(self, timeout: float | None = None) -> None:
+        self._core.init(timeout)
         if self._microphone_initially_muted:
             self._properties.microphone.set_muted()
         else:
             self._properties.microphone.set_unmuted()
         self._properties.microphone.refresh_workaround()
-        self.wait_until_updated()
+        if not self.wait_until_updated(timeout):
+            self._core.deinit()
+            raise DeviceTimeoutException(timeout)
 
     def deactivate(self) -> None:
         self._core.deinit()
@@ -12,15 +12,19 @@ from dualsense_controller.api.property.LightbarProperty import LightbarProperty
 from dualsense_controller.api.property.MicrophoneProperty import MicrophoneProperty
 from dualsense_controller.api.property.OrientationProperty import OrientationProperty
 from dualsense_controller.api.property.PlayerLedsProperty import PlayerLedsProperty
+from dualsense_controller.api.property.ReconnectionProperty import ReconnectionProperty
+from dualsense_controller.api.property.ReportStatisticsProperty import ReportStatisticsProperty
+from dualsense_controller.api.property.ReportTimestampsProperty import ReportTimestampsProperty
 from dualsense_controller.api.property.RumbleProperty import RumbleProperty
 from dualsense_controller.api.property.TouchFingerProperty import TouchFingerProperty
 from dualsense_controller.api.property.TriggerEffectProperty import TriggerEffectProperty
 from dualsense_controller.api.property.TriggerFeedbackProperty import TriggerFeedbackProperty
 from dualsense_controller.api.property.TriggerProperty import TriggerProperty
 from dualsense_controller.core.Benchmarker import Benchmark
+from dualsense_controller.core.ReportTracker import ReportStatistics
 from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.read_state.ReadStates import ReadStates
-from dualsense_controller.core.state.read_state.value_type import Connection
+from dualsense_controller.core.state.read_state.value_type import Connection, Reconnection, ReportTimestamps
 from dualsense_controller.core.state.write_state.WriteStates import WriteStates
 
 
@@ -31,6 +35,9 @@ class Properties:
             connection_state: State[Connection],
             update_benchmark_state: State[Benchmark],
             exception_state: State[Exception],
+            reconnection_state: State[Reconnection],
+            report_anomaly_state: State[ReportStatistics],
+            report_timestamps_state: State[ReportTimestamps],
             read_states: ReadStates,
             write_states: WriteStates,
             # OPTS
@@ -40,6 +47,9 @@ class Properties:
         self.exceptions: Final[ExceptionProperty] = ExceptionProperty(exception_state)
         self.benchmark: Final[BenchmarkProperty] = BenchmarkProperty(update_benchmark_state)
         self.connection: Final[ConnectionProperty] = ConnectionProperty(connection_state)
+        self.reconnection: Final[ReconnectionProperty] = ReconnectionProperty(reconnection_state)
+        self.report_anomalies: Final[ReportStatisticsProperty] = ReportStatisticsProperty(report_anomaly_state)
+        self.report_timestamps: Final[ReportTimestampsProperty] = ReportTimestampsProperty(report_timestamps_state)
         self.battery: Final[BatteryProperty] = BatteryProperty(read_states.battery)
 
         # BTN MISC
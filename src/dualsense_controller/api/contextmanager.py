@@ -3,14 +3,19 @@ from typing import Generator
 
 from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
 from dualsense_controller.api.enum import UpdateLevel
-from dualsense_controller.core.hidapi import DeviceInfo
+from dualsense_controller.core.HidReactor import HidReactor
+from dualsense_controller.core.enum import HidTransport, InReportOverflowPolicy
+from dualsense_controller.core.hotplug.HotplugWatcher import HotplugWatcher
 from dualsense_controller.core.state.typedef import Number
+from dualsense_controller.core.typedef import DeviceInfo
 
 
 @contextmanager
 def active_dualsense_controller(
         # CORE
         device_index_or_device_info: int | DeviceInfo = 0,
+        transport: HidTransport = HidTransport.HIDAPI,
+        reactor: HidReactor | None = None,
         left_joystick_deadzone: Number = 0.05,
         right_joystick_deadzone: Number = 0.05,
         left_trigger_deadzone: Number = 0,
@@ -23,9 +28,20 @@ def active_dualsense_controller(
         # OPTS
         microphone_initially_muted: bool = True,
         microphone_invert_led: bool = False,
+        independent_writer: bool = False,
+        max_write_rate: float | None = None,
+        skip_queued_in_reports: bool = False,
+        in_report_buffer_size: int = 0,
+        in_report_overflow_policy: InReportOverflowPolicy = InReportOverflowPolicy.DROP_OLDEST,
+        auto_reconnect: bool = False,
+        hotplug_watcher: HotplugWatcher | None = None,
+        lock_free_states: bool = False,
+        activate_timeout: float | None = None,
 ) -> Generator[DualSenseController, None, None]:
     controller: DualSenseController = DualSenseController(
         device_index_or_device_info,
+        transport=transport,
+        reactor=reactor,
         left_joystick_deadzone=left_joystick_deadzone,
         right_joystick_deadzone=right_joystick_deadzone,
         left_trigger_deadzone=left_trigger_deadzone,
@@ -37,8 +53,16 @@ def active_dualsense_controller(
         update_level=update_level,
         microphone_initially_muted=microphone_initially_muted,
         microphone_invert_led=microphone_invert_led,
+        independent_writer=independent_writer,
+        max_write_rate=max_write_rate,
+        skip_queued_in_reports=skip_queued_in_reports,
+        in_report_buffer_size=in_report_buffer_size,
+        in_report_overflow_policy=in_report_overflow_policy,
+        auto_reconnect=auto_reconnect,
+        hotplug_watcher=hotplug_watcher,
+        lock_free_states=lock_free_states,
     )
-    controller.activate()
+    controller.activate(activate_timeout)
     try:
         yield controller
     finally:
@@ -3,4 +3,4 @@ from dualsense_controller.core.state.read_state.value_type import Accelerometer
 
 
 class AccelerometerProperty(Property[Accelerometer]):
-    pass
+    __slots__ = ()
@@ -6,6 +6,7 @@ from dualsense_controller.core.state.read_state.value_type import Battery
 
 
 class BatteryProperty(Property[Battery]):
+    __slots__ = ()
 
     @property
     def value(self) -> Battery:
@@ -3,6 +3,7 @@ from dualsense_controller.core.Benchmarker import Benchmark
 
 
 class BenchmarkProperty(Property[Benchmark]):
+    __slots__ = ()
 
     @property
     def value(self) -> Benchmark:
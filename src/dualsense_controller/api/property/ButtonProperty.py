@@ -3,6 +3,7 @@ from dualsense_controller.api.typedef import PropertyChangeCallback
 
 
 class ButtonProperty(BoolProperty):
+    __slots__ = ()
 
     def on_down(self, callback: PropertyChangeCallback):
         self._on_true(callback)
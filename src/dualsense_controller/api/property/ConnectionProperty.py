@@ -6,6 +6,7 @@ from dualsense_controller.core.state.read_state.value_type import Connection
 
 
 class ConnectionProperty(Property[Connection]):
+    __slots__ = ()
 
     @property
     def value(self) -> Connection:
@@ -0,0 +1,20 @@
+from typing import Any
+
+from dualsense_controller.api.property.base import Property
+from dualsense_controller.core.state.typedef import StateName
+
+
+class DerivedProperty(Property[Any]):
+    __slots__ = ()
+
+    @property
+    def name(self) -> StateName:
+        return self._state.name
+
+    @property
+    def value(self) -> Any:
+        return self._get_value()
+
+    @property
+    def last_value(self) -> Any:
+        return self._get_last_value()
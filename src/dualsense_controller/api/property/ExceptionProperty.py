@@ -2,6 +2,7 @@ from dualsense_controller.api.property.base import Property
 
 
 class ExceptionProperty(Property[Exception]):
+    __slots__ = ()
 
     @property
     def value(self) -> Exception:
@@ -3,4 +3,4 @@ from dualsense_controller.core.state.read_state.value_type import Gyroscope
 
 
 class GyroscopeProperty(Property[Gyroscope]):
-    pass
+    __slots__ = ()
@@ -3,6 +3,7 @@ from dualsense_controller.core.state.read_state.value_type import JoyStick
 
 
 class JoyStickProperty(Property[JoyStick]):
+    __slots__ = ()
 
     @property
     def value(self) -> JoyStick:
@@ -6,6 +6,7 @@ from dualsense_controller.core.state.write_state.value_type import Lightbar
 
 
 class LightbarProperty(Property[Lightbar]):
+    __slots__ = ()
 
     @property
     def color(self) -> tuple[int, int, int]:
@@ -7,6 +7,7 @@ from dualsense_controller.core.state.write_state.value_type import Microphone
 
 
 class MicrophoneProperty(Property[Microphone]):
+    __slots__ = ['_invert_led']
 
     def __init__(
             self,
@@ -3,4 +3,4 @@ from dualsense_controller.core.state.read_state.value_type import Orientation
 
 
 class OrientationProperty(Property[Orientation]):
-    pass
+    __slots__ = ()
@@ -5,6 +5,7 @@ from dualsense_controller.core.state.write_state.value_type import PlayerLeds
 
 
 class PlayerLedsProperty(Property[PlayerLeds]):
+    __slots__ = ()
 
     def set_off(self) -> None:
         self._set_enable(PlayerLedsEnable.OFF)
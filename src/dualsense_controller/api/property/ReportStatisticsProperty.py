@@ -0,0 +1,10 @@
+from dualsense_controller.api.property.base import Property
+from dualsense_controller.core.ReportTracker import ReportStatistics
+
+
+class ReportStatisticsProperty(Property[ReportStatistics]):
+    __slots__ = ()
+
+    @property
+    def value(self) -> ReportStatistics:
+        return self._get_value()
@@ -0,0 +1,10 @@
+from dualsense_controller.api.property.base import Property
+from dualsense_controller.core.state.read_state.value_type import ReportTimestamps
+
+
+class ReportTimestampsProperty(Property[ReportTimestamps]):
+    __slots__ = ()
+
+    @property
+    def value(self) -> ReportTimestamps:
+        return self._get_value()
@@ -2,4 +2,4 @@ from dualsense_controller.api.property.base import GetSetNumberProperty
 
 
 class RumbleProperty(GetSetNumberProperty):
-    pass
+    __slots__ = ()
@@ -3,4 +3,4 @@ from dualsense_controller.core.state.read_state.value_type import TouchFinger
 
 
 class TouchFingerProperty(Property[TouchFinger]):
-    pass
+    __slots__ = ()
@@ -8,6 +8,7 @@ from dualsense_controller.core.state.write_state.value_type import TriggerEffect
 
 
 class TriggerEffectProperty(Property[TriggerEffect]):
+    __slots__ = ()
 
     # ############################## CUSTOM/BASE ################################
 
@@ -3,4 +3,4 @@ from dualsense_controller.core.state.read_state.value_type import TriggerFeedbac
 
 
 class TriggerFeedbackProperty(Property[TriggerFeedback]):
-    pass
+    __slots__ = ()
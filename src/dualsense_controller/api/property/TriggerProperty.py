@@ -8,6 +8,8 @@ from dualsense_controller.core.state.typedef import Number
 
 
 class TriggerProperty(GetNumberProperty):
+    __slots__ = ['_trigger_feedback_property', '_trigger_effect_property']
+
     def __init__(
             self,
             trigger_value_state: State[Number],
@@ -8,6 +8,7 @@ from dualsense_controller.core.state.typedef import Number
 
 
 class Property(Generic[PropertyType], ABC):
+    __slots__ = ['_state']
 
     def __init__(self, state: State[PropertyType]):
         self._state: Final[State[PropertyType]] = state
@@ -33,6 +34,7 @@ class Property(Generic[PropertyType], ABC):
 
 
 class GetNumberProperty(Property[Number], ABC):
+    __slots__ = ()
 
     @property
     def value(self) -> Number:
@@ -40,6 +42,7 @@ class GetNumberProperty(Property[Number], ABC):
 
 
 class GetSetNumberProperty(Property[Number], ABC):
+    __slots__ = ()
 
     @property
     def value(self) -> Number:
@@ -50,6 +53,7 @@ class GetSetNumberProperty(Property[Number], ABC):
 
 
 class BoolProperty(Property[bool], ABC):
+    __slots__ = ()
 
     def _on_true(self, callback: PropertyChangeCallback):
         self.on_change(partial(self._on_changed, callback, True))
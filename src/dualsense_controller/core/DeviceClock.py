@@ -0,0 +1,80 @@
+from typing import Final
+
+_SENSOR_TIMESTAMP_RANGE: Final[int] = 0x100000000
+# the fit follows the clocks with a half-life of this many reports (a few seconds)
+_HALF_LIFE: Final[int] = 1000
+
+
+class DeviceClock:
+    """
+    Unwraps the 32 bit sensor timestamps of the controller (1/3 microseconds) to nanoseconds since the first report
+    and fits the host clock against them: host ~ device * (1 + drift) + offset.
+    The fit is an exponentially weighted linear regression, updated incrementally with every report.
+    """
+
+    @property
+    def device_timestamp(self) -> int:
+        return self._device_ticks * 1000 // 3
+
+    @property
+    def offset(self) -> int:
+        # nanoseconds to add to the current device timestamp to get the fitted host timestamp
+        device_timestamp: int = self.device_timestamp
+        return self.to_host(device_timestamp) - device_timestamp
+
+    @property
+    def drift(self) -> float:
+        # parts per million the device clock runs slower than the host clock
+        return (self._slope - 1) * 1e+6
+
+    def __init__(self):
+        self._decay: Final[float] = 0.5 ** (1 / _HALF_LIFE)
+        self._last_sensor_timestamp: int | None = None
+        self._device_ticks: int = 0
+        self._host_origin: int = 0
+        self._weight: float = 0
+        self._mean_device: float = 0
+        self._mean_host: float = 0
+        self._variance_device: float = 0
+        self._covariance: float = 0
+        self._slope: float = 1
+
+    def reset(self) -> None:
+        self._last_sensor_timestamp = None
+        self._device_ticks = 0
+        self._weight = 0
+        self._mean_device = 0
+        self._mean_host = 0
+        self._variance_device = 0
+        self._covariance = 0
+        self._slope = 1
+
+    # returns the unwrapped device timestamp in nanoseconds
+    def update(self, sensor_timestamp: int, host_timestamp: int) -> int:
+        if self._last_sensor_timestamp is None:
+            self._host_origin = host_timestamp
+        else:
+            # signed, so duplicated or reordered reports do not jump a whole wrap ahead
+            half_range: int = _SENSOR_TIMESTAMP_RANGE // 2
+            self._device_ticks += (
+                    (sensor_timestamp - self._last_sensor_timestamp + half_range) % _SENSOR_TIMESTAMP_RANGE - half_range
+            )
+        self._last_sensor_timestamp = sensor_timestamp
+        device_timestamp: int = self.device_timestamp
+
+        # relative to the first report, so the floats keep their precision
+        self._weight = self._weight * self._decay + 1
+        alpha: float = 1 / self._weight
+        diff_device: float = device_timestamp - self._mean_device
+        diff_host: float = (host_timestamp - self._host_origin) - self._mean_host
+        self._mean_device += alpha * diff_device
+        self._mean_host += alpha * diff_host
+        self._variance_device = (1 - alpha) * (self._variance_device + alpha * diff_device * diff_device)
+        self._covariance = (1 - alpha) * (self._covariance + alpha * diff_device * diff_host)
+        # the slope is kept until the device clock has advanced at all
+        if self._variance_device > 0:
+            self._slope = self._covariance / self._variance_device
+        return device_timestamp
+
+    def to_host(self, device_timestamp: int) -> int:
+        return self._host_origin + round(self._mean_host + self._slope * (device_timestamp - self._mean_device))
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Final
+
+from dualsense_controller.core import hidraw
+from dualsense_controller.core.enum import HidTransport
+from dualsense_controller.core.typedef import DeviceInfo
+
+AnyDeviceInfo = DeviceInfo | hidraw.DeviceInfo
+EnumerateFn = Callable[[HidTransport], list[AnyDeviceInfo]]
+
+
+@dataclass(slots=True)
+class _Entry:
+    signature: tuple[str, ...] | None
+    device_infos: list[AnyDeviceInfo]
+    by_path: dict[bytes, AnyDeviceInfo]
+    by_serial_number: dict[str, AnyDeviceInfo]
+
+
+class DeviceInfoCache:
+    """
+    Keeps the enumerated device infos per transport, so opening many controllers enumerates only once.
+    On Linux the cache is refreshed automatically when hidraw nodes come or go,
+    elsewhere it has to be invalidated (or refreshed) explicitly.
+    """
+
+    @property
+    def num_enumerations(self) -> int:
+        return self._num_enumerations
+
+    def __init__(self, enumerate_fn: EnumerateFn):
+        self._enumerate_fn: Final[EnumerateFn] = enumerate_fn
+        self._lock: Final[Lock] = Lock()
+        self._entries: Final[dict[HidTransport, _Entry]] = {}
+        self._num_enumerations: int = 0
+
+    def get_all(self, transport: HidTransport, refresh: bool = False) -> list[AnyDeviceInfo]:
+        return list(self._get_entry(transport, refresh).device_infos)
+
+    def find_by_path(self, path: bytes, transport: HidTransport) -> AnyDeviceInfo | None:
+        device_info: AnyDeviceInfo | None = self._get_entry(transport).by_path.get(path)
+        if device_info is None:
+            device_info = self._get_entry(transport, refresh=True).by_path.get(path)
+        return device_info
+
+    def find_by_serial_number(self, serial_number: str, transport: HidTransport) -> AnyDeviceInfo | None:
+        device_info: AnyDeviceInfo | None = self._get_entry(transport).by_serial_number.get(serial_number)
+        if device_info is None:
+            device_info = self._get_entry(transport, refresh=True).by_serial_number.get(serial_number)
+        return device_info
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _get_entry(self, transport: HidTransport, refresh: bool = False) -> _Entry:
+        with self._lock:
+            signature: tuple[str, ...] | None = self._create_signature()
+            entry: _Entry | None = self._entries.get(transport)
+            if entry is None or refresh or entry.signature != signature:
+                device_infos: list[AnyDeviceInfo] = self._enumerate_fn(transport)
+                self._num_enumerations += 1
+                entry = _Entry(
+                    signature=signature,
+                    device_infos=device_infos,
+                    by_path={device_info.path: device_info for device_info in device_infos},
+                    by_serial_number={
+                        device_info.serial_number: device_info
+                        for device_info in device_infos
+                        if device_info.serial_number
+                    },
+                )
+                self._entries[transport] = entry
+            return entry
+
+    @staticmethod
+    def _create_signature() -> tuple[str, ...] | None:
+        # listing the hidraw nodes is cheap compared to a full enumeration
+        if not hidraw.is_available():
+            return None
+        return tuple(hidraw.list_node_names())
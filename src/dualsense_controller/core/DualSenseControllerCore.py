@@ -1,30 +1,57 @@
-from typing import Final
+import threading
+import time
+from threading import Condition, Lock
+from typing import Any, Callable, Final
 
 from dualsense_controller.core.Benchmarker import Benchmark, Benchmarker
+from dualsense_controller.core.DeviceClock import DeviceClock
 from dualsense_controller.core.HidControllerDevice import HidControllerDevice
-from dualsense_controller.core.enum import ConnectionType, EventType
-from dualsense_controller.core.hidapi.hidapi import DeviceInfo
+from dualsense_controller.core.HidReactor import HidReactor
+from dualsense_controller.core.InReportRingBuffer import InReportRingBufferStats
+from dualsense_controller.core.OutReportWriter import OutReportWriter
+from dualsense_controller.core.ReportTracker import ReportStatistics, ReportTracker
+from dualsense_controller.core.enum import ConnectionType, EventType, HidTransport, InReportOverflowPolicy
+from dualsense_controller.core.exception import DeviceLostException
+from dualsense_controller.core.hotplug.HotplugWatcher import HotplugWatcher
 from dualsense_controller.core.log import Log
 from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportFrame import InReportFrame
+from dualsense_controller.core.report.in_report.enum import InReportGroup
 from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
 from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadState import ReadState
 from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from dualsense_controller.core.state.read_state.StateHistory import StateHistory
 from dualsense_controller.core.state.read_state.enum import ReadStateName
-from dualsense_controller.core.state.read_state.value_type import Connection
-from dualsense_controller.core.state.typedef import Number, StateChangeCallback
+from dualsense_controller.core.state.read_state.value_type import Connection, ControllerSnapshot, Reconnection, \
+    ReportTimestamps
+from dualsense_controller.core.state.typedef import DeriveFn, FrameChangesCallback, Number, StateChangeCallback, \
+    StateName
 from dualsense_controller.core.state.write_state.WriteStates import WriteStates
 from dualsense_controller.core.state.write_state.enum import WriteStateName
-from dualsense_controller.core.typedef import EmptyCallback
-from dualsense_controller.core.util import format_exception
+from dualsense_controller.core.typedef import DeviceInfo, EmptyCallback
+from dualsense_controller.core.util import call_all_parallel, format_exception
+
+# a reappeared controller which does not send anything must not block the hotplug watcher
+_RECONNECT_TIMEOUT: Final[float] = 1.0
 
 
 class DualSenseControllerCore:
 
     # ######################################### STATIC  ##########################################v
     @staticmethod
-    def enumerate_devices() -> list[DeviceInfo]:
-        return HidControllerDevice.enumerate_devices()
+    def enumerate_devices(transport: HidTransport = HidTransport.HIDAPI, refresh: bool = False) -> list[DeviceInfo]:
+        return HidControllerDevice.enumerate_devices(transport, refresh)
+
+    @staticmethod
+    def invalidate_device_cache() -> None:
+        HidControllerDevice.invalidate_device_cache()
+
+    @staticmethod
+    def init_all(cores: list['DualSenseControllerCore'], timeout: float | None = None) -> None:
+        # all or nothing, cores already initialized are deinitialized again if one of them fails
+        call_all_parallel(cores, lambda core: core.init(timeout), lambda core: core.deinit())
 
     # ######################################### BASE  ##########################################v
     @property
@@ -43,6 +70,36 @@ class DualSenseControllerCore:
     def connection_type(self) -> ConnectionType:
         return self._hid_controller_device.connection_type
 
+    @property
+    def skipped_in_reports(self) -> int:
+        return self._hid_controller_device.num_skipped_in_reports
+
+    @property
+    def report_statistics(self) -> ReportStatistics:
+        return self._report_tracker.statistics
+
+    @property
+    def report_anomaly_state(self) -> State[ReportStatistics]:
+        return self._report_anomaly_state
+
+    @property
+    def report_timestamps(self) -> ReportTimestamps:
+        return self._report_timestamps
+
+    @property
+    def report_timestamps_state(self) -> State[ReportTimestamps]:
+        return self._report_timestamps_state
+
+    @property
+    def changed_in_report_groups(self) -> InReportGroup:
+        if self._last_in_report is None:
+            return InReportGroup(0)
+        return self._last_in_report.changed_groups
+
+    @property
+    def in_report_buffer_stats(self) -> InReportRingBufferStats | None:
+        return self._hid_controller_device.in_report_buffer_stats
+
     # ######################################### SPECIAL STATES  ##########################################v
 
     @property
@@ -57,11 +114,20 @@ class DualSenseControllerCore:
     def exception_state(self) -> State[Exception]:
         return self._exception_state
 
+    @property
+    def reconnection_state(self) -> State[Reconnection]:
+        return self._reconnection_state
+
     # ######################################### MAIN  ##########################################v
     def __init__(
             self,
             # ##### BASE  #####
             device_index_or_device_info: int | DeviceInfo = 0,
+            transport: HidTransport = HidTransport.HIDAPI,
+            reactor: HidReactor | None = None,
+            skip_queued_in_reports: bool = False,
+            in_report_buffer_size: int = 0,
+            in_report_overflow_policy: InReportOverflowPolicy = InReportOverflowPolicy.DROP_OLDEST,
             # ##### FEELING  #####
             left_joystick_deadzone: Number = 0,
             right_joystick_deadzone: Number = 0,
@@ -74,10 +140,22 @@ class DualSenseControllerCore:
             # ##### CORE #####
             enforce_update: bool = False,
             can_update_itself: bool = True,
+            lock_free_states: bool = False,
+            independent_writer: bool = False,
+            max_write_rate: float | None = None,
+            auto_reconnect: bool = False,
+            hotplug_watcher: HotplugWatcher | None = None,
     ):
 
         # HARDWARE
-        self._hid_controller_device: HidControllerDevice = HidControllerDevice(device_index_or_device_info)
+        self._hid_controller_device: HidControllerDevice = HidControllerDevice(
+            device_index_or_device_info,
+            transport=transport,
+            reactor=reactor,
+            skip_queued_in_reports=skip_queued_in_reports,
+            in_report_buffer_size=in_report_buffer_size,
+            in_report_overflow_policy=in_report_overflow_policy,
+        )
 
         # SPECIAL STATES
         self._connection_state: Final[State[Connection]] = State(
@@ -92,8 +170,26 @@ class DualSenseControllerCore:
             name=EventType.EXCEPTION, ignore_none=False
         )
 
+        self._reconnection_state: Final[State[Reconnection]] = State(
+            name=EventType.RECONNECTION, ignore_none=False
+        )
+
+        self._report_anomaly_state: Final[State[ReportStatistics]] = State(
+            name=EventType.REPORT_ANOMALY, ignore_none=False
+        )
+
+        self._report_timestamps_state: Final[State[ReportTimestamps]] = State(
+            name=EventType.REPORT_TIMESTAMPS, ignore_none=False
+        )
+
         # MAIN
         self._update_benchmark: Final[Benchmarker] = Benchmarker()
+        self._report_tracker: Final[ReportTracker] = ReportTracker()
+        self._device_clock: Final[DeviceClock] = DeviceClock()
+        self._report_timestamps: ReportTimestamps = ReportTimestamps()
+        # snapshots are only created per report once enabled, always by the reader thread
+        self._snapshots_enabled: bool = False
+        self._snapshot: ControllerSnapshot | None = None
 
         state_value_mapper: StateValueMapper = StateValueMapper(
             mapping=state_value_mapping,
@@ -110,14 +206,42 @@ class DualSenseControllerCore:
             state_value_mapper=state_value_mapper,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
+            lock_free=lock_free_states,
         )
 
         self._write_states: Final[WriteStates] = WriteStates(
             state_value_mapper=state_value_mapper,
         )
 
+        self._out_report_writer: Final[OutReportWriter | None] = OutReportWriter(
+            write_states=self._write_states,
+            hid_controller_device=self._hid_controller_device,
+            max_write_rate=max_write_rate,
+        ) if independent_writer else None
+
+        # RECONNECT
+        self._owns_hotplug_watcher: Final[bool] = hotplug_watcher is None and auto_reconnect
+        self._hotplug_watcher: Final[HotplugWatcher | None] = (
+            HotplugWatcher.create_default(
+                lambda: [info.path for info in HidControllerDevice.enumerate_devices(transport, refresh=True)]
+            ) if self._owns_hotplug_watcher else hotplug_watcher
+        )
+        self._connection_lock: Final[Lock] = Lock()
+        self._connection_lost_timestamp: int | None = None
+        self._num_reconnect_attempts: int = 0
+        self._is_closing: bool = False
+
+        # WAITING
+        self._update_condition: Final[Condition] = Condition()
+        self._num_update_waiters: int = 0
+        self._num_in_reports: int = 0
+        self._num_updates: int = 0
+        self._last_in_report: InReport | None = None
+
         self._hid_controller_device.on_exception(self._on_thread_exception)
         self._hid_controller_device.on_in_report(self._on_in_report)
+        if self._out_report_writer is not None:
+            self._out_report_writer.on_exception(self._on_thread_exception)
 
     def on_updated(self, callback: EmptyCallback) -> None:
         self._read_states.on_updated(callback)
@@ -125,17 +249,74 @@ class DualSenseControllerCore:
     def once_updated(self, callback: EmptyCallback) -> None:
         self._read_states.once_updated(callback)
 
-    def wait_until_updated(self) -> None:
+    def enable_state_history(self, state_name: ReadStateName, capacity: int) -> StateHistory:
+        return self._read_states.enable_history(state_name, capacity)
+
+    def disable_state_history(self, state_name: ReadStateName) -> None:
+        self._read_states.disable_history(state_name)
+
+    def add_derived_state(self, name: str, inputs: list[StateName], derive_fn: DeriveFn) -> ReadState[Any]:
+        return self._read_states.add_derived_state(name, inputs, derive_fn)
+
+    def remove_derived_state(self, name: str) -> None:
+        self._read_states.remove_derived_state(name)
 
-        wait: bool = True
+    def on_frame_changes(self, callback: FrameChangesCallback) -> None:
+        self._read_states.on_frame_changes(callback)
 
-        def on_updated() -> None:
-            nonlocal wait
-            wait = False
+    def once_frame_changes(self, callback: FrameChangesCallback) -> None:
+        self._read_states.once_frame_changes(callback)
 
-        self._read_states.once_updated(on_updated)
-        while wait:
-            pass
+    def remove_frame_changes_listener(self, callback: FrameChangesCallback | None = None) -> None:
+        self._read_states.remove_frame_changes_listener(callback)
+
+    def wait_until_updated(self, timeout: float | None = None) -> bool:
+        with self._update_condition:
+            num_updates: int = self._num_updates
+            self._num_update_waiters += 1
+            try:
+                return self._update_condition.wait_for(lambda: self._num_updates > num_updates, timeout)
+            finally:
+                self._num_update_waiters -= 1
+
+    def enable_snapshots(self) -> None:
+        self._snapshots_enabled = True
+
+    def snapshot(self) -> ControllerSnapshot | None:
+        return self._snapshot
+
+    def wait_for_next_report(self, timeout: float | None = None) -> InReport | None:
+        with self._update_condition:
+            num_in_reports: int = self._num_in_reports
+            self._num_update_waiters += 1
+            try:
+                if not self._update_condition.wait_for(lambda: self._num_in_reports > num_in_reports, timeout):
+                    return None
+                return self._last_in_report
+            finally:
+                self._num_update_waiters -= 1
+
+    def wait_for_state(
+            self,
+            state_name: ReadStateName,
+            predicate: Callable[[Any], bool],
+            timeout: float | None = None,
+    ) -> bool:
+        state: State[Any] = self._read_states.get_state(state_name)
+        fulfilled_event: threading.Event = threading.Event()
+
+        def on_change(value: Any) -> None:
+            if predicate(value):
+                fulfilled_event.set()
+
+        # listening ensures the state gets updated, regardless of the update level
+        state.on_change(on_change)
+        try:
+            if predicate(state.value):
+                return True
+            return fulfilled_event.wait(timeout)
+        finally:
+            state.remove_change_listener(on_change)
 
     def on_connection_change(self, callback: StateChangeCallback):
         self._connection_state.on_change(callback)
@@ -158,21 +339,69 @@ class DualSenseControllerCore:
     def set_state(self, state_name: WriteStateName, value: Number):
         self._write_states.set_value(state_name, value)
 
-    def init(self) -> None:
+    def init(self, timeout: float | None = None) -> None:
         assert not self._hid_controller_device.is_opened, 'already opened'
-        self._hid_controller_device.open()
+        self._connection_lost_timestamp = None
+        self._is_closing = False
+        self._report_tracker.reset()
+        self._device_clock.reset()
+        self._snapshot = None
+        self._hid_controller_device.open(timeout)
+        if self._out_report_writer is not None:
+            self._out_report_writer.start()
         self._connection_state.value = Connection(True, self._hid_controller_device.connection_type)
 
     def deinit(self) -> None:
-        assert self._hid_controller_device.is_opened, 'not opened yet'
-        self._hid_controller_device.close()
-        self._connection_state.value = Connection(False, self._hid_controller_device.connection_type)
+        with self._connection_lock:
+            if self._hotplug_watcher is not None:
+                self._hotplug_watcher.unwatch(self)
+            is_lost: bool = self._connection_lost_timestamp is not None
+            assert is_lost or self._hid_controller_device.is_opened, 'not opened yet'
+            self._connection_lost_timestamp = None
+            # a connection lost while closing is not handled anymore
+            self._is_closing = True
+        if not is_lost:
+            if self._out_report_writer is not None:
+                self._out_report_writer.stop()
+            self._hid_controller_device.close()
+        if self._owns_hotplug_watcher:
+            self._hotplug_watcher.stop()
+        if not is_lost:
+            self._connection_state.value = Connection(False, self._hid_controller_device.connection_type)
 
     def _on_in_report(self, in_report: InReport) -> None:
 
+        self._last_in_report = in_report
+        self._num_in_reports += 1
+        self._notify_update_waiters()
+
+        timestamp: int = in_report.timestamp
+        if self._hid_controller_device.connection_type != ConnectionType.BT_01:
+            frame: InReportFrame = in_report.frame
+            device_timestamp: int = self._device_clock.update(frame.sensor_timestamp, timestamp)
+            self._report_timestamps = ReportTimestamps(
+                host_timestamp=timestamp,
+                device_timestamp=device_timestamp,
+                clock_offset=self._device_clock.offset,
+                clock_drift=self._device_clock.drift,
+            )
+            if self._report_tracker.update(frame.seq_num, device_timestamp, timestamp):
+                self._report_anomaly_state.value = self._report_tracker.statistics
+        else:
+            self._report_timestamps = ReportTimestamps(host_timestamp=timestamp)
+        # before the states, so their callbacks can look up the timestamps of the report
+        self._report_timestamps_state.value = self._report_timestamps
+
         self._read_states.update(in_report, self._hid_controller_device.connection_type)
+        if self._snapshots_enabled:
+            self._snapshot = self._read_states.create_snapshot(
+                self._hid_controller_device.connection_type, self._report_timestamps, self._snapshot
+            )
 
-        if self._write_states.has_changed:
+        self._num_updates += 1
+        self._notify_update_waiters()
+
+        if self._out_report_writer is None and self._write_states.has_changed:
             # print(f'Sending report.')
             self._write_states.update_out_report(self._hid_controller_device.out_report)
             self._write_states.set_unchanged()
@@ -181,6 +410,64 @@ class DualSenseControllerCore:
         if self._update_benchmark_state.has_listeners:
             self._update_benchmark_state.value = self._update_benchmark.update()
 
+    def _notify_update_waiters(self) -> None:
+        # waiters register before checking the counters, so the lock is only needed if someone waits
+        if self._num_update_waiters > 0:
+            with self._update_condition:
+                self._update_condition.notify_all()
+
     def _on_thread_exception(self, exception: Exception) -> None:
         self._exception_state.value = exception
         Log.error('An Exception in the loop thread occured:', format_exception(exception))
+        if self._hotplug_watcher is not None and isinstance(exception, DeviceLostException):
+            self._on_connection_lost()
+
+    def _on_connection_lost(self) -> None:
+        with self._connection_lock:
+            if (
+                    self._is_closing
+                    or self._connection_lost_timestamp is not None
+                    or not self._hid_controller_device.is_opened
+            ):
+                return
+            self._connection_lost_timestamp = time.perf_counter_ns()
+            self._num_reconnect_attempts = 0
+        # closing joins the threads, whose callbacks may deinit meanwhile, which needs the lock
+        if self._out_report_writer is not None:
+            self._out_report_writer.stop()
+        self._hid_controller_device.close()
+        with self._connection_lock:
+            if self._connection_lost_timestamp is None:
+                # deinitialized while closing
+                return
+            self._hotplug_watcher.watch(self, self._reconnect)
+        self._connection_state.value = Connection(False, self._hid_controller_device.connection_type)
+
+    def _reconnect(self) -> bool:
+        with self._connection_lock:
+            if self._connection_lost_timestamp is None:
+                # deinitialized in the meantime
+                return True
+            self._num_reconnect_attempts += 1
+            self._report_tracker.reset()
+            self._device_clock.reset()
+            try:
+                self._hid_controller_device.reopen(timeout=_RECONNECT_TIMEOUT)
+            except Exception as exception:
+                Log.verbose('Reconnect failed:', exception)
+                return False
+            # the controller has lost rumble, lightbar, trigger effects etc., so the current out report is sent again
+            self._write_states.update_out_report(self._hid_controller_device.out_report)
+            self._write_states.set_unchanged()
+            self._hid_controller_device.write()
+            if self._out_report_writer is not None:
+                self._out_report_writer.start()
+            reconnection: Reconnection = Reconnection(
+                serial_number=self._hid_controller_device.serial_number,
+                duration=(time.perf_counter_ns() - self._connection_lost_timestamp) / 1e+9,
+                attempts=self._num_reconnect_attempts,
+            )
+            self._connection_lost_timestamp = None
+        self._connection_state.value = Connection(True, self._hid_controller_device.connection_type)
+        self._reconnection_state.value = reconnection
+        return True
@@ -1,13 +1,21 @@
+import os
 import threading
+import time
 from threading import Thread
-from typing import Final
+from types import ModuleType
+from typing import Final, TYPE_CHECKING
 
 import pyee
 
+from dualsense_controller.core.DeviceInfoCache import DeviceInfoCache
+from dualsense_controller.core.HidReactor import HidReactor
+from dualsense_controller.core.InReportDoubleBuffer import InReportDoubleBuffer
+from dualsense_controller.core.InReportRingBuffer import InReportRingBuffer, InReportRingBufferStats
 from dualsense_controller.core.core.Lockable import Lockable
-from dualsense_controller.core.enum import ConnectionType, EventType
-from dualsense_controller.core.exception import InvalidDeviceIndexException, InvalidInReportLengthException
-from dualsense_controller.core.hidapi import Device, DeviceInfo, enumerate
+from dualsense_controller.core import hidraw
+from dualsense_controller.core.enum import ConnectionType, EventType, HidTransport, InReportOverflowPolicy
+from dualsense_controller.core.exception import DeviceLostException, DeviceTimeoutException, \
+    InvalidDeviceIndexException, InvalidInReportLengthException, NoDeviceDetectedException
 from dualsense_controller.core.log import Log
 from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
 from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
@@ -19,16 +27,52 @@ from dualsense_controller.core.report.out_report.Bt01OutReport import Bt01OutRep
 from dualsense_controller.core.report.out_report.Bt31OutReport import Bt31OutReport
 from dualsense_controller.core.report.out_report.OutReport import OutReport
 from dualsense_controller.core.report.out_report.Usb01OutReport import Usb01OutReport
-from dualsense_controller.core.typedef import ExceptionCallback
+from dualsense_controller.core.typedef import DeviceInfo, ExceptionCallback
+from dualsense_controller.core.util import call_all_parallel
+
+if TYPE_CHECKING:
+    from dualsense_controller.core.hidapi import Device
+
+
+_VENDOR_ID: Final[int] = 0x054c
+_PRODUCT_ID: Final[int] = 0x0ce6
+# the DualSense provides its HID reports on this interface when connected via USB
+_USB_INTERFACE_NUMBER: Final[int] = 3
+
+
+def _enumerate_devices(transport: HidTransport) -> list[DeviceInfo]:
+    if transport == HidTransport.HIDRAW and hidraw.is_available():
+        return hidraw.enumerate(vendor_id=_VENDOR_ID, product_id=_PRODUCT_ID)
+    return _import_hidapi().enumerate(vendor_id=_VENDOR_ID, product_id=_PRODUCT_ID)
+
+
+def _import_hidapi() -> ModuleType:
+    # on demand, as loading it fails without the native hidapi library, which the hidraw transport does not need
+    from dualsense_controller.core import hidapi
+    return hidapi
 
 
 class HidControllerDevice:
-    VENDOR_ID: Final[int] = 0x054c
-    PRODUCT_ID: Final[int] = 0x0ce6
+    VENDOR_ID: Final[int] = _VENDOR_ID
+    PRODUCT_ID: Final[int] = _PRODUCT_ID
+
+    _device_info_cache: Final[DeviceInfoCache] = DeviceInfoCache(_enumerate_devices)
+
+    @staticmethod
+    def enumerate_devices(
+            transport: HidTransport = HidTransport.HIDAPI,
+            refresh: bool = False,
+    ) -> list[DeviceInfo]:
+        return HidControllerDevice._device_info_cache.get_all(transport, refresh)
 
     @staticmethod
-    def enumerate_devices() -> list[DeviceInfo]:
-        return enumerate(vendor_id=HidControllerDevice.VENDOR_ID, product_id=HidControllerDevice.PRODUCT_ID)
+    def invalidate_device_cache() -> None:
+        HidControllerDevice._device_info_cache.invalidate()
+
+    @staticmethod
+    def open_all(devices: list['HidControllerDevice'], timeout: float | None = None) -> None:
+        # all or nothing, devices already opened are closed again if one of them fails
+        call_all_parallel(devices, lambda device: device.open(timeout), lambda device: device.close())
 
     @property
     def connection_type(self) -> ConnectionType:
@@ -42,44 +86,136 @@ class HidControllerDevice:
     def is_opened(self) -> bool:
         return self._hid_device is not None
 
-    def __init__(self, device_index_or_device_info: int | DeviceInfo = 0):
+    @property
+    def serial_number(self) -> str | None:
+        return self._serial_number
+
+    @property
+    def transport(self) -> HidTransport:
+        return self._transport
+
+    @property
+    def num_skipped_in_reports(self) -> int:
+        if self._in_report_ring_buffer is not None:
+            return self._in_report_ring_buffer.num_skipped
+        return self._num_skipped_in_reports
+
+    @property
+    def in_report_buffer_stats(self) -> InReportRingBufferStats | None:
+        if self._in_report_ring_buffer is None:
+            return None
+        return self._in_report_ring_buffer.stats
+
+    @property
+    def uses_reactor(self) -> bool:
+        return self._reactor_fd is not None
+
+    def __init__(
+            self,
+            device_index_or_device_info: int | DeviceInfo = 0,
+            transport: HidTransport = HidTransport.HIDAPI,
+            reactor: HidReactor | None = None,
+            skip_queued_in_reports: bool = False,
+            in_report_buffer_size: int = 0,
+            in_report_overflow_policy: InReportOverflowPolicy = InReportOverflowPolicy.DROP_OLDEST,
+    ):
+        if (
+                reactor is not None
+                and in_report_buffer_size > 0
+                and in_report_overflow_policy == InReportOverflowPolicy.BLOCK
+        ):
+            # a full buffer would block the reactor thread, shared with all other controllers
+            raise ValueError(f'{InReportOverflowPolicy.BLOCK} can not be used with a reactor')
+        if reactor is not None and transport != HidTransport.HIDRAW:
+            # the reactor waits on file descriptors, which only hidraw devices have
+            raise ValueError(f'A reactor needs {HidTransport.HIDRAW}, {transport} devices can not be polled')
+        self._requested_transport: Final[HidTransport] = transport
+        self._in_report_buffer_size: Final[int] = in_report_buffer_size
+        self._in_report_overflow_policy: Final[InReportOverflowPolicy] = in_report_overflow_policy
+        self._skip_queued_in_reports: Final[bool] = skip_queued_in_reports
+        self._num_skipped_in_reports: int = 0
+        self._reactor: Final[HidReactor | None] = reactor
+        self._reactor_fd: int | None = None
+        self._transport: HidTransport = transport
         self._connection_type: ConnectionType = ConnectionType.UNDEFINED
         self._event_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
         self._loop_thread: Thread | None = None
         self._stop_thread_event: threading.Event | None = None
         self._thread_started_event: threading.Event | None = None
+        self._process_thread: Thread | None = None
 
         device_info: DeviceInfo
         if device_index_or_device_info is None or isinstance(device_index_or_device_info, int):
             device_index: int = device_index_or_device_info if device_index_or_device_info is not None else 0
-            hid_device_infos: list[DeviceInfo] = HidControllerDevice.enumerate_devices()
-            num_hid_device_infos: int = len(hid_device_infos)
-            if num_hid_device_infos < device_index + 1:
+            hid_device_infos: list[DeviceInfo] = HidControllerDevice.enumerate_devices(transport)
+            if len(hid_device_infos) < device_index + 1:
+                # maybe plugged in after the last enumeration
+                hid_device_infos = HidControllerDevice.enumerate_devices(transport, refresh=True)
+            if len(hid_device_infos) < device_index + 1:
                 raise InvalidDeviceIndexException(device_index)
             device_info = hid_device_infos[device_index]
         else:
             device_info = device_index_or_device_info
 
         self._serial_number: Final[str] = device_info.serial_number
-        self._path: Final[bytes] = device_info.path
-        self._hid_device: Device | None = None
+        self._path: bytes = device_info.path
+        self._is_usb_device_info: bool = HidControllerDevice._is_usb_device_info(device_info)
+        self._hid_device: 'Device | hidraw.Device | None' = None
 
         self._in_report_length: InReportLength = InReportLength.DUMMY
-        self._in_report_lockable: Final[Lockable[InReport]] = Lockable()
+        self._in_report_double_buffer: InReportDoubleBuffer | None = None
+        self._in_report_ring_buffer: InReportRingBuffer | None = None
         self._out_report_lockable: Final[Lockable[OutReport]] = Lockable()
 
-    def open(self):
+    def open(self, timeout: float | None = None):
         assert self._hid_device is None, "Device already opened"
-        self._hid_device: Device = self._create()
-        self._detect()
-        self._start_loop_thread()
+        # counters and buffer statistics stay readable after closing, until opened again
+        self._num_skipped_in_reports = 0
+        self._in_report_ring_buffer = None
+        self._hid_device = self._create()
+        try:
+            self._detect(timeout)
+        except Exception:
+            self._hid_device.close()
+            self._hid_device = None
+            raise
+        if self._in_report_ring_buffer is not None:
+            self._start_process_thread()
+        if self._reactor is not None:
+            self._register_at_reactor()
+        else:
+            self._start_loop_thread()
 
     def close(self) -> None:
         assert self._hid_device is not None, "Device already opened"
-        self._stop_loop_thread()
+        if self._in_report_ring_buffer is not None:
+            # wakes up a reader blocked by a full ring buffer
+            self._in_report_ring_buffer.close()
+        if self._reactor_fd is not None:
+            self._unregister_from_reactor()
+        else:
+            self._stop_loop_thread()
+        if self._process_thread is not None:
+            self._stop_process_thread()
         self._hid_device.close()
         self._hid_device = None
 
+    def reopen(self, timeout: float | None = None) -> None:
+        # the device may have got another path, so it is looked up by its serial number
+        assert self._hid_device is None, "Device already opened"
+        if self._serial_number:
+            device_infos: list[DeviceInfo] = HidControllerDevice.enumerate_devices(
+                self._requested_transport, refresh=True
+            )
+            device_info: DeviceInfo | None = next(
+                (info for info in device_infos if info.serial_number == self._serial_number), None
+            )
+            if device_info is None:
+                raise NoDeviceDetectedException
+            self._path = device_info.path
+            self._is_usb_device_info = HidControllerDevice._is_usb_device_info(device_info)
+        self.open(timeout)
+
     def write(self) -> None:
         data = self._out_report_lockable.value.to_bytes()
         Log.verbose(data.hex(' '))
@@ -91,32 +227,103 @@ class HidControllerDevice:
     def on_in_report(self, callback: InReportCallback) -> None:
         self._event_emitter.on(EventType.IN_REPORT, callback)
 
-    def _create(self) -> Device:
-        return Device(
+    def _create(self) -> 'Device | hidraw.Device':
+        if self._requested_transport == HidTransport.HIDRAW:
+            try:
+                device: hidraw.Device = hidraw.Device(self._find_hidraw_path())
+                self._transport = HidTransport.HIDRAW
+                return device
+            except OSError as error:
+                if self._reactor is not None:
+                    # a hidapi device could not be read by the reactor
+                    raise
+                Log.warning('hidraw transport not usable, falling back to hidapi:', error)
+        self._transport = HidTransport.HIDAPI
+        return _import_hidapi().Device(
             vendor_id=HidControllerDevice.VENDOR_ID,
             product_id=HidControllerDevice.PRODUCT_ID,
             serial_number=self._serial_number,
             path=self._path,
         )
 
-    def _detect(self) -> None:
-        dummy_report_bytes: bytes = self._hid_device.read(InReportLength.DUMMY)
-        self._in_report_length: int = len(dummy_report_bytes)
+    def _find_hidraw_path(self) -> bytes:
+        if not hidraw.is_available():
+            raise OSError('hidraw is not available on this system')
+        path: bytes = os.fsencode(self._path)
+        if path.startswith(b'/dev/hidraw'):
+            return path
+        # device info came from a hidapi backend with other paths (e.g. libusb), so look it up by serial number
+        device_info: hidraw.DeviceInfo | None = HidControllerDevice._device_info_cache.find_by_serial_number(
+            self._serial_number, HidTransport.HIDRAW
+        )
+        if device_info is not None:
+            return device_info.path
+        raise OSError(f'No hidraw node found for device {self._serial_number}')
+
+    @staticmethod
+    def _is_usb_device_info(device_info: DeviceInfo) -> bool:
+        # hidraw knows the bus type, hidapi only reports an interface number for USB devices
+        bus_type: int | None = getattr(device_info, 'bus_type', None)
+        if isinstance(bus_type, int):
+            return bus_type == hidraw.BUS_USB
+        interface_number: int | None = getattr(device_info, 'interface_number', None)
+        return isinstance(interface_number, int) and interface_number == _USB_INTERFACE_NUMBER
+
+    def _detect(self, timeout: float | None = None) -> None:
+        if self._is_usb_device_info:
+            # known from the enumeration, no need to wait for a report
+            self._in_report_length = InReportLength.USB_01
+        else:
+            self._in_report_length = self._read_in_report_length(timeout)
+        in_report_type: type[InReport]
         match self._in_report_length:
             case InReportLength.USB_01:
                 self._connection_type = ConnectionType.USB_01
-                self._in_report_lockable.value = Usb01InReport()
+                in_report_type = Usb01InReport
                 self._out_report_lockable.value = Usb01OutReport()
             case InReportLength.BT_31:
                 self._connection_type = ConnectionType.BT_31
-                self._in_report_lockable.value = Bt31InReport()
+                in_report_type = Bt31InReport
                 self._out_report_lockable.value = Bt31OutReport()
             case InReportLength.BT_01:
                 self._connection_type = ConnectionType.BT_01
-                self._in_report_lockable.value = Bt01InReport()
+                in_report_type = Bt01InReport
                 self._out_report_lockable.value = Bt01OutReport()
             case _:
                 raise InvalidInReportLengthException
+        self._in_report_double_buffer = InReportDoubleBuffer(in_report_type, self._in_report_length)
+        if self._in_report_buffer_size > 0:
+            self._in_report_ring_buffer = InReportRingBuffer(
+                size=self._in_report_buffer_size,
+                slot_length=self._in_report_length,
+                overflow_policy=self._in_report_overflow_policy,
+            )
+
+    def _read_in_report_length(self, timeout: float | None = None) -> int:
+        # via Bluetooth the report length depends on the mode the controller is in, so one has to be read
+        if timeout is None:
+            dummy_report_bytes: bytes | None = self._hid_device.read(InReportLength.DUMMY)
+        else:
+            dummy_report_bytes = self._hid_device.read(InReportLength.DUMMY, timeout_ms=max(1, int(timeout * 1000)))
+        if not dummy_report_bytes:
+            raise DeviceTimeoutException(timeout)
+        return len(dummy_report_bytes)
+
+    def _register_at_reactor(self) -> None:
+        self._reactor_fd = self._hid_device.fileno()
+        self._reactor.register(self._reactor_fd, self._on_readable)
+
+    def _unregister_from_reactor(self) -> None:
+        self._reactor.unregister(self._reactor_fd)
+        self._reactor_fd = None
+
+    def _on_readable(self) -> None:
+        # called from the reactor thread, data is pending so the read does not block
+        try:
+            self._read_in_report(timeout_ms=0)
+        except Exception as exception:
+            self._reactor.unregister(self._reactor_fd)
+            self._event_emitter.emit(EventType.EXCEPTION, exception)
 
     def _start_loop_thread(self) -> None:
         self._stop_thread_event = threading.Event()
@@ -126,12 +333,13 @@ class HidControllerDevice:
             daemon=True,
         )
         self._loop_thread.start()
-        while not self._thread_started_event.is_set():
-            pass
+        self._thread_started_event.wait()
 
     def _stop_loop_thread(self) -> None:
         self._stop_thread_event.set()
-        self._loop_thread.join()
+        # closing from within the loop thread (i.e. on exception) just lets the loop end
+        if self._loop_thread is not threading.current_thread():
+            self._loop_thread.join()
         self._loop_thread = None
         self._stop_thread_event = None
         self._thread_started_event = None
@@ -141,8 +349,72 @@ class HidControllerDevice:
             self._thread_started_event.set()
         try:
             while not self._stop_thread_event.is_set():
-                raw_bytes: bytes = self._hid_device.read(self._in_report_length)
-                self._in_report_lockable.value.update(raw_bytes)
-                self._event_emitter.emit(EventType.IN_REPORT, self._in_report_lockable.value)
+                self._read_in_report()
         except Exception as exception:
             self._event_emitter.emit(EventType.EXCEPTION, exception)
+
+    def _start_process_thread(self) -> None:
+        self._process_thread = Thread(
+            target=self._process_loop,
+            daemon=True,
+        )
+        self._process_thread.start()
+
+    def _stop_process_thread(self) -> None:
+        self._in_report_ring_buffer.close()
+        if self._process_thread is not threading.current_thread():
+            self._process_thread.join()
+        self._process_thread = None
+
+    def _process_loop(self) -> None:
+        try:
+            double_buffer: InReportDoubleBuffer = self._in_report_double_buffer
+            while True:
+                view: memoryview | None = self._in_report_ring_buffer.take(newest_only=self._skip_queued_in_reports)
+                if view is None:
+                    break
+                self._event_emitter.emit(
+                    EventType.IN_REPORT,
+                    double_buffer.publish(view, self._in_report_ring_buffer.taken_timestamp),
+                )
+        except Exception as exception:
+            self._in_report_ring_buffer.close()
+            self._event_emitter.emit(EventType.EXCEPTION, exception)
+
+    def _readinto(self, buffer: bytearray, timeout_ms: int | None = None) -> int:
+        try:
+            return self._hid_device.readinto(buffer, timeout_ms=timeout_ms)
+        except OSError as error:
+            raise DeviceLostException(error) from error
+
+    def _read_in_report(self, timeout_ms: int | None = None) -> bool:
+        if self._in_report_ring_buffer is not None:
+            return self._read_in_report_into_ring_buffer(timeout_ms)
+        double_buffer: InReportDoubleBuffer = self._in_report_double_buffer
+        num_bytes: int = self._readinto(double_buffer.back_buffer, timeout_ms=timeout_ms)
+        if num_bytes == 0:
+            return False
+        timestamp: int = time.perf_counter_ns()
+        if self._skip_queued_in_reports:
+            num_bytes, timestamp = self._read_queued_in_reports(num_bytes, timestamp)
+        self._event_emitter.emit(EventType.IN_REPORT, double_buffer.commit(num_bytes, timestamp))
+        return True
+
+    def _read_in_report_into_ring_buffer(self, timeout_ms: int | None = None) -> bool:
+        ring_buffer: InReportRingBuffer = self._in_report_ring_buffer
+        num_bytes: int = self._readinto(ring_buffer.write_buffer, timeout_ms=timeout_ms)
+        if num_bytes == 0:
+            return False
+        return ring_buffer.commit(num_bytes)
+
+    def _read_queued_in_reports(self, num_bytes: int, timestamp: int) -> tuple[int, int]:
+        # read everything already queued without blocking, only the newest report gets processed.
+        # the back buffer is not visible to anyone yet and a read without data leaves it untouched
+        back_buffer: bytearray = self._in_report_double_buffer.back_buffer
+        while True:
+            num_queued_bytes: int = self._readinto(back_buffer, timeout_ms=0)
+            if num_queued_bytes == 0:
+                return num_bytes, timestamp
+            timestamp = time.perf_counter_ns()
+            self._num_skipped_in_reports += 1
+            num_bytes = num_queued_bytes
@@ -0,0 +1,138 @@
+import os
+import selectors
+import threading
+from threading import Condition, RLock, Thread
+from typing import Callable, Final
+
+from dualsense_controller.core.log import Log
+from dualsense_controller.core.util import format_exception
+
+ReadableCallback = Callable[[], None]
+
+
+class HidReactor:
+    """
+    Multiplexes the file descriptors of many opened devices in one thread (epoll on Linux)
+    and calls the registered callback of every device which has data to read.
+    The thread is started with the first registration and stopped after the last one has been removed.
+    Callbacks run without holding the lock, so they neither block registrations nor each other's controllers
+    beyond their own run time. Unregistering from another thread waits until a running callback of that fd returned.
+    """
+
+    @property
+    def num_registered(self) -> int:
+        with self._lock:
+            return len(self._callbacks)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def __init__(self):
+        self._lock: Final[RLock] = RLock()
+        self._dispatched: Final[Condition] = Condition(self._lock)
+        self._callbacks: Final[dict[int, ReadableCallback]] = {}
+        # fd whose callback is running in the reactor thread
+        self._dispatching_fd: int | None = None
+        self._selector: selectors.BaseSelector | None = None
+        self._thread: Thread | None = None
+        self._stop_event: threading.Event | None = None
+        self._wakeup_read_fd: int | None = None
+        self._wakeup_write_fd: int | None = None
+
+    def register(self, fd: int, callback: ReadableCallback) -> None:
+        with self._lock:
+            assert fd not in self._callbacks, f'fd {fd} already registered'
+            if self._thread is None:
+                self._start()
+            self._callbacks[fd] = callback
+            self._selector.register(fd, selectors.EVENT_READ)
+            self._wakeup()
+
+    def unregister(self, fd: int) -> None:
+        thread_to_join: Thread | None = None
+        with self._lock:
+            if self._callbacks.pop(fd, None) is None:
+                return
+            self._selector.unregister(fd)
+            # the device closes its fd afterwards, a callback of the reactor thread itself returns to the loop
+            if self._thread is not threading.current_thread():
+                while self._dispatching_fd == fd:
+                    self._dispatched.wait()
+            if not self._callbacks:
+                thread_to_join = self._stop()
+        if thread_to_join is not None and thread_to_join is not threading.current_thread():
+            thread_to_join.join()
+
+    def _start(self) -> None:
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_read_fd, False)
+        os.set_blocking(self._wakeup_write_fd, False)
+        self._selector.register(self._wakeup_read_fd, selectors.EVENT_READ)
+        self._stop_event = threading.Event()
+        self._thread = Thread(
+            target=self._loop,
+            args=(self._selector, self._stop_event, self._wakeup_read_fd, self._wakeup_write_fd),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _stop(self) -> Thread:
+        thread: Thread = self._thread
+        self._stop_event.set()
+        self._wakeup()
+        self._thread = None
+        self._selector = None
+        self._stop_event = None
+        self._wakeup_read_fd = None
+        self._wakeup_write_fd = None
+        return thread
+
+    def _wakeup(self) -> None:
+        try:
+            os.write(self._wakeup_write_fd, b'\x00')
+        except BlockingIOError:
+            # pipe full, reactor will wake up anyway
+            pass
+
+    def _loop(
+            self,
+            selector: selectors.BaseSelector,
+            stop_event: threading.Event,
+            wakeup_read_fd: int,
+            wakeup_write_fd: int,
+    ) -> None:
+        try:
+            while not stop_event.is_set():
+                events: list[tuple[selectors.SelectorKey, int]] = selector.select()
+                for key, _ in events:
+                    if key.fd == wakeup_read_fd:
+                        self._drain_wakeup(wakeup_read_fd)
+                        continue
+                    with self._lock:
+                        # may have been unregistered meanwhile, also by a callback before
+                        callback: ReadableCallback | None = self._callbacks.get(key.fd)
+                        if callback is None:
+                            continue
+                        self._dispatching_fd = key.fd
+                    try:
+                        callback()
+                    finally:
+                        with self._lock:
+                            self._dispatching_fd = None
+                            self._dispatched.notify_all()
+        except Exception as exception:
+            Log.error('An Exception in the reactor thread occured:', format_exception(exception))
+        finally:
+            selector.close()
+            os.close(wakeup_read_fd)
+            os.close(wakeup_write_fd)
+
+    @staticmethod
+    def _drain_wakeup(wakeup_read_fd: int) -> None:
+        try:
+            while os.read(wakeup_read_fd, 64):
+                pass
+        except BlockingIOError:
+            pass
@@ -0,0 +1,44 @@
+from typing import Final
+
+from dualsense_controller.core.report.in_report.InReport import InReport
+
+
+class InReportDoubleBuffer:
+    """
+    Two preallocated reports, each over its own buffer.
+    The reader fills the back buffer while the states are calculated from the front report,
+    then both are swapped by one reference assignment, so consumers on other threads need no lock.
+    A front report stays valid until the report after the next one gets published.
+    """
+
+    @property
+    def front(self) -> InReport:
+        return self._front
+
+    @property
+    def back_buffer(self) -> bytearray:
+        return self._buffers[self._back_index]
+
+    def __init__(self, in_report_type: type[InReport], length: int):
+        self._length: Final[int] = length
+        self._buffers: Final[tuple[bytearray, bytearray]] = (bytearray(length), bytearray(length))
+        self._views: Final[tuple[memoryview, memoryview]] = (
+            memoryview(self._buffers[0]), memoryview(self._buffers[1])
+        )
+        self._in_reports: Final[tuple[InReport, InReport]] = (
+            in_report_type(raw_bytes=self._buffers[0]), in_report_type(raw_bytes=self._buffers[1])
+        )
+        self._back_index: int = 0
+        self._front: InReport = self._in_reports[1]
+
+    def commit(self, num_bytes: int, timestamp: int) -> InReport:
+        view: memoryview = self._views[self._back_index]
+        return self.publish(view if num_bytes == self._length else view[:num_bytes], timestamp)
+
+    # publishes a report read elsewhere (e.g. a ring buffer slot) through the back report
+    def publish(self, raw_bytes: memoryview, timestamp: int) -> InReport:
+        back: InReport = self._in_reports[self._back_index]
+        back.update(raw_bytes, previous=self._front, timestamp=timestamp)
+        self._front = back
+        self._back_index ^= 1
+        return back
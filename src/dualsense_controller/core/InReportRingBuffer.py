@@ -0,0 +1,145 @@
+from collections import deque
+from dataclasses import dataclass
+import time
+from threading import Condition
+from typing import Final
+
+from dualsense_controller.core.enum import InReportOverflowPolicy
+
+
+@dataclass(frozen=True)
+class InReportRingBufferStats:
+    size: int
+    occupancy: int
+    max_occupancy: int
+    num_committed: int
+    num_taken: int
+    num_overflows: int
+    num_blocked: int
+    num_skipped: int
+
+
+class InReportRingBuffer:
+    """
+    Fixed size queue of preallocated report slots between a reader and a processing thread.
+    The reader reads directly into its write slot and commits it, the processing thread takes committed slots.
+    Slots are only swapped by index, nothing is copied or allocated per report.
+    """
+
+    @property
+    def write_buffer(self) -> bytearray:
+        return self._buffers[self._write_slot]
+
+    @property
+    def taken_timestamp(self) -> int:
+        # when the report taken last was committed, in nanoseconds (time.perf_counter_ns)
+        return self._timestamps[self._read_slot]
+
+    @property
+    def occupancy(self) -> int:
+        return len(self._committed)
+
+    @property
+    def num_skipped(self) -> int:
+        return self._num_skipped
+
+    @property
+    def is_closed(self) -> bool:
+        return self._closed
+
+    @property
+    def stats(self) -> InReportRingBufferStats:
+        with self._condition:
+            return InReportRingBufferStats(
+                size=self._size,
+                occupancy=len(self._committed),
+                max_occupancy=self._max_occupancy,
+                num_committed=self._num_committed,
+                num_taken=self._num_taken,
+                num_overflows=self._num_overflows,
+                num_blocked=self._num_blocked,
+                num_skipped=self._num_skipped,
+            )
+
+    def __init__(
+            self,
+            size: int,
+            slot_length: int,
+            overflow_policy: InReportOverflowPolicy = InReportOverflowPolicy.DROP_OLDEST,
+    ):
+        assert size > 0, 'ring buffer size has to be positive'
+        self._size: Final[int] = size
+        self._slot_length: Final[int] = slot_length
+        self._overflow_policy: Final[InReportOverflowPolicy] = overflow_policy
+        self._condition: Final[Condition] = Condition()
+
+        # one slot more for the reader and two for the processing (the current report and the previous one,
+        # which may still be read on other threads), so up to size reports can be queued
+        num_slots: int = size + 3
+        self._buffers: Final[list[bytearray]] = [bytearray(slot_length) for _ in range(num_slots)]
+        self._views: Final[list[memoryview]] = [memoryview(buffer) for buffer in self._buffers]
+        self._lengths: Final[list[int]] = [0] * num_slots
+        self._timestamps: Final[list[int]] = [0] * num_slots
+        self._committed: Final[deque[int]] = deque(maxlen=num_slots)
+        self._free: Final[deque[int]] = deque(range(3, num_slots), maxlen=num_slots)
+        self._write_slot: int = 0
+        self._read_slot: int = 1
+        self._previous_read_slot: int = 2
+
+        self._closed: bool = False
+        self._max_occupancy: int = 0
+        self._num_committed: int = 0
+        self._num_taken: int = 0
+        self._num_overflows: int = 0
+        self._num_blocked: int = 0
+        self._num_skipped: int = 0
+
+    def commit(self, num_bytes: int) -> bool:
+        # before waiting for a free slot, the report has been read now
+        timestamp: int = time.perf_counter_ns()
+        with self._condition:
+            if len(self._committed) >= self._size:
+                if self._overflow_policy == InReportOverflowPolicy.BLOCK:
+                    self._num_blocked += 1
+                    while len(self._committed) >= self._size and not self._closed:
+                        self._condition.wait()
+                else:
+                    self._free.append(self._committed.popleft())
+                    self._num_overflows += 1
+            if self._closed:
+                return False
+            self._lengths[self._write_slot] = num_bytes
+            self._timestamps[self._write_slot] = timestamp
+            self._committed.append(self._write_slot)
+            self._write_slot = self._free.popleft()
+            self._num_committed += 1
+            occupancy: int = len(self._committed)
+            if occupancy > self._max_occupancy:
+                self._max_occupancy = occupancy
+            self._condition.notify_all()
+            return True
+
+    def take(self, newest_only: bool = False) -> memoryview | None:
+        with self._condition:
+            while not self._committed and not self._closed:
+                self._condition.wait()
+            if self._closed:
+                return None
+            # the slot taken before the previous one is not used anymore
+            self._free.append(self._previous_read_slot)
+            self._previous_read_slot = self._read_slot
+            if newest_only:
+                while len(self._committed) > 1:
+                    self._free.append(self._committed.popleft())
+                    self._num_skipped += 1
+            self._read_slot = self._committed.popleft()
+            self._num_taken += 1
+            self._condition.notify_all()
+            num_bytes: int = self._lengths[self._read_slot]
+            view: memoryview = self._views[self._read_slot]
+            return view if num_bytes == self._slot_length else view[:num_bytes]
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
@@ -0,0 +1,97 @@
+import threading
+import time
+from threading import Thread
+from typing import Final
+
+import pyee
+
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+from dualsense_controller.core.enum import EventType
+from dualsense_controller.core.state.write_state.WriteStates import WriteStates
+from dualsense_controller.core.typedef import ExceptionCallback
+
+
+class OutReportWriter:
+    """
+    Sends the out report from its own thread as soon as write states have been changed,
+    independent of the in report processing.
+    Changes arriving while a report is written (or while waiting for the max write rate) are coalesced into one report.
+    """
+
+    @property
+    def num_written(self) -> int:
+        return self._num_written
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def __init__(
+            self,
+            write_states: WriteStates,
+            hid_controller_device: HidControllerDevice,
+            max_write_rate: float | None = None,
+    ):
+        assert max_write_rate is None or max_write_rate > 0, 'max write rate has to be positive'
+        self._write_states: Final[WriteStates] = write_states
+        self._hid_controller_device: Final[HidControllerDevice] = hid_controller_device
+        self._min_write_interval_ns: Final[int] = 0 if max_write_rate is None else int(1e+9 / max_write_rate)
+        self._event_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
+        self._changed_event: Final[threading.Event] = threading.Event()
+        self._stop_event: Final[threading.Event] = threading.Event()
+        self._thread: Thread | None = None
+        self._last_write_timestamp: int = 0
+        self._num_written: int = 0
+
+        self._write_states.on_changed(self.notify)
+
+    def on_exception(self, callback: ExceptionCallback) -> None:
+        self._event_emitter.on(EventType.EXCEPTION, callback)
+
+    def start(self) -> None:
+        assert self._thread is None, 'writer already started'
+        self._stop_event.clear()
+        self._thread = Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        # send changes which have been made before starting
+        if self._write_states.has_changed:
+            self.notify()
+
+    def stop(self) -> None:
+        assert self._thread is not None, 'writer not started'
+        self._stop_event.set()
+        self._changed_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def notify(self) -> None:
+        self._changed_event.set()
+
+    def _loop(self) -> None:
+        try:
+            while True:
+                self._changed_event.wait()
+                if self._stop_event.is_set():
+                    break
+                self._wait_for_min_write_interval()
+                self._changed_event.clear()
+                if self._stop_event.is_set():
+                    break
+                if self._write_states.has_changed:
+                    self._write()
+        except Exception as exception:
+            self._event_emitter.emit(EventType.EXCEPTION, exception)
+
+    def _wait_for_min_write_interval(self) -> None:
+        if self._min_write_interval_ns == 0:
+            return
+        remaining_ns: int = self._last_write_timestamp + self._min_write_interval_ns - time.perf_counter_ns()
+        if remaining_ns > 0:
+            self._stop_event.wait(remaining_ns / 1e+9)
+
+    def _write(self) -> None:
+        self._write_states.update_out_report(self._hid_controller_device.out_report)
+        self._write_states.set_unchanged()
+        self._hid_controller_device.write()
+        self._last_write_timestamp = time.perf_counter_ns()
+        self._num_written += 1
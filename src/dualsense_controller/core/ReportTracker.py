@@ -0,0 +1,91 @@
+from dataclasses import dataclass
+from typing import Final
+
+
+@dataclass(frozen=True, slots=True)
+class ReportStatistics:
+    num_reports: int = 0
+    # reports the controller has sent, but which never arrived (gaps in the sequence numbers)
+    num_dropped: int = 0
+    # reports which arrived again or older than the previous one
+    num_duplicated: int = 0
+    # reports which took longer than usual from the sensor to the processing
+    num_late: int = 0
+    # seconds, compared to the fastest report since the start
+    max_lateness: float = 0
+
+
+_SEQ_NUM_RANGE: Final[int] = 0x100
+# the clocks of controller and host drift apart a little, so the fastest seen report is slowly forgotten
+_DRIFT_TOLERANCE_PPM: Final[int] = 100
+
+
+class ReportTracker:
+    """
+    Tracks the sequence numbers and (unwrapped, see DeviceClock) device timestamps of the in reports.
+    Gaps in sequence numbers are reports lost on the link, late reports (arrival compared to the sensor timestamp)
+    come from the link, the host or the processing getting behind.
+    """
+
+    @property
+    def statistics(self) -> ReportStatistics:
+        return ReportStatistics(
+            num_reports=self._num_reports,
+            num_dropped=self._num_dropped,
+            num_duplicated=self._num_duplicated,
+            num_late=self._num_late,
+            max_lateness=self._max_lateness_ns / 1e+9,
+        )
+
+    def __init__(self, late_threshold: float = 0.01):
+        self._late_threshold_ns: Final[int] = int(late_threshold * 1e+9)
+        self._num_reports: int = 0
+        self._num_dropped: int = 0
+        self._num_duplicated: int = 0
+        self._num_late: int = 0
+        self._max_lateness_ns: int = 0
+        self._last_seq_num: int | None = None
+        self._last_device_timestamp: int = 0
+        self._min_offset_ns: int = 0
+
+    def reset(self) -> None:
+        self._num_reports = 0
+        self._num_dropped = 0
+        self._num_duplicated = 0
+        self._num_late = 0
+        self._max_lateness_ns = 0
+        self._last_seq_num = None
+
+    # returns whether the report was dropped, duplicated or late
+    def update(self, seq_num: int, device_timestamp: int, timestamp_ns: int) -> bool:
+        self._num_reports += 1
+        last_seq_num: int | None = self._last_seq_num
+        if last_seq_num is None:
+            self._last_seq_num = seq_num
+            self._last_device_timestamp = device_timestamp
+            self._min_offset_ns = timestamp_ns - device_timestamp
+            return False
+
+        seq_num_diff: int = (seq_num - last_seq_num) % _SEQ_NUM_RANGE
+        if seq_num_diff == 0 or seq_num_diff >= _SEQ_NUM_RANGE // 2:
+            self._num_duplicated += 1
+            return True
+        self._last_seq_num = seq_num
+        anomaly: bool = False
+        if seq_num_diff > 1:
+            self._num_dropped += seq_num_diff - 1
+            anomaly = True
+
+        elapsed_device_ns: int = device_timestamp - self._last_device_timestamp
+        self._last_device_timestamp = device_timestamp
+        offset_ns: int = timestamp_ns - device_timestamp
+        self._min_offset_ns = min(
+            offset_ns, self._min_offset_ns + elapsed_device_ns * _DRIFT_TOLERANCE_PPM // 1_000_000
+        )
+        lateness_ns: int = offset_ns - self._min_offset_ns
+        if lateness_ns > self._max_lateness_ns:
+            self._max_lateness_ns = lateness_ns
+        if lateness_ns > self._late_threshold_ns:
+            self._num_late += 1
+            anomaly = True
+        return anomaly
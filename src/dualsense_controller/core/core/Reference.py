@@ -0,0 +1,13 @@
+from typing import Generic
+
+from dualsense_controller.core.typedef import LockableValue
+
+
+class Reference(Generic[LockableValue], object):
+    """
+    Like Lockable, but without lock: replacing a reference is atomic, which is enough for a single writer.
+    """
+    __slots__ = ['value']
+
+    def __init__(self, value: LockableValue = None):
+        self.value: LockableValue | None = value
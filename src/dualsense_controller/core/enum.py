@@ -6,6 +6,9 @@ class EventType(str, Enum):
     EXCEPTION = 'EXCEPTION'
     CONNECTION_CHANGE = 'CONNECTION_CHANGE'
     IN_REPORT = 'IN_REPORT'
+    RECONNECTION = 'RECONNECTION'
+    REPORT_ANOMALY = 'REPORT_ANOMALY'
+    REPORT_TIMESTAMPS = 'REPORT_TIMESTAMPS'
 
 
 class ConnectionType(Enum):
@@ -16,3 +19,17 @@ class ConnectionType(Enum):
 
     def __str__(self) -> str:
         return str(self.value[0]) if isinstance(self.value, tuple) else self.value
+
+
+class HidTransport(str, Enum):
+    # cross-platform, via the native hidapi library
+    HIDAPI = 'HIDAPI'
+    # Linux only, pure Python via /dev/hidraw* (falls back to HIDAPI if not available, except with a reactor)
+    HIDRAW = 'HIDRAW'
+
+
+class InReportOverflowPolicy(str, Enum):
+    # reader overwrites the oldest not yet processed report
+    DROP_OLDEST = 'DROP_OLDEST'
+    # reader waits until the processing has taken a report
+    BLOCK = 'BLOCK'
@@ -19,3 +19,13 @@ class InvalidDeviceIndexException(AbstractBaseException):
 class InvalidInReportLengthException(AbstractBaseException):
     def __init__(self):
         super().__init__(f'Invalid connection type')
+
+
+class DeviceLostException(AbstractBaseException):
+    def __init__(self, reason: Exception):
+        super().__init__(f'Lost connection to DualSense device: {reason}')
+
+
+class DeviceTimeoutException(AbstractBaseException):
+    def __init__(self, timeout: float | None):
+        super().__init__(f'DualSense device did not send a report within {timeout} seconds')
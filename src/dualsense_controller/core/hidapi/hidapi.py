@@ -267,6 +267,7 @@ class Device(object):
             raise IOError("Could not open connection to device.")
         if not blocking:
             hidapi.hid_set_nonblocking(self._device, 1)
+        self._readinto_bufps = {}
 
     def __del__(self):
         if self._device is not None:
@@ -323,6 +324,43 @@ class Device(object):
         else:
             return ffi.buffer(bufp, rv)[:]
 
+    def readinto(self, buffer, timeout_ms=None):
+        """ Read an Input report from a HID device into a preallocated buffer.
+
+        Unlike :meth:`read` nothing is allocated per call. The report is
+        written directly into `buffer`; the cffi pointer to it is created
+        once per buffer and reused whenever the same buffer is passed in
+        again (e.g. when alternating between a few preallocated buffers).
+
+        :param buffer:      Writable buffer (e.g. `bytearray`). Its length is
+                            the maximum number of bytes to read.
+        :type buffer:       bytearray
+        :param timeout_ms:  `None` reads according to the device's blocking
+                            mode, `0` returns immediately when no data is
+                            available, `-1` blocks until data is available.
+        :type timeout_ms:   int
+        :return:            Number of bytes read, `0` if no data was available
+        :rtype:             int
+
+        """
+        self._check_device_status()
+        # the buffer itself is kept as well, so its id cannot be reused
+        cached = self._readinto_bufps.get(id(buffer))
+        if cached is None:
+            cached = (buffer, ffi.from_buffer("unsigned char[]", buffer,
+                                              require_writable=True))
+            self._readinto_bufps[id(buffer)] = cached
+        bufp = cached[1]
+        if timeout_ms is None:
+            rv = hidapi.hid_read(self._device, bufp, len(bufp))
+        else:
+            rv = hidapi.hid_read_timeout(self._device, bufp, len(bufp),
+                                         timeout_ms)
+        if rv == -1:
+            raise IOError("Failed to read from HID device: {0}"
+                          .format(self._get_last_error_string()))
+        return rv
+
     def get_manufacturer_string(self):
         """ Get the Manufacturer String from the HID device.
 
@@ -436,6 +474,7 @@ class Device(object):
         self._check_device_status()
         hidapi.hid_close(self._device)
         self._device = None
+        self._readinto_bufps = {}
 
     def _get_last_error_string(self):
         errstr_p = ffi.new("wchar_t*")
@@ -0,0 +1 @@
+from .hidraw import *
@@ -0,0 +1,162 @@
+"""
+Pure Python access to HID devices via the Linux hidraw interface.
+
+Mirrors the parts of the hidapi wrapper (see ../hidapi) which are used by this library,
+but talks to /dev/hidraw* directly and enumerates devices via sysfs,
+so no native library is needed.
+
+"""
+import os
+import select
+import sys
+from typing import Final
+
+__all__ = ['DeviceInfo', 'Device', 'enumerate', 'list_node_names', 'is_available', 'BUS_USB', 'BUS_BLUETOOTH']
+
+_SYSFS_HIDRAW_DIR: Final[str] = '/sys/class/hidraw'
+_DEV_DIR: Final[str] = '/dev'
+
+BUS_USB: Final[int] = 0x03
+BUS_BLUETOOTH: Final[int] = 0x05
+
+
+def is_available() -> bool:
+    return sys.platform.startswith('linux') and os.path.isdir(_SYSFS_HIDRAW_DIR)
+
+
+def _read_uevent(node_name: str) -> dict[str, str]:
+    uevent: dict[str, str] = {}
+    with open(os.path.join(_SYSFS_HIDRAW_DIR, node_name, 'device', 'uevent'), 'r') as uevent_file:
+        for line in uevent_file:
+            key, _, value = line.rstrip('\n').partition('=')
+            uevent[key] = value
+    return uevent
+
+
+def _node_sort_key(node_name: str) -> int:
+    suffix: str = node_name[len('hidraw'):]
+    return int(suffix) if suffix.isdigit() else -1
+
+
+def _read_hid_id_from_link(node_name: str) -> tuple[int, int, int] | None:
+    # the HID parent device is named <bus>:<vendor>:<product>.<instance>, all hex,
+    # so devices can be filtered without opening their uevent files
+    device_name: str = os.path.basename(os.path.realpath(os.path.join(_SYSFS_HIDRAW_DIR, node_name, 'device')))
+    hid_id, _, _ = device_name.partition('.')
+    parts: list[str] = hid_id.split(':')
+    if len(parts) != 3:
+        return None
+    try:
+        bus_type, vendor_id, product_id = (int(part, 16) for part in parts)
+    except ValueError:
+        return None
+    return bus_type, vendor_id, product_id
+
+
+def list_node_names() -> list[str]:
+    if not is_available():
+        return []
+    return sorted(os.listdir(_SYSFS_HIDRAW_DIR), key=_node_sort_key)
+
+
+class DeviceInfo:
+    __slots__ = ['path', 'vendor_id', 'product_id', 'serial_number',
+                 'release_number', 'manufacturer_string', 'product_string',
+                 'usage_page', 'usage', 'interface_number', 'bus_type']
+
+    def __init__(self, node_name: str, uevent: dict[str, str]):
+        # HID_ID=<bus>:<vendor>:<product>, all hex
+        bus_type, vendor_id, product_id = (int(part, 16) for part in uevent['HID_ID'].split(':'))
+        phys: str = uevent.get('HID_PHYS', '')
+        _, _, interface = phys.rpartition('/input')
+
+        self.path: bytes = os.fsencode(os.path.join(_DEV_DIR, node_name))
+        self.vendor_id: int = vendor_id
+        self.product_id: int = product_id
+        self.serial_number: str | None = uevent.get('HID_UNIQ') or None
+        self.release_number: int | None = None
+        self.manufacturer_string: str | None = None
+        self.product_string: str | None = uevent.get('HID_NAME') or None
+        self.usage_page: int | None = None
+        self.usage: int | None = None
+        self.interface_number: int = int(interface) if bus_type == BUS_USB and interface.isdigit() else -1
+        self.bus_type: int = bus_type
+
+
+def enumerate(vendor_id: int = 0, product_id: int = 0) -> list[DeviceInfo]:
+    devices: list[DeviceInfo] = []
+    for node_name in list_node_names():
+        if vendor_id or product_id:
+            hid_id: tuple[int, int, int] | None = _read_hid_id_from_link(node_name)
+            if hid_id is not None and (
+                    (vendor_id and hid_id[1] != vendor_id) or (product_id and hid_id[2] != product_id)
+            ):
+                continue
+        try:
+            uevent: dict[str, str] = _read_uevent(node_name)
+            info: DeviceInfo = DeviceInfo(node_name, uevent)
+        except (OSError, KeyError, ValueError):
+            # node vanished in the meantime or has no HID parent
+            continue
+        if vendor_id and info.vendor_id != vendor_id:
+            continue
+        if product_id and info.product_id != product_id:
+            continue
+        devices.append(info)
+    return devices
+
+
+class Device:
+
+    def __init__(self, path: bytes | str, blocking: bool = True):
+        self._fd: int | None = os.open(path, os.O_RDWR | os.O_CLOEXEC | (0 if blocking else os.O_NONBLOCK))
+        self._blocking: Final[bool] = blocking
+        self._poll: Final[select.poll] = select.poll()
+        self._poll.register(self._fd, select.POLLIN)
+
+    def __del__(self):
+        if getattr(self, '_fd', None) is not None:
+            self.close()
+
+    def fileno(self) -> int:
+        self._check_device_status()
+        return self._fd
+
+    def write(self, data: bytes | bytearray) -> None:
+        self._check_device_status()
+        if os.write(self._fd, data) != len(data):
+            raise IOError("Failed to write to HID device.")
+
+    def read(self, length: int, timeout_ms: int = 0, blocking: bool = False) -> bytes | None:
+        self._check_device_status()
+        if not timeout_ms and blocking:
+            timeout_ms = -1
+        if timeout_ms and not self._wait_readable(timeout_ms):
+            return None
+        try:
+            return os.read(self._fd, length) or None
+        except BlockingIOError:
+            return None
+
+    def readinto(self, buffer: bytearray | memoryview, timeout_ms: int | None = None) -> int:
+        self._check_device_status()
+        if timeout_ms is not None and not self._wait_readable(timeout_ms):
+            return 0
+        try:
+            return os.readv(self._fd, (buffer,))
+        except BlockingIOError:
+            return 0
+
+    def close(self) -> None:
+        self._check_device_status()
+        fd: int = self._fd
+        self._fd = None
+        self._poll.unregister(fd)
+        os.close(fd)
+
+    def _wait_readable(self, timeout_ms: int) -> bool:
+        return len(self._poll.poll(None if timeout_ms < 0 else timeout_ms)) > 0
+
+    def _check_device_status(self) -> None:
+        if self._fd is None:
+            raise OSError("Trying to perform action on closed device.")
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from enum import Enum
+
+
+class HotplugAction(str, Enum):
+    ADD = 'ADD'
+    REMOVE = 'REMOVE'
+
+
+@dataclass(frozen=True, slots=True)
+class HotplugEvent:
+    action: HotplugAction
+    path: bytes | None = None
+
+
+class HotplugEventSource(ABC):
+
+    @abstractmethod
+    def open(self) -> None:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def next_event(self, timeout: float | None = None) -> HotplugEvent | None:
+        # returns None on timeout or after wakeup()
+        pass
+
+    @abstractmethod
+    def wakeup(self) -> None:
+        pass
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from threading import Lock, Thread
+from typing import Callable, Final, Hashable
+
+from dualsense_controller.core.hotplug.HotplugEventSource import HotplugAction, HotplugEvent, HotplugEventSource
+from dualsense_controller.core.hotplug.NetlinkHotplugEventSource import NetlinkHotplugEventSource
+from dualsense_controller.core.hotplug.PollingHotplugEventSource import ListPathsFn, PollingHotplugEventSource
+from dualsense_controller.core.log import Log
+from dualsense_controller.core.util import format_exception
+
+ReconnectFn = Callable[[], bool]
+
+
+class HotplugWatcher:
+    """
+    Waits for devices to come back after they have been lost and calls their reconnect functions,
+    on every added device and periodically (a device may not be accessible yet, i.e. until udev has set permissions).
+    One watcher can be shared by many controllers. Its thread is started with the first watched device.
+    """
+
+    @staticmethod
+    def create_default(list_paths_fn: ListPathsFn, retry_interval: float = 0.5) -> HotplugWatcher:
+        event_source: HotplugEventSource = (
+            NetlinkHotplugEventSource() if NetlinkHotplugEventSource.is_available()
+            else PollingHotplugEventSource(list_paths_fn)
+        )
+        return HotplugWatcher(event_source, retry_interval=retry_interval)
+
+    @property
+    def num_watched(self) -> int:
+        with self._lock:
+            return len(self._reconnect_fns)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def __init__(self, event_source: HotplugEventSource, retry_interval: float = 0.5):
+        self._event_source: Final[HotplugEventSource] = event_source
+        self._retry_interval: Final[float] = retry_interval
+        self._lock: Final[Lock] = Lock()
+        self._reconnect_fns: Final[dict[Hashable, ReconnectFn]] = {}
+        self._thread: Thread | None = None
+        self._stop_event: threading.Event | None = None
+
+    def watch(self, key: Hashable, reconnect_fn: ReconnectFn) -> None:
+        with self._lock:
+            self._reconnect_fns[key] = reconnect_fn
+            if self._thread is None:
+                self._stop_event = threading.Event()
+                self._event_source.open()
+                self._thread = Thread(target=self._loop, args=(self._stop_event,), daemon=True)
+                self._thread.start()
+            else:
+                self._event_source.wakeup()
+
+    def unwatch(self, key: Hashable) -> None:
+        with self._lock:
+            self._reconnect_fns.pop(key, None)
+
+    def stop(self) -> None:
+        with self._lock:
+            thread: Thread | None = self._thread
+            if thread is None:
+                return
+            self._stop_event.set()
+            self._event_source.wakeup()
+            self._thread = None
+        if thread is not threading.current_thread():
+            thread.join()
+
+    def _loop(self, stop_event: threading.Event) -> None:
+        try:
+            self._reconnect_all()
+            while not stop_event.is_set():
+                event: HotplugEvent | None = self._event_source.next_event(self._retry_interval)
+                if stop_event.is_set():
+                    break
+                if event is None or event.action == HotplugAction.ADD:
+                    self._reconnect_all()
+        except Exception as exception:
+            Log.error('An Exception in the hotplug thread occured:', format_exception(exception))
+        finally:
+            self._event_source.close()
+
+    def _reconnect_all(self) -> None:
+        with self._lock:
+            reconnect_fns: list[tuple[Hashable, ReconnectFn]] = list(self._reconnect_fns.items())
+        for key, reconnect_fn in reconnect_fns:
+            if reconnect_fn():
+                with self._lock:
+                    if self._reconnect_fns.get(key) is reconnect_fn:
+                        del self._reconnect_fns[key]
@@ -0,0 +1,91 @@
+import os
+import select
+import socket
+import time
+from typing import Final
+
+from dualsense_controller.core.hotplug.HotplugEventSource import HotplugAction, HotplugEvent, HotplugEventSource
+
+_NETLINK_KOBJECT_UEVENT: Final[int] = 15
+_KERNEL_EVENT_GROUP: Final[int] = 1
+_BUFFER_SIZE: Final[int] = 16384
+_ACTIONS: Final[dict[str, HotplugAction]] = {
+    'add': HotplugAction.ADD,
+    'remove': HotplugAction.REMOVE,
+}
+
+
+class NetlinkHotplugEventSource(HotplugEventSource):
+    """
+    Linux only, receives the kernel's uevents for hidraw nodes via a netlink socket.
+    """
+
+    @staticmethod
+    def is_available() -> bool:
+        if not hasattr(socket, 'AF_NETLINK'):
+            return False
+        try:
+            with socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_KOBJECT_UEVENT) as test_socket:
+                test_socket.bind((0, _KERNEL_EVENT_GROUP))
+            return True
+        except OSError:
+            return False
+
+    @staticmethod
+    def _parse(data: bytes) -> HotplugEvent | None:
+        # kernel uevent: "<action>@<devpath>\0KEY=value\0KEY=value\0..."
+        properties: dict[str, str] = {}
+        for field in data.split(b'\0')[1:]:
+            key, _, value = field.decode(errors='replace').partition('=')
+            properties[key] = value
+        if properties.get('SUBSYSTEM') != 'hidraw':
+            return None
+        action: HotplugAction | None = _ACTIONS.get(properties.get('ACTION', ''))
+        if action is None:
+            return None
+        dev_name: str | None = properties.get('DEVNAME')
+        return HotplugEvent(
+            action=action,
+            path=os.fsencode(os.path.join('/dev', dev_name)) if dev_name else None,
+        )
+
+    def __init__(self):
+        self._socket: socket.socket | None = None
+        self._wakeup_read_fd: int | None = None
+        self._wakeup_write_fd: int | None = None
+
+    def open(self) -> None:
+        assert self._socket is None, 'already opened'
+        self._socket = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_KOBJECT_UEVENT)
+        self._socket.bind((0, _KERNEL_EVENT_GROUP))
+        self._wakeup_read_fd, self._wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_write_fd, False)
+
+    def close(self) -> None:
+        assert self._socket is not None, 'not opened'
+        self._socket.close()
+        os.close(self._wakeup_read_fd)
+        os.close(self._wakeup_write_fd)
+        self._socket = None
+        self._wakeup_read_fd = None
+        self._wakeup_write_fd = None
+
+    def next_event(self, timeout: float | None = None) -> HotplugEvent | None:
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining: float | None = None if deadline is None else max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([self._socket, self._wakeup_read_fd], [], [], remaining)
+            if not readable:
+                return None
+            if self._wakeup_read_fd in readable:
+                os.read(self._wakeup_read_fd, 64)
+                return None
+            event: HotplugEvent | None = self._parse(self._socket.recv(_BUFFER_SIZE))
+            if event is not None:
+                return event
+
+    def wakeup(self) -> None:
+        try:
+            os.write(self._wakeup_write_fd, b'\x00')
+        except BlockingIOError:
+            pass
@@ -0,0 +1,58 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Final, Iterable
+
+from dualsense_controller.core.hotplug.HotplugEventSource import HotplugAction, HotplugEvent, HotplugEventSource
+
+ListPathsFn = Callable[[], Iterable[bytes]]
+
+
+class PollingHotplugEventSource(HotplugEventSource):
+    """
+    Platform independent fallback, compares the listed device paths periodically.
+    """
+
+    def __init__(self, list_paths_fn: ListPathsFn, interval: float = 1.0):
+        self._list_paths_fn: Final[ListPathsFn] = list_paths_fn
+        self._interval: Final[float] = interval
+        self._wakeup_event: Final[threading.Event] = threading.Event()
+        self._pending_events: Final[deque[HotplugEvent]] = deque()
+        self._known_paths: set[bytes] | None = None
+        self._next_poll_time: float = 0
+
+    def open(self) -> None:
+        self._known_paths = set(self._list_paths_fn())
+        self._next_poll_time = time.monotonic() + self._interval
+        self._pending_events.clear()
+        self._wakeup_event.clear()
+
+    def close(self) -> None:
+        self._known_paths = None
+
+    def next_event(self, timeout: float | None = None) -> HotplugEvent | None:
+        deadline: float | None = None if timeout is None else time.monotonic() + timeout
+        while not self._pending_events:
+            now: float = time.monotonic()
+            if now >= self._next_poll_time:
+                self._poll()
+                continue
+            if deadline is not None and now >= deadline:
+                return None
+            wait_until: float = self._next_poll_time if deadline is None else min(deadline, self._next_poll_time)
+            if self._wakeup_event.wait(wait_until - now):
+                self._wakeup_event.clear()
+                return None
+        return self._pending_events.popleft()
+
+    def wakeup(self) -> None:
+        self._wakeup_event.set()
+
+    def _poll(self) -> None:
+        self._next_poll_time = time.monotonic() + self._interval
+        paths: set[bytes] = set(self._list_paths_fn())
+        for path in sorted(self._known_paths - paths):
+            self._pending_events.append(HotplugEvent(action=HotplugAction.REMOVE, path=path))
+        for path in sorted(paths - self._known_paths):
+            self._pending_events.append(HotplugEvent(action=HotplugAction.ADD, path=path))
+        self._known_paths = paths
@@ -1,10 +1,33 @@
+import struct
+from typing import Final
+
 from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportFrame import InReportFrame
 
 
 class Bt01InReport(InReport):
+    # sticks, buttons, triggers
+    _STRUCT: Final[struct.Struct] = InReport._create_struct('4B3B2B')
+
     def __init__(self, raw_bytes: bytearray = None):
         super().__init__({
             "axes_0": 0, "axes_1": 1, "axes_2": 2, "axes_3": 3,
             "buttons_0": 4, "buttons_1": 5, "buttons_2": 6,
             "axes_4": 7, "axes_5": 8
         }, raw_bytes=raw_bytes)
+
+    def _decode(self, raw_bytes: bytes | bytearray | memoryview) -> InReportFrame:
+        (
+            axes_0, axes_1, axes_2, axes_3,
+            buttons_0, buttons_1, buttons_2,
+            axes_4, axes_5,
+        ) = Bt01InReport._STRUCT.unpack_from(raw_bytes, InReport._OFFSET)
+        return InReportFrame(
+            left_stick_x=axes_0,
+            left_stick_y=axes_1,
+            right_stick_x=axes_2,
+            right_stick_y=axes_3,
+            left_trigger=axes_4,
+            right_trigger=axes_5,
+            buttons=buttons_0 | (buttons_1 << 8) | (buttons_2 << 16),
+        )
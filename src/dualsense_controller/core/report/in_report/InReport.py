@@ -1,22 +1,136 @@
+import struct
+import time
 from abc import ABC, abstractmethod
 from typing import Final
 
+from dualsense_controller.core.report.in_report.InReportFrame import InReportFrame
+from dualsense_controller.core.report.in_report.enum import InReportGroup
+
 _IndexDict = dict[str, int]
 
+_GROUP_KEYS: Final[dict[InReportGroup, tuple[str, ...]]] = {
+    InReportGroup.STICKS: ('axes_0', 'axes_1', 'axes_2', 'axes_3'),
+    InReportGroup.TRIGGERS: ('axes_4', 'axes_5'),
+    InReportGroup.BUTTONS: ('buttons_',),
+    InReportGroup.TOUCH_1: ('touch_1_',),
+    InReportGroup.TOUCH_2: ('touch_2_',),
+    InReportGroup.TRIGGER_FEEDBACK: ('right_trigger_feedback', 'left_trigger_feedback'),
+    InReportGroup.BATTERY: ('battery_',),
+    # timestamps change with every report, but no state depends on them
+    InReportGroup.IMU: ('gyro_', 'accel_'),
+}
+
 
 class InReport(ABC):
     _OFFSET: Final[int] = 1
 
     @property
-    def raw_bytes(self) -> bytes:
+    def raw_bytes(self) -> bytes | bytearray | memoryview:
         return self._raw_bytes
 
+    @property
+    def timestamp(self) -> int:
+        # nanoseconds (time.perf_counter_ns) when the report was read
+        return self._timestamp
+
+    @property
+    def frame(self) -> InReportFrame:
+        # decoded once per report, on first access
+        if self._frame is None:
+            self._frame = self._decode(self._raw_bytes)
+        return self._frame
+
+    @property
+    def changed_groups(self) -> InReportGroup:
+        return InReportGroup(sum(group for group, mask in self._group_masks.items() if self._changed_bits & mask))
+
     def __init__(self, index_dict: _IndexDict, raw_bytes: bytearray = None):
         self._index_dict: Final[_IndexDict] = index_dict
-        self._raw_bytes: bytes | bytearray | None = raw_bytes
-
-    def update(self, raw_bytes: bytes) -> None:
+        self._raw_bytes: bytes | bytearray | memoryview | None = raw_bytes
+        self._frame: InReportFrame | None = None
+        self._timestamp: int = 0
+        # bit mask over all bytes of the report per group
+        self._group_masks: Final[dict[InReportGroup, int]] = {
+            group: sum(
+                0xff << ((InReport._OFFSET + index) * 8)
+                for key, index in index_dict.items() if key.startswith(keys)
+            )
+            for group, keys in _GROUP_KEYS.items()
+        }
+        self._bits: int | None = None
+        # everything has changed compared to nothing
+        self._changed_bits: int = -1
+
+    # raw_bytes may be a view on the reader's buffer, which is only valid until the next report is read.
+    # changes are compared to the previous report, which is another instance when double buffered
+    def update(
+            self,
+            raw_bytes: bytes | bytearray | memoryview,
+            previous: 'InReport | None' = None,
+            timestamp: int | None = None,
+    ) -> None:
+        previous_bits: int | None = self._bits if previous is None else previous._bits
+        # the whole report as one int, so the bytes changed since the previous report are one XOR away
+        bits: int = int.from_bytes(raw_bytes, 'little')
+        self._changed_bits = -1 if previous_bits is None else bits ^ previous_bits
+        self._bits = bits
         self._raw_bytes = raw_bytes
+        self._frame = None
+        self._timestamp = timestamp if timestamp is not None else time.perf_counter_ns()
+
+    def has_changed(self, group: InReportGroup) -> bool:
+        return bool(self._changed_bits & self._group_masks[group])
+
+    @abstractmethod
+    def _decode(self, raw_bytes: bytes | bytearray | memoryview) -> InReportFrame:
+        ...
+
+    @staticmethod
+    def _decode_full(values: tuple[int, ...]) -> InReportFrame:
+        # common part of the USB and the full BT report, see the formats of these
+        (
+            axes_0, axes_1, axes_2, axes_3, axes_4, axes_5,
+            seq_num, buttons,
+            gyro_x, gyro_y, gyro_z, accel_x, accel_y, accel_z,
+            sensor_timestamp,
+            touch_1, touch_2,
+            right_trigger_feedback, left_trigger_feedback,
+            battery_0, battery_1,
+        ) = values
+        return InReportFrame(
+            left_stick_x=axes_0,
+            left_stick_y=axes_1,
+            right_stick_x=axes_2,
+            right_stick_y=axes_3,
+            left_trigger=axes_4,
+            right_trigger=axes_5,
+            seq_num=seq_num,
+            buttons=buttons & 0xffffff,
+            gyro_x=gyro_x,
+            gyro_y=gyro_y,
+            gyro_z=gyro_z,
+            accel_x=accel_x,
+            accel_y=accel_y,
+            accel_z=accel_z,
+            sensor_timestamp=sensor_timestamp,
+            touch_1_active=not touch_1 & 0x80,
+            touch_1_id=touch_1 & 0x7f,
+            touch_1_x=(touch_1 >> 8) & 0xfff,
+            touch_1_y=(touch_1 >> 20) & 0xfff,
+            touch_2_active=not touch_2 & 0x80,
+            touch_2_id=touch_2 & 0x7f,
+            touch_2_x=(touch_2 >> 8) & 0xfff,
+            touch_2_y=(touch_2 >> 20) & 0xfff,
+            right_trigger_feedback=right_trigger_feedback,
+            left_trigger_feedback=left_trigger_feedback,
+            battery_0=battery_0,
+            battery_1=battery_1,
+        )
+
+    @staticmethod
+    def _create_struct(fmt: str) -> struct.Struct:
+        # little endian, no alignment
+        return struct.Struct('<' + fmt)
 
     def _get_uint8(self, key: str) -> int:
         return self._raw_bytes[InReport._OFFSET + self._index_dict.get(key)]
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class InReportFrame:
+    """
+    All values of an in report, decoded at once.
+    Buttons are one word: byte 0 (dpad, square, cross, circle, triangle) in the lowest bits, then byte 1 and byte 2.
+    """
+    left_stick_x: int = 0
+    left_stick_y: int = 0
+    right_stick_x: int = 0
+    right_stick_y: int = 0
+    left_trigger: int = 0
+    right_trigger: int = 0
+    seq_num: int = 0
+    buttons: int = 0
+    gyro_x: int = 0
+    gyro_y: int = 0
+    gyro_z: int = 0
+    accel_x: int = 0
+    accel_y: int = 0
+    accel_z: int = 0
+    # in units of 1/3 microseconds
+    sensor_timestamp: int = 0
+    touch_1_active: bool = False
+    touch_1_id: int = 0
+    touch_1_x: int = 0
+    touch_1_y: int = 0
+    touch_2_active: bool = False
+    touch_2_id: int = 0
+    touch_2_x: int = 0
+    touch_2_y: int = 0
+    right_trigger_feedback: int = 0
+    left_trigger_feedback: int = 0
+    battery_0: int = 0
+    battery_1: int = 0
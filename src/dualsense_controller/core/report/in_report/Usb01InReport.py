@@ -1,10 +1,17 @@
+import struct
+from typing import Final
+
 from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.InReportFrame import InReportFrame
 
 
 # ??? byte 31
 # ??? byte 40
 # ??? bytes 43-51
 class Usb01InReport(InReport):
+    # axes, seq num, buttons, (timestamp), gyro, accel, sensor timestamp, (byte 31), touches, trigger feedbacks, battery
+    _STRUCT: Final[struct.Struct] = InReport._create_struct('6BBI4x3h3hIxIIxBB9x2B')
+
     def __init__(self, raw_bytes: bytearray = None):
         super().__init__({
             "axes_0": 0, "axes_1": 1, "axes_2": 2, "axes_3": 3, "axes_4": 4, "axes_5": 5,
@@ -19,3 +26,6 @@ class Usb01InReport(InReport):
             "right_trigger_feedback": 41, "left_trigger_feedback": 42,
             "battery_0": 52, "battery_1": 53
         }, raw_bytes=raw_bytes)
+
+    def _decode(self, raw_bytes: bytes | bytearray | memoryview) -> InReportFrame:
+        return InReport._decode_full(Usb01InReport._STRUCT.unpack_from(raw_bytes, InReport._OFFSET))
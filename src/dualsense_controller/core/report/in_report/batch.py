@@ -0,0 +1,104 @@
+from typing import Any, Final
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
+from dualsense_controller.core.report.in_report.Bt31InReport import Bt31InReport
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportLength
+
+# field of the decoded array: (key of the first byte in the index tables, raw format, decoded format)
+_FIELDS: Final[dict[str, tuple[str, str, str]]] = {
+    'left_stick_x': ('axes_0', 'u1', 'u1'),
+    'left_stick_y': ('axes_1', 'u1', 'u1'),
+    'right_stick_x': ('axes_2', 'u1', 'u1'),
+    'right_stick_y': ('axes_3', 'u1', 'u1'),
+    'left_trigger': ('axes_4', 'u1', 'u1'),
+    'right_trigger': ('axes_5', 'u1', 'u1'),
+    'seq_num': ('seq_num', 'u1', 'u1'),
+    'buttons': ('buttons_0', '<u4', '<u4'),
+    'gyro_x': ('gyro_x_0', '<i2', '<i2'),
+    'gyro_y': ('gyro_y_0', '<i2', '<i2'),
+    'gyro_z': ('gyro_z_0', '<i2', '<i2'),
+    'accel_x': ('accel_x_0', '<i2', '<i2'),
+    'accel_y': ('accel_y_0', '<i2', '<i2'),
+    'accel_z': ('accel_z_0', '<i2', '<i2'),
+    'sensor_timestamp': ('sensor_timestamp_0', '<u4', '<u4'),
+    'touch_1_active': ('touch_1_0', '<u4', '?'),
+    'touch_1_id': ('touch_1_0', '<u4', 'u1'),
+    'touch_1_x': ('touch_1_0', '<u4', '<u2'),
+    'touch_1_y': ('touch_1_0', '<u4', '<u2'),
+    'touch_2_active': ('touch_2_0', '<u4', '?'),
+    'touch_2_id': ('touch_2_0', '<u4', 'u1'),
+    'touch_2_x': ('touch_2_0', '<u4', '<u2'),
+    'touch_2_y': ('touch_2_0', '<u4', '<u2'),
+    'right_trigger_feedback': ('right_trigger_feedback', 'u1', 'u1'),
+    'left_trigger_feedback': ('left_trigger_feedback', 'u1', 'u1'),
+    'battery_0': ('battery_0', 'u1', 'u1'),
+    'battery_1': ('battery_1', 'u1', 'u1'),
+}
+
+_LAYOUTS: Final[dict[ConnectionType, tuple[type[InReport], InReportLength]]] = {
+    ConnectionType.USB_01: (Usb01InReport, InReportLength.USB_01),
+    ConnectionType.BT_31: (Bt31InReport, InReportLength.BT_31),
+    ConnectionType.BT_01: (Bt01InReport, InReportLength.BT_01),
+}
+
+# dtypes need numpy, so they are created on first use
+_raw_dtypes: dict[ConnectionType, Any] = {}
+
+
+def decode_batch(raw: bytes | bytearray | memoryview, layout: ConnectionType = ConnectionType.USB_01) -> Any:
+    """
+    Decodes many in reports stored back to back (each including its report id) at once.
+    Returns a NumPy structured array with one record per report, its fields are named like those of InReportFrame.
+    Values not contained in a layout (e.g. the sensors in BT_01) are zero.
+    Needs the optional dependency numpy.
+    """
+    import numpy as np
+
+    raw_dtype = _raw_dtypes.get(layout)
+    if raw_dtype is None:
+        raw_dtype = _raw_dtypes[layout] = _create_raw_dtype(layout)
+    if len(raw) % raw_dtype.itemsize != 0:
+        raise ValueError(f'Buffer of {len(raw)} bytes does not contain whole reports of {raw_dtype.itemsize} bytes')
+    # a view on the buffer, nothing gets copied yet
+    src = np.frombuffer(raw, dtype=raw_dtype)
+    out = np.zeros(len(src), dtype=np.dtype([(name, decoded) for name, (_, _, decoded) in _FIELDS.items()]))
+
+    for name in raw_dtype.names:
+        match name:
+            case 'buttons':
+                out[name] = src[name] & 0xffffff
+            case 'touch_1' | 'touch_2':
+                touch = src[name]
+                out[f'{name}_active'] = (touch & 0x80) == 0
+                out[f'{name}_id'] = touch & 0x7f
+                out[f'{name}_x'] = (touch >> 8) & 0xfff
+                out[f'{name}_y'] = (touch >> 20) & 0xfff
+            case _:
+                out[name] = src[name]
+    return out
+
+
+def _create_raw_dtype(layout: ConnectionType) -> Any:
+    import numpy as np
+
+    in_report_type, length = _LAYOUTS[layout]
+    index_dict: dict[str, int] = in_report_type()._index_dict
+    names: list[str] = []
+    formats: list[str] = []
+    offsets: list[int] = []
+    for name, (key, raw_format, _) in _FIELDS.items():
+        index: int | None = index_dict.get(key)
+        if index is None:
+            continue
+        # the touch points are decoded from one word each
+        if name.startswith(('touch_1', 'touch_2')):
+            name = name[:7]
+            if name in names:
+                continue
+        names.append(name)
+        formats.append(raw_format)
+        offsets.append(InReport._OFFSET + index)
+    return np.dtype({'names': names, 'formats': formats, 'offsets': offsets, 'itemsize': int(length)})
@@ -1,4 +1,6 @@
-from enum import Enum
+from enum import Enum, IntFlag
+
+from dualsense_controller.core.util import flag
 
 
 class InReportLength(int, Enum):
@@ -6,3 +8,15 @@ class InReportLength(int, Enum):
     USB_01 = 64
     BT_31 = 78
     BT_01 = 10
+
+
+class InReportGroup(IntFlag):
+    STICKS = flag(0)
+    TRIGGERS = flag(1)
+    BUTTONS = flag(2)
+    TOUCH_1 = flag(3)
+    TOUCH_2 = flag(4)
+    TRIGGER_FEEDBACK = flag(5)
+    BATTERY = flag(6)
+    IMU = flag(7)
+    ALL = STICKS | TRIGGERS | BUTTONS | TOUCH_1 | TOUCH_2 | TRIGGER_FEEDBACK | BATTERY | IMU
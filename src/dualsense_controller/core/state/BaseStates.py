@@ -8,7 +8,8 @@ from dualsense_controller.core.state.typedef import StateChangeCallback, StateNa
 class BaseStates:
 
     def __init__(self, state_value_mapper: StateValueMapper):
-        self._states_dict: Final[dict[StateName, State]] = {}
+        # replaced instead of changed in place, so other threads can iterate it while states are added or removed
+        self._states_dict: dict[StateName, State] = {}
         self._state_value_mapper: Final[StateValueMapper] = state_value_mapper
 
     @property
@@ -57,8 +58,14 @@ class BaseStates:
         for state_name, state in self._states_dict.items():
             state.remove_change_listener(callback)
 
+    def get_state(self, name: StateName) -> State[StateValue]:
+        return self._get_state_by_name(name)
+
     def _register_state(self, name: StateName, state: State[StateValue]) -> None:
-        self._states_dict[name] = state
+        self._states_dict = {**self._states_dict, name: state}
+
+    def _unregister_state(self, name: StateName) -> None:
+        self._states_dict = {state_name: state for state_name, state in self._states_dict.items() if state_name != name}
 
     def _get_state_by_name(self, name: StateName) -> State[StateValue]:
         return self._states_dict[name]
@@ -4,14 +4,24 @@ import time
 from threading import Lock
 from typing import Final, Generic
 
-from dualsense_controller.core.core.Lockable import Lockable
+from dualsense_controller.core.state.StateStorage import AtomicStateStorage, LockedStateStorage, StateRecord, \
+    StateStorage
 from dualsense_controller.core.state.StateValueCallbackManager import StateValueCallbackManager
 from dualsense_controller.core.state.mapping.typedef import MapFn
 from dualsense_controller.core.state.typedef import CompareFn, CompareResult, StateChangeCallback, StateName, \
     StateValue
 
 
+# guards the creation of the callback managers, which are created with the first listener
+_CALLBACK_MANAGER_LOCK: Final[Lock] = Lock()
+
+
 class State(Generic[StateValue]):
+    __slots__ = [
+        'name', '_callback_manager', '_compare_fn', '_mapped_to_raw_fn', '_raw_to_mapped_fn', '_ignore_none',
+        '_default_value', '_disable_change_detection', '_lock_free', '_storage', '_mapped_value',
+        '_mapped_last_value',
+    ]
 
     @staticmethod
     def _compare(before: StateValue, after: StateValue) -> CompareResult:
@@ -22,8 +32,7 @@ class State(Generic[StateValue]):
 
     @property
     def value(self) -> StateValue:
-        value_raw: StateValue = self.value_raw
-        return value_raw if not callable(self._raw_to_mapped_fn) else self._raw_to_mapped_fn(value_raw)
+        return self._map_value_raw(self.value_raw)
 
     @value.setter
     def value(self, value_mapped: StateValue) -> None:
@@ -31,8 +40,7 @@ class State(Generic[StateValue]):
 
     @property
     def last_value(self) -> StateValue:
-        last_value_raw: StateValue = self.last_value_raw
-        return last_value_raw if not callable(self._raw_to_mapped_fn) else self._raw_to_mapped_fn(last_value_raw)
+        return self._map_last_value_raw(self.last_value_raw)
 
     @property
     def value_raw(self) -> StateValue:
@@ -50,41 +58,31 @@ class State(Generic[StateValue]):
 
     @property
     def has_listeners(self) -> bool:
-        return self._callback_manager.has_listeners
+        callback_manager: StateValueCallbackManager[StateValue] | None = self._callback_manager
+        return callback_manager is not None and callback_manager.has_listeners
+
+    @property
+    def record(self) -> StateRecord:
+        # value, last value, change timestamp and changed flag from the same change
+        return self._storage.record
 
-    # LOCKED GETTERS AND SETTERS
+    # STORED GETTERS
 
     @property
     def _value_raw(self) -> StateValue:
-        return self.__value.value
-
-    @_value_raw.setter
-    def _value_raw(self, _value: StateValue) -> None:
-        self.__value.value = _value
+        return self._storage.value_raw
 
     @property
     def _last_value_raw(self) -> StateValue:
-        return self.__last_value.value
-
-    @_last_value_raw.setter
-    def _last_value_raw(self, _last_value: StateValue) -> None:
-        self.__last_value.value = _last_value
+        return self._storage.last_value_raw
 
     @property
     def _change_timestamp(self) -> int:
-        return self.__change_timestamp.value
-
-    @_change_timestamp.setter
-    def _change_timestamp(self, _change_timestamp: int) -> None:
-        self.__change_timestamp.value = _change_timestamp
+        return self._storage.change_timestamp
 
     @property
     def _changed_since_last_set_value(self) -> bool:
-        return self.__changed_since_last_update.value
-
-    @_changed_since_last_set_value.setter
-    def _changed_since_last_set_value(self, _changed_since_last_update: bool) -> None:
-        self.__changed_since_last_update.value = _changed_since_last_update
+        return self._storage.changed
 
     def __init__(
             self,
@@ -96,35 +94,25 @@ class State(Generic[StateValue]):
             raw_to_mapped_fn: MapFn = None,
             compare_fn: CompareFn = None,
             disable_change_detection: bool = False,
+            lock_free: bool = False,
     ):
         # CONST
         self.name: Final[StateName] = name
-        self._lock: Final[Lock] = Lock()
-        self._callback_manager: Final[StateValueCallbackManager[StateValue]] = StateValueCallbackManager(name)
+        self._callback_manager: StateValueCallbackManager[StateValue] | None = None
         self._compare_fn: Final[CompareFn] = compare_fn if compare_fn is not None else State._compare
         self._mapped_to_raw_fn: Final[MapFn] = mapped_to_raw_fn
         self._raw_to_mapped_fn: Final[MapFn] = raw_to_mapped_fn
         self._ignore_none: Final[bool] = ignore_none
         self._default_value: Final[StateValue | None] = default_value
         self._disable_change_detection: Final[bool] = disable_change_detection
-
-        # VAR
-        self.__value: Lockable[StateValue | None] = Lockable(
-            lock=self._lock,
-            value=value if value is not None else default_value
-        )
-        self.__last_value: Lockable[StateValue | None] = Lockable(
-            lock=self._lock,
-            value=None
-        )
-        self.__change_timestamp: Lockable[int] = Lockable(
-            lock=self._lock,
-            value=0
-        )
-        self.__changed_since_last_update: Lockable[bool] = Lockable(
-            lock=self._lock,
-            value=False
-        )
+        # lock free: only one thread (the reader) may set values, see AtomicStateStorage
+        self._lock_free: Final[bool] = lock_free
+        self._storage: Final[StateStorage[StateValue]] = (
+            AtomicStateStorage if lock_free else LockedStateStorage
+        )(value if value is not None else default_value)
+        # (raw value, mapped value), replaced as a whole, so both always belong together
+        self._mapped_value: tuple[StateValue, StateValue] | None = None
+        self._mapped_last_value: tuple[StateValue, StateValue] | None = None
 
     def set_value_raw_without_triggering_change(self, new_value: StateValue | None):
         self._set_value_raw(new_value, trigger_change_on_changed=False)
@@ -148,20 +136,41 @@ class State(Generic[StateValue]):
             self._trigger_change()
 
     def on_change(self, callback: StateChangeCallback) -> None:
-        self._callback_manager.on_change(callback)
+        self._get_callback_manager().on_change(callback)
 
     def once_change(self, callback: StateChangeCallback) -> None:
-        self._callback_manager.once_change(callback)
+        self._get_callback_manager().once_change(callback)
 
     def remove_change_listener(self, callback: StateChangeCallback | None = None) -> None:
-        self._callback_manager.remove_change_listener(callback)
+        if self._callback_manager is not None:
+            self._callback_manager.remove_change_listener(callback)
+        elif callback is not None:
+            raise KeyError(callback)
 
     def remove_all_change_listeners(self) -> None:
-        self._callback_manager.remove_all_change_listeners()
+        if self._callback_manager is not None:
+            self._callback_manager.remove_all_change_listeners()
+
+    def _get_callback_manager(self) -> StateValueCallbackManager[StateValue]:
+        if self._callback_manager is None:
+            with _CALLBACK_MANAGER_LOCK:
+                if self._callback_manager is None:
+                    self._callback_manager = StateValueCallbackManager(self.name)
+        return self._callback_manager
 
     # ################# GETTERS AND SETTERS ###############
 
     def _set_value_raw(self, value_raw: StateValue | None, trigger_change_on_changed: bool = True) -> None:
+        old_value, new_value, changed = self._compare_value_raw(value_raw)
+        self._change_value(
+            old_value=old_value,
+            new_value=new_value,
+            changed=changed,
+            trigger_change=(changed if trigger_change_on_changed else False),
+        )
+
+    # without side effects, returns old value, new value and whether it changed
+    def _compare_value_raw(self, value_raw: StateValue | None) -> tuple[StateValue, StateValue, bool]:
         old_value: StateValue = self._value_raw
         new_value: StateValue = value_raw
         if old_value is None and self._default_value is not None:
@@ -169,20 +178,9 @@ class State(Generic[StateValue]):
         if new_value is None and self._default_value is not None:
             new_value = self._default_value
         if self._ignore_none and (old_value is None or new_value is None):
-            self._change_value(
-                old_value=new_value,
-                new_value=new_value,
-                changed=False,
-                trigger_change=False,
-            )
-            return
+            return new_value, new_value, False
         changed, new_value = self._compare_fn(old_value, new_value)
-        self._change_value(
-            old_value=old_value,
-            new_value=new_value,
-            changed=changed,
-            trigger_change=(changed if trigger_change_on_changed else False),
-        )
+        return old_value, new_value, changed
 
     def _change_value(
             self,
@@ -191,12 +189,43 @@ class State(Generic[StateValue]):
             changed: bool,
             trigger_change: bool = True,
     ) -> None:
-        self._last_value_raw = old_value
-        self._value_raw = new_value
-        self._change_timestamp = time.perf_counter_ns()
-        self._changed_since_last_set_value = changed
+        self._storage.store(new_value, old_value, self._current_timestamp(), changed)
         if not self._disable_change_detection and trigger_change:
             self._trigger_change()
 
+    def _current_timestamp(self) -> int:
+        return time.perf_counter_ns()
+
     def _trigger_change(self):
-        self._callback_manager.emit_change(self.last_value, self.value, self._change_timestamp)
+        callback_manager: StateValueCallbackManager[StateValue] | None = self._callback_manager
+        if callback_manager is None:
+            return
+        record: StateRecord = self._storage.record
+        callback_manager.emit_change(
+            self._map_last_value_raw(record.last_value_raw), self._map_value_raw(record.value_raw),
+            record.change_timestamp
+        )
+
+    # mapped values are cached until the raw value changes, raw values not stored (lock free) are compared by value
+    def _map_value_raw(self, value_raw: StateValue) -> StateValue:
+        if self._raw_to_mapped_fn is None:
+            return value_raw
+        mapped: tuple[StateValue, StateValue] | None = self._mapped_value
+        if mapped is not None and (mapped[0] is value_raw or mapped[0] == value_raw):
+            return mapped[1]
+        value: StateValue = self._raw_to_mapped_fn(value_raw)
+        self._mapped_value = (value_raw, value)
+        return value
+
+    def _map_last_value_raw(self, last_value_raw: StateValue) -> StateValue:
+        if self._raw_to_mapped_fn is None:
+            return last_value_raw
+        mapped: tuple[StateValue, StateValue] | None = self._mapped_last_value
+        if mapped is not None and (mapped[0] is last_value_raw or mapped[0] == last_value_raw):
+            return mapped[1]
+        # mostly the value before, mapped already
+        mapped = self._mapped_value
+        if mapped is None or not (mapped[0] is last_value_raw or mapped[0] == last_value_raw):
+            mapped = (last_value_raw, self._raw_to_mapped_fn(last_value_raw))
+        self._mapped_last_value = mapped
+        return mapped[1]
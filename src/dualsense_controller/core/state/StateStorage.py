@@ -0,0 +1,145 @@
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Any, Final, Generic, NamedTuple
+
+from dualsense_controller.core.state.typedef import StateValue
+
+
+class StateRecord(NamedTuple):
+    value_raw: Any
+    last_value_raw: Any
+    change_timestamp: int
+    changed: bool
+
+
+class StateStorage(ABC, Generic[StateValue]):
+    """
+    Holds value, last value, change timestamp and changed flag of a state, always stored together.
+    """
+
+    @property
+    @abstractmethod
+    def record(self) -> StateRecord:
+        ...
+
+    @property
+    @abstractmethod
+    def value_raw(self) -> StateValue | None:
+        ...
+
+    @property
+    @abstractmethod
+    def last_value_raw(self) -> StateValue | None:
+        ...
+
+    @property
+    @abstractmethod
+    def change_timestamp(self) -> int:
+        ...
+
+    @property
+    @abstractmethod
+    def changed(self) -> bool:
+        ...
+
+    @abstractmethod
+    def store(
+            self,
+            value_raw: StateValue | None,
+            last_value_raw: StateValue | None,
+            change_timestamp: int,
+            changed: bool,
+    ) -> None:
+        ...
+
+
+class LockedStateStorage(StateStorage[StateValue]):
+    """
+    Any thread may write.
+    """
+    __slots__ = ['_lock', '_value_raw', '_last_value_raw', '_change_timestamp', '_changed']
+
+    @property
+    def record(self) -> StateRecord:
+        with self._lock:
+            return StateRecord(self._value_raw, self._last_value_raw, self._change_timestamp, self._changed)
+
+    @property
+    def value_raw(self) -> StateValue | None:
+        with self._lock:
+            return self._value_raw
+
+    @property
+    def last_value_raw(self) -> StateValue | None:
+        with self._lock:
+            return self._last_value_raw
+
+    @property
+    def change_timestamp(self) -> int:
+        with self._lock:
+            return self._change_timestamp
+
+    @property
+    def changed(self) -> bool:
+        with self._lock:
+            return self._changed
+
+    def __init__(self, value_raw: StateValue | None = None):
+        self._lock: Final[Lock] = Lock()
+        self._value_raw: StateValue | None = value_raw
+        self._last_value_raw: StateValue | None = None
+        self._change_timestamp: int = 0
+        self._changed: bool = False
+
+    def store(
+            self,
+            value_raw: StateValue | None,
+            last_value_raw: StateValue | None,
+            change_timestamp: int,
+            changed: bool,
+    ) -> None:
+        with self._lock:
+            self._value_raw = value_raw
+            self._last_value_raw = last_value_raw
+            self._change_timestamp = change_timestamp
+            self._changed = changed
+
+
+class AtomicStateStorage(StateStorage[StateValue]):
+    """
+    Only one thread may write. Every store publishes a new immutable record by one reference assignment,
+    so readers on other threads always get consistent values without any lock.
+    """
+    __slots__ = ['_record']
+
+    @property
+    def record(self) -> StateRecord:
+        return self._record
+
+    @property
+    def value_raw(self) -> StateValue | None:
+        return self._record.value_raw
+
+    @property
+    def last_value_raw(self) -> StateValue | None:
+        return self._record.last_value_raw
+
+    @property
+    def change_timestamp(self) -> int:
+        return self._record.change_timestamp
+
+    @property
+    def changed(self) -> bool:
+        return self._record.changed
+
+    def __init__(self, value_raw: StateValue | None = None):
+        self._record: StateRecord = StateRecord(value_raw, None, 0, False)
+
+    def store(
+            self,
+            value_raw: StateValue | None,
+            last_value_raw: StateValue | None,
+            change_timestamp: int,
+            changed: bool,
+    ) -> None:
+        self._record = StateRecord(value_raw, last_value_raw, change_timestamp, changed)
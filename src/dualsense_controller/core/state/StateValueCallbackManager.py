@@ -1,68 +1,104 @@
 import inspect
+from threading import Lock
 from typing import Final, Generic
 
-import pyee
-
 from dualsense_controller.core.state.typedef import StateChangeCallback, StateName, StateValue
 
+# (callback, only once)
+_Listener = tuple[StateChangeCallback, bool]
+
+_MAX_NUM_ARGS: Final[int] = 4
+_NO_LISTENERS: Final[tuple[tuple[_Listener, ...], ...]] = ((),) * (_MAX_NUM_ARGS + 1)
+
 
 class StateValueCallbackManager(Generic[StateValue]):
+    """
+    Listeners are kept per number of arguments, resolved once on registration.
+    A callback is registered at most once, registering it again replaces it in its place.
+    Emitting iterates over immutable snapshots, which are replaced whenever listeners change,
+    so listeners added or removed by a callback take effect with the next change.
+    """
+    __slots__ = ['_name', '_lock', '_callbacks', '_listeners', '_has_listeners']
 
     @property
     def has_listeners(self) -> bool:
-        return len(self._event_emitter.event_names()) > 0
+        return self._has_listeners
 
     def __init__(self, name: StateName):
         self._name: Final[StateName] = name
-        self._event_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
-
-        self._event_name_0_args: Final[str] = f'{name}_0'
-        self._event_name_1_args: Final[str] = f'{name}_1'
-        self._event_name_2_args: Final[str] = f'{name}_2'
-        self._event_name_3_args: Final[str] = f'{name}_3'
-        self._event_name_4_args: Final[str] = f'{name}_4'
+        self._lock: Final[Lock] = Lock()
+        # callback -> (number of arguments, only once)
+        self._callbacks: Final[dict[StateChangeCallback, tuple[int, bool]]] = {}
+        # per number of arguments
+        self._listeners: tuple[tuple[_Listener, ...], ...] = _NO_LISTENERS
+        self._has_listeners: bool = False
 
     def on_change(self, callback: StateChangeCallback) -> None:
-        self._event_emitter.on(self._get_event_name_by_callable(callback), callback)
+        self._add_listener(callback, once=False)
 
     def once_change(self, callback: StateChangeCallback) -> None:
-        self._event_emitter.once(self._get_event_name_by_callable(callback), callback)
+        self._add_listener(callback, once=True)
 
     def remove_change_listener(self, callback: StateChangeCallback | None = None) -> None:
         if callback is None:
             self.remove_all_change_listeners()
-        else:
-            self._event_emitter.remove_listener(
-                self._get_event_name_by_callable(callback),
-                callback
-            )
+            return
+        with self._lock:
+            # raises KeyError for unknown callbacks
+            del self._callbacks[callback]
+            self._publish()
 
     def remove_all_change_listeners(self) -> None:
-        self._event_emitter.remove_all_listeners()
+        with self._lock:
+            self._callbacks.clear()
+            self._publish()
 
     def emit_change(self, old_value: StateValue, new_value: StateValue, timestamp: int):
-        if self._event_name_0_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_0_args)
-        if self._event_name_1_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_1_args, new_value)
-        if self._event_name_2_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_2_args, new_value, timestamp)
-        if self._event_name_3_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_3_args, old_value, new_value, timestamp)
-        if self._event_name_4_args in self._event_emitter.event_names():
-            self._event_emitter.emit(self._event_name_4_args, self._name, old_value, new_value, timestamp)
-
-    def _get_event_name_by_callable(self, callable_: StateChangeCallback) -> str:
+        if not self._has_listeners:
+            return
+        listeners_0, listeners_1, listeners_2, listeners_3, listeners_4 = self._listeners
+        for callback, once in listeners_0:
+            if not once or self._take_once(callback):
+                callback()
+        for callback, once in listeners_1:
+            if not once or self._take_once(callback):
+                callback(new_value)
+        for callback, once in listeners_2:
+            if not once or self._take_once(callback):
+                callback(new_value, timestamp)
+        for callback, once in listeners_3:
+            if not once or self._take_once(callback):
+                callback(old_value, new_value, timestamp)
+        for callback, once in listeners_4:
+            if not once or self._take_once(callback):
+                callback(self._name, old_value, new_value, timestamp)
+
+    def _add_listener(self, callback: StateChangeCallback, once: bool) -> None:
+        num_args: int = self._get_num_args(callback)
+        with self._lock:
+            self._callbacks[callback] = (num_args, once)
+            self._publish()
+
+    # removes a once listener before it gets called, returns False if it has been removed meanwhile
+    def _take_once(self, callback: StateChangeCallback) -> bool:
+        with self._lock:
+            if callback not in self._callbacks:
+                return False
+            del self._callbacks[callback]
+            self._publish()
+        return True
+
+    # has to be called with lock
+    def _publish(self) -> None:
+        listeners: tuple[list[_Listener], ...] = tuple([] for _ in range(_MAX_NUM_ARGS + 1))
+        for callback, (num_args, once) in self._callbacks.items():
+            listeners[num_args].append((callback, once))
+        self._listeners = tuple(tuple(listeners_of_num_args) for listeners_of_num_args in listeners)
+        self._has_listeners = len(self._callbacks) > 0
+
+    @staticmethod
+    def _get_num_args(callable_: StateChangeCallback) -> int:
         num_params: int = len(inspect.signature(callable_).parameters)
-        match num_params:
-            case 0:
-                return self._event_name_0_args
-            case 1:
-                return self._event_name_1_args
-            case 2:
-                return self._event_name_2_args
-            case 3:
-                return self._event_name_3_args
-            case 4:
-                return self._event_name_4_args
-        raise Exception(f'invalid arg count {callable_}')
+        if num_params > _MAX_NUM_ARGS:
+            raise Exception(f'invalid arg count {callable_}')
+        return num_params
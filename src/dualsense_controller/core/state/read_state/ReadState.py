@@ -1,21 +1,37 @@
 from __future__ import annotations
 
-from typing import Any, Final, Generic
+import threading
+from typing import Any, Callable, Final, Generic
 
-from dualsense_controller.core.core.Lockable import Lockable
+from dualsense_controller.core.core.Reference import Reference
 from dualsense_controller.core.report.in_report.InReport import InReport
 from dualsense_controller.core.state.State import State
+from dualsense_controller.core.state.StateStorage import StateRecord
 from dualsense_controller.core.state.mapping.typedef import MapFn
+from dualsense_controller.core.state.read_state.StateHistory import StateHistory
 from dualsense_controller.core.state.read_state.enum import ReadStateName
-from dualsense_controller.core.state.typedef import CompareFn, StateValue, StateValueFn
+from dualsense_controller.core.state.typedef import CompareFn, StateChangeCallback, StateValue, StateValueFn
 
 
 class ReadState(Generic[StateValue], State[StateValue]):
+    __slots__ = [
+        '_depends_on', '_is_dependency_of', '_enforce_update', '_value_calc_fn', '_in_report_reference',
+        '_can_update_itself', '_on_listeners_changed', '_cycle_timestamp', '_history', '_reader_thread_id_reference',
+        '_calculated_value_raw',
+    ]
 
     @property
     def has_changed_dependencies(self) -> bool:
         return any(state.has_changed_since_last_set_value for state in self._depends_on)
 
+    def has_changed_dependencies_at(self, timestamp: int) -> bool:
+        # changed by the report with that timestamp, not by an earlier one
+        for state in self._depends_on:
+            record: StateRecord = state.record
+            if record.changed and record.change_timestamp == timestamp:
+                return True
+        return False
+
     @property
     def has_changed_dependents(self) -> bool:
         return any(state.has_changed_since_last_set_value for state in self._is_dependency_of)
@@ -45,22 +61,39 @@ class ReadState(Generic[StateValue], State[StateValue]):
     @property
     def value_raw(self) -> StateValue:
         if self.is_self_updatable:
+            if self._lock_free and self._reader_thread_id_reference.value != threading.get_ident():
+                return self._calc_value_raw_without_storing()
             return self.calc_value()
         return super().value_raw
 
     @property
     def is_self_updatable(self) -> bool:
-        return self._can_update_itself and (self._cycle_timestamp > self._change_timestamp)
+        return self._can_update_itself and (self._cycle_timestamp.value > self._change_timestamp)
 
     @property
     def is_updatable_from_outside(self) -> bool:
+        return self.is_always_updatable_from_outside or self.has_changed_dependencies
+
+    @property
+    def is_always_updatable_from_outside(self) -> bool:
+        # only changes with the listeners, in contrast to has_changed_dependencies
         return (
-                self._enforce_update
-                or self.has_listeners
-                or self.has_listened_dependents
-                or self.has_changed_dependencies
+                self._enforce_update or self.has_listeners or self.has_listened_dependents
+                or self._history is not None
         )
 
+    @property
+    def has_dependencies(self) -> bool:
+        return len(self._depends_on) > 0
+
+    @property
+    def depends_on(self) -> tuple[ReadState[Any], ...]:
+        return self._depends_on
+
+    @property
+    def history(self) -> StateHistory | None:
+        return self._history
+
     def __init__(
             self,
             # BASE
@@ -71,14 +104,17 @@ class ReadState(Generic[StateValue], State[StateValue]):
             mapped_to_raw_fn: MapFn = None,
             raw_to_mapped_fn: MapFn = None,
             compare_fn: CompareFn = None,
+            lock_free: bool = False,
 
             # READ STATE
             value_calc_fn: StateValueFn = None,
-            in_report_lockable: Lockable[InReport] = None,
+            in_report_reference: Reference[InReport] = None,
             enforce_update: bool = False,
             can_update_itself: bool = True,
             depends_on: list[State[Any]] = None,
             is_dependency_of: list[State[Any]] = None,
+            on_listeners_changed: Callable[[bool], None] | None = None,
+            reader_thread_id_reference: Reference[int] | None = None,
     ):
         State.__init__(
             self,
@@ -89,19 +125,31 @@ class ReadState(Generic[StateValue], State[StateValue]):
             mapped_to_raw_fn=mapped_to_raw_fn,
             raw_to_mapped_fn=raw_to_mapped_fn,
             compare_fn=compare_fn,
+            lock_free=lock_free,
         )
         # CONST
-        self._depends_on: Final[list[ReadState[StateValue]]] = depends_on if depends_on is not None else []
-        self._is_dependency_of: Final[list[ReadState[StateValue]]] = (
-            is_dependency_of if is_dependency_of is not None else []
-        )
         self._enforce_update: Final[bool] = enforce_update
         self._value_calc_fn: Final[StateValueFn] = value_calc_fn
-        self._in_report_lockable: Final[Lockable[InReport]] = in_report_lockable
+        self._in_report_reference: Final[Reference[InReport]] = in_report_reference
         self._can_update_itself: Final[bool] = can_update_itself
+        # called with True if listeners have been added, False if removed
+        self._on_listeners_changed: Final[Callable[[bool], None] | None] = on_listeners_changed
 
         # VAR
-        self._cycle_timestamp: int = 0
+        # replaced instead of changed in place, as the reader thread iterates them while derived states come and go
+        self._depends_on: tuple[ReadState[Any], ...] = tuple(depends_on) if depends_on is not None else ()
+        self._is_dependency_of: tuple[ReadState[Any], ...] = (
+            tuple(is_dependency_of) if is_dependency_of is not None else ()
+        )
+        # may be shared by the states calculated from the same part of the report
+        self._cycle_timestamp: Reference[int] = Reference(0)
+        self._history: StateHistory | None = None
+        # lock free: thread which stores the values, others calculate values without storing them
+        self._reader_thread_id_reference: Final[Reference[int]] = (
+            reader_thread_id_reference if reader_thread_id_reference is not None else Reference(threading.get_ident())
+        )
+        # (cycle timestamp, raw value) calculated without storing
+        self._calculated_value_raw: tuple[int, StateValue] | None = None
 
         # AFTER
         for depends_on_state in self._depends_on:
@@ -109,19 +157,90 @@ class ReadState(Generic[StateValue], State[StateValue]):
         for is_dependency_of_state in self._is_dependency_of:
             is_dependency_of_state.add_depends_on(self)
 
+    def on_change(self, callback: StateChangeCallback) -> None:
+        super().on_change(callback)
+        if self._on_listeners_changed is not None:
+            self._on_listeners_changed(True)
+
+    def once_change(self, callback: StateChangeCallback) -> None:
+        super().once_change(callback)
+        if self._on_listeners_changed is not None:
+            self._on_listeners_changed(True)
+
+    def remove_change_listener(self, callback: StateChangeCallback | None = None) -> None:
+        super().remove_change_listener(callback)
+        if self._on_listeners_changed is not None:
+            self._on_listeners_changed(False)
+
+    def remove_all_change_listeners(self) -> None:
+        super().remove_all_change_listeners()
+        if self._on_listeners_changed is not None:
+            self._on_listeners_changed(False)
+
+    # values are recorded per report from then on, so the state is calculated with every report.
+    # another capacity replaces the history by a new one, which takes over the latest samples
+    def enable_history(self, capacity: int) -> StateHistory:
+        value_raw: StateValue = self.value_raw
+        if value_raw is not None and not isinstance(value_raw, (int, float)):
+            raise TypeError(f'History needs numeric values, {self.name} has {type(value_raw).__name__}')
+        former_history: StateHistory | None = self._history
+        if former_history is None or former_history.capacity != capacity:
+            history: StateHistory = StateHistory(capacity)
+            if former_history is not None:
+                for timestamp, value in zip(*former_history.last(capacity)):
+                    history.append(timestamp, value)
+            self._history = history
+            if self._on_listeners_changed is not None:
+                self._on_listeners_changed(True)
+        return self._history
+
+    def disable_history(self) -> None:
+        if self._history is None:
+            return
+        self._history = None
+        if self._on_listeners_changed is not None:
+            self._on_listeners_changed(False)
+
+    def record_history(self, timestamp: int) -> None:
+        history: StateHistory | None = self._history
+        if history is not None:
+            history.append(timestamp, self._value_raw)
+
     def calc_value(self, trigger_change_on_changed: bool = True) -> StateValue:
-        value_raw: StateValue = self._value_calc_fn(
-            self._in_report_lockable.value,
-            *self._depends_on
-        )
-        self._set_value_raw(value_raw, trigger_change_on_changed)
+        self._set_value_raw(self._calc_value_raw(), trigger_change_on_changed)
         return self._value_raw
 
+    def _calc_value_raw(self) -> StateValue:
+        return self._value_calc_fn(self._in_report_reference.value, *self._depends_on)
+
+    def _calc_value_raw_without_storing(self) -> StateValue:
+        # only the reader thread may store, others calculate a value not calculated this cycle once per cycle
+        cycle_timestamp: int = self._cycle_timestamp.value
+        calculated: tuple[int, StateValue] | None = self._calculated_value_raw
+        if calculated is not None and calculated[0] == cycle_timestamp:
+            return calculated[1]
+        value_raw: StateValue = self._compare_value_raw(self._calc_value_raw())[1]
+        self._calculated_value_raw = (cycle_timestamp, value_raw)
+        return value_raw
+
+    def _current_timestamp(self) -> int:
+        # values are from the report, so they changed when it was read
+        in_report: InReport | None = self._in_report_reference.value
+        return in_report.timestamp if in_report is not None else super()._current_timestamp()
+
     def set_cycle_timestamp(self, timestamp: int):
-        self._cycle_timestamp = timestamp
+        self._cycle_timestamp.value = timestamp
+
+    def share_cycle_timestamp(self, cycle_timestamp: Reference[int]):
+        self._cycle_timestamp = cycle_timestamp
 
     def add_as_dependecy_of(self, state: ReadState[Any]):
-        self._is_dependency_of.append(state)
+        self._is_dependency_of = (*self._is_dependency_of, state)
 
     def add_depends_on(self, state: ReadState[Any]):
-        self._depends_on.append(state)
+        self._depends_on = (*self._depends_on, state)
+
+    def remove_as_dependency_of(self, state: ReadState[Any]):
+        self._is_dependency_of = tuple(
+            is_dependency_of for is_dependency_of in self._is_dependency_of if is_dependency_of is not state
+        )
@@ -1,48 +1,76 @@
 import math
-import time
+import threading
 from functools import partial
 from typing import Any, Final
 from typing import Callable
 
 import pyee
 
-from dualsense_controller.core.core.Lockable import Lockable
+from dualsense_controller.core.core.Reference import Reference
 from dualsense_controller.core.enum import ConnectionType
 from dualsense_controller.core.report.in_report import InReport
+from dualsense_controller.core.report.in_report.enum import InReportGroup
 from dualsense_controller.core.state.BaseStates import BaseStates
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
 from dualsense_controller.core.state.mapping.typedef import MapFn
 from dualsense_controller.core.state.read_state.ReadState import ReadState
+from dualsense_controller.core.state.read_state.StateHistory import StateHistory
 from dualsense_controller.core.state.read_state.ValueCalc import ValueCalc
 from dualsense_controller.core.state.read_state.ValueCompare import ValueCompare
 from dualsense_controller.core.state.read_state.enum import ReadStateName
-from dualsense_controller.core.state.read_state.value_type import Accelerometer, Battery, Gyroscope, JoyStick, \
-    Orientation, TouchFinger, TriggerFeedback, Trigger
-from dualsense_controller.core.state.typedef import CompareFn, Number, StateValue, StateValueFn
+from dualsense_controller.core.state.read_state.value_type import Accelerometer, Battery, ControllerSnapshot, \
+    Gyroscope, JoyStick, Orientation, ReportTimestamps, TouchFinger, TriggerFeedback, Trigger
+from dualsense_controller.core.state.typedef import CompareFn, DeriveFn, FrameChanges, FrameChangesCallback, \
+    Number, StateName, StateValue, StateValueFn
 from dualsense_controller.core.util import check_value_restrictions
 
 
+# per part of the report: its shared cycle timestamp and the states to calculate,
+# each flagged whether only to calculate it on changed dependencies
+_UpdatePlan = list[tuple[InReportGroup, Reference[int], tuple[tuple[ReadState, bool], ...]]]
+
+_BT_01_GROUPS: Final[InReportGroup] = InReportGroup.STICKS | InReportGroup.TRIGGERS | InReportGroup.BUTTONS
+
+
 class ReadStates(BaseStates):
     _EVENT_UPDATE: Final[str] = '_EVENT_UPDATE'
+    _EVENT_FRAME_CHANGES: Final[str] = '_EVENT_FRAME_CHANGES'
 
     def __init__(
             self,
             state_value_mapper: StateValueMapper,
             enforce_update: bool = False,
             can_update_itself: bool = True,
+            lock_free: bool = False,
     ):
         super().__init__(state_value_mapper)
         # CONST
+        self._lock_free: Final[bool] = lock_free
         self._states_to_trigger_after_all_states_set: Final[list[ReadState]] = []
-        self._in_report_lockable: Final[Lockable[InReport]] = Lockable()
+        self._in_report_reference: Final[Reference[InReport]] = Reference()
+        # the thread calling update, the only one storing values of lock free states
+        self._reader_thread_id_reference: Final[Reference[int]] = Reference(threading.get_ident())
         # VAR
-        self._timestamp: int | None = None
+        # newly listened states have to be calculated once, even if their part of the report does not change
+        self._has_new_listeners: bool = False
+        # states to calculate per report, rebuilt in the reader thread after listeners have changed
+        self._listeners_version: int = 0
+        self._update_plan: _UpdatePlan = []
+        self._update_plan_key: tuple[int, ConnectionType] | None = None
+        # states recording a history, maintained by enable_history and disable_history
+        self._history_states: tuple[ReadState, ...] = ()
         self._update_emitter: Final[pyee.EventEmitter] = pyee.EventEmitter()
+        # all states are calculated for these listeners
+        self._has_frame_changes_listeners: bool = False
+        # user defined states calculated from other states, in the order added (inputs first)
+        self._derived_states: tuple[ReadState, ...] = ()
+        self._derived_update_plan: tuple[ReadState, ...] = ()
+        self._derived_cycle_timestamp: Final[Reference[int]] = Reference(0)
 
         # INIT STICKS
         self.left_stick: Final[ReadState[JoyStick]] = self._create_and_register_state(
             ReadStateName.LEFT_STICK,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             value_calc_fn=ValueCalc.get_left_stick,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
@@ -70,7 +98,7 @@ class ReadStates(BaseStates):
             ReadStateName.LEFT_STICK_X,
             depends_on=[self.left_stick],
             value_calc_fn=ValueCalc.get_left_stick_x,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             raw_to_mapped_fn=self._state_value_mapper.left_stick_x_raw_to_mapped,
@@ -80,7 +108,7 @@ class ReadStates(BaseStates):
             ReadStateName.LEFT_STICK_Y,
             depends_on=[self.left_stick],
             value_calc_fn=ValueCalc.get_left_stick_y,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             raw_to_mapped_fn=self._state_value_mapper.left_stick_y_raw_to_mapped,
@@ -89,7 +117,7 @@ class ReadStates(BaseStates):
         self.right_stick: Final[ReadState[JoyStick]] = self._create_and_register_state(
             ReadStateName.RIGHT_STICK,
             value_calc_fn=ValueCalc.get_right_stick,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             compare_fn=ValueCompare.compare_joystick,
@@ -116,7 +144,7 @@ class ReadStates(BaseStates):
             ReadStateName.RIGHT_STICK_X,
             depends_on=[self.right_stick],
             value_calc_fn=ValueCalc.get_right_stick_x,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             raw_to_mapped_fn=self._state_value_mapper.right_stick_x_raw_to_mapped,
@@ -126,7 +154,7 @@ class ReadStates(BaseStates):
             ReadStateName.RIGHT_STICK_Y,
             depends_on=[self.right_stick],
             value_calc_fn=ValueCalc.get_right_stick_y,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             raw_to_mapped_fn=self._state_value_mapper.right_stick_y_raw_to_mapped,
@@ -137,7 +165,7 @@ class ReadStates(BaseStates):
         self.gyroscope: Final[ReadState[Gyroscope]] = self._create_and_register_state(
             ReadStateName.GYROSCOPE,
             value_calc_fn=ValueCalc.get_gyroscope,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             default_value=Gyroscope(),
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
@@ -149,7 +177,7 @@ class ReadStates(BaseStates):
             ReadStateName.GYROSCOPE_X,
             depends_on=[self.gyroscope],
             value_calc_fn=ValueCalc.get_gyroscope_x,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -157,7 +185,7 @@ class ReadStates(BaseStates):
             ReadStateName.GYROSCOPE_Y,
             depends_on=[self.gyroscope],
             value_calc_fn=ValueCalc.get_gyroscope_y,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -165,7 +193,7 @@ class ReadStates(BaseStates):
             ReadStateName.GYROSCOPE_Z,
             depends_on=[self.gyroscope],
             value_calc_fn=ValueCalc.get_gyroscope_z,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -174,7 +202,7 @@ class ReadStates(BaseStates):
         self.accelerometer: Final[ReadState[Accelerometer]] = self._create_and_register_state(
             ReadStateName.ACCELEROMETER,
             value_calc_fn=ValueCalc.get_accelerometer,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             default_value=Accelerometer(),
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
@@ -186,7 +214,7 @@ class ReadStates(BaseStates):
             ReadStateName.ACCELEROMETER_X,
             depends_on=[self.accelerometer],
             value_calc_fn=ValueCalc.get_accelerometer_x,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -194,7 +222,7 @@ class ReadStates(BaseStates):
             ReadStateName.ACCELEROMETER_Y,
             depends_on=[self.accelerometer],
             value_calc_fn=ValueCalc.get_accelerometer_y,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -202,7 +230,7 @@ class ReadStates(BaseStates):
             ReadStateName.ACCELEROMETER_Z,
             depends_on=[self.accelerometer],
             value_calc_fn=ValueCalc.get_accelerometer_z,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -211,7 +239,7 @@ class ReadStates(BaseStates):
         self.orientation: Final[ReadState[Orientation]] = self._create_and_register_state(
             ReadStateName.ORIENTATION,
             value_calc_fn=ValueCalc.get_orientation,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             default_value=Orientation(0, 0, 0),
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
@@ -229,14 +257,14 @@ class ReadStates(BaseStates):
         self.dpad: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.DPAD,
             value_calc_fn=ValueCalc.get_dpad,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_up: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_UP,
             value_calc_fn=ValueCalc.get_btn_up,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             depends_on=[self.dpad],
@@ -244,7 +272,7 @@ class ReadStates(BaseStates):
         self.btn_left: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_LEFT,
             value_calc_fn=ValueCalc.get_btn_left,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             depends_on=[self.dpad],
@@ -252,7 +280,7 @@ class ReadStates(BaseStates):
         self.btn_down: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_DOWN,
             value_calc_fn=ValueCalc.get_btn_down,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             depends_on=[self.dpad],
@@ -260,7 +288,7 @@ class ReadStates(BaseStates):
         self.btn_right: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_RIGHT,
             value_calc_fn=ValueCalc.get_btn_right,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             depends_on=[self.dpad],
@@ -269,105 +297,105 @@ class ReadStates(BaseStates):
         self.btn_square: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_SQUARE,
             value_calc_fn=ValueCalc.get_btn_square,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_cross: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_CROSS,
             value_calc_fn=ValueCalc.get_btn_cross,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_circle: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_CIRCLE,
             value_calc_fn=ValueCalc.get_btn_circle,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_triangle: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_TRIANGLE,
             value_calc_fn=ValueCalc.get_btn_triangle,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_l1: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_L1,
             value_calc_fn=ValueCalc.get_btn_l1,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_r1: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_R1,
             value_calc_fn=ValueCalc.get_btn_r1,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_l2: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_L2,
             value_calc_fn=ValueCalc.get_btn_l2,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_r2: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_R2,
             value_calc_fn=ValueCalc.get_btn_r2,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_create: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_CREATE,
             value_calc_fn=ValueCalc.get_btn_create,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_options: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_OPTIONS,
             value_calc_fn=ValueCalc.btn_options,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_l3: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_L3,
             value_calc_fn=ValueCalc.get_btn_l3,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_r3: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_R3,
             value_calc_fn=ValueCalc.get_btn_r3,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_ps: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_PS,
             value_calc_fn=ValueCalc.get_btn_ps,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_touchpad: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_TOUCHPAD,
             value_calc_fn=ValueCalc.get_btn_touchpad,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.btn_mute: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BTN_MUTE,
             value_calc_fn=ValueCalc.get_btn_mute,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
@@ -376,35 +404,35 @@ class ReadStates(BaseStates):
         self.touch_finger_1_active: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_1_ACTIVE,
             value_calc_fn=ValueCalc.get_touch_finger_1_active,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_1_id: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_1_ID,
             value_calc_fn=ValueCalc.get_touch_finger_1_id,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_1_x: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_1_X,
             value_calc_fn=ValueCalc.get_touch_finger_1_x,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_1_y: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_1_Y,
             value_calc_fn=ValueCalc.get_touch_finger_1_y,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_1: Final[ReadState[TouchFinger]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_1,
             value_calc_fn=ValueCalc.get_touch_finger_1,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             compare_fn=ValueCompare.compare_touch_finger,
@@ -419,35 +447,35 @@ class ReadStates(BaseStates):
         self.touch_finger_2_active: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_2_ACTIVE,
             value_calc_fn=ValueCalc.get_touch_finger_2_active,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_2_id: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_2_ID,
             value_calc_fn=ValueCalc.get_touch_finger_2_id,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_2_x: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_2_X,
             value_calc_fn=ValueCalc.get_touch_finger_2_x,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_2_y: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_2_Y,
             value_calc_fn=ValueCalc.get_touch_finger_2_y,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.touch_finger_2: Final[ReadState[TouchFinger]] = self._create_and_register_state(
             ReadStateName.TOUCH_FINGER_2,
             value_calc_fn=ValueCalc.get_touch_finger_2,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             compare_fn=ValueCompare.compare_touch_finger,
@@ -463,7 +491,7 @@ class ReadStates(BaseStates):
         self.left_trigger_value: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.LEFT_TRIGGER_VALUE,
             value_calc_fn=ValueCalc.get_left_trigger_value,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             compare_fn=ValueCompare.compare_trigger_value,
@@ -483,21 +511,21 @@ class ReadStates(BaseStates):
         self.left_trigger_feedback_active: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.LEFT_TRIGGER_FEEDBACK_ACTIVE,
             value_calc_fn=ValueCalc.get_left_trigger_feedback_active,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.left_trigger_feedback_value: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.LEFT_TRIGGER_FEEDBACK_VALUE,
             value_calc_fn=ValueCalc.get_left_trigger_feedback_value,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.left_trigger_feedback: Final[ReadState[TriggerFeedback]] = self._create_and_register_state(
             ReadStateName.LEFT_TRIGGER_FEEDBACK,
             value_calc_fn=ValueCalc.get_left_trigger_feedback,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             depends_on=[self.left_trigger_feedback_active, self.left_trigger_feedback_value],
@@ -507,7 +535,7 @@ class ReadStates(BaseStates):
         self.right_trigger_value: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.RIGHT_TRIGGER_VALUE,
             value_calc_fn=ValueCalc.get_right_trigger_value,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             compare_fn=ValueCompare.compare_trigger_value,
@@ -527,21 +555,21 @@ class ReadStates(BaseStates):
         self.right_trigger_feedback_active: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.RIGHT_TRIGGER_FEEDBACK_ACTIVE,
             value_calc_fn=ValueCalc.get_right_trigger_feedback_active,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.right_trigger_feedback_value: Final[ReadState[int]] = self._create_and_register_state(
             ReadStateName.RIGHT_TRIGGER_FEEDBACK_VALUE,
             value_calc_fn=ValueCalc.get_right_trigger_feedback_value,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
         )
         self.right_trigger_feedback: Final[ReadState[TriggerFeedback]] = self._create_and_register_state(
             ReadStateName.RIGHT_TRIGGER_FEEDBACK,
             value_calc_fn=ValueCalc.get_right_trigger_feedback,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             depends_on=[self.right_trigger_feedback_active, self.right_trigger_feedback_value],
@@ -552,7 +580,7 @@ class ReadStates(BaseStates):
         self.battery_level_percentage: Final[ReadState[float]] = self._create_and_register_state(
             ReadStateName.BATTERY_LEVEL_PERCENT,
             value_calc_fn=ValueCalc.get_battery_level_percentage,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             ignore_none=False,
@@ -560,7 +588,7 @@ class ReadStates(BaseStates):
         self.battery_full: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BATTERY_FULL,
             value_calc_fn=ValueCalc.get_battery_full,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             ignore_none=False,
@@ -568,7 +596,7 @@ class ReadStates(BaseStates):
         self.battery_charging: Final[ReadState[bool]] = self._create_and_register_state(
             ReadStateName.BATTERY_CHARGING,
             value_calc_fn=ValueCalc.battery_charging,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             ignore_none=False,
@@ -576,7 +604,7 @@ class ReadStates(BaseStates):
         self.battery: Final[ReadState[Battery]] = self._create_and_register_state(
             ReadStateName.BATTERY,
             value_calc_fn=ValueCalc.get_battery,
-            in_report_lockable=self._in_report_lockable,
+            in_report_reference=self._in_report_reference,
             enforce_update=enforce_update,
             can_update_itself=can_update_itself,
             ignore_none=False,
@@ -584,6 +612,51 @@ class ReadStates(BaseStates):
             compare_fn=ValueCompare.compare_battery
         )
 
+        # states per part of the report, in the order to calculate them (dependencies first)
+        self._group_states: Final[tuple[tuple[InReportGroup, tuple[ReadState, ...]], ...]] = (
+            (InReportGroup.STICKS, (
+                # use values from stick because deadzone_raw calc is done there
+                self.left_stick, self.left_stick_x, self.left_stick_y,
+                self.right_stick, self.right_stick_x, self.right_stick_y,
+            )),
+            (InReportGroup.TRIGGERS, (
+                self.left_trigger_value, self.right_trigger_value,
+            )),
+            (InReportGroup.BUTTONS, (
+                self.dpad, self.btn_up, self.btn_down, self.btn_left, self.btn_right,
+                self.btn_cross, self.btn_r1, self.btn_square, self.btn_circle, self.btn_triangle,
+                self.btn_l1, self.btn_l2, self.btn_r2, self.btn_create, self.btn_options,
+                self.btn_l3, self.btn_r3, self.btn_ps, self.btn_mute, self.btn_touchpad,
+            )),
+            (InReportGroup.IMU, (
+                self.gyroscope, self.gyroscope_x, self.gyroscope_y, self.gyroscope_z,
+                self.accelerometer, self.accelerometer_x, self.accelerometer_y, self.accelerometer_z,
+                self.orientation,
+            )),
+            (InReportGroup.TOUCH_1, (
+                self.touch_finger_1_active, self.touch_finger_1_id, self.touch_finger_1_x, self.touch_finger_1_y,
+                self.touch_finger_1,
+            )),
+            (InReportGroup.TOUCH_2, (
+                self.touch_finger_2_active, self.touch_finger_2_id, self.touch_finger_2_x, self.touch_finger_2_y,
+                self.touch_finger_2,
+            )),
+            (InReportGroup.TRIGGER_FEEDBACK, (
+                self.left_trigger_feedback_active, self.left_trigger_feedback_value, self.left_trigger_feedback,
+                self.right_trigger_feedback_active, self.right_trigger_feedback_value, self.right_trigger_feedback,
+            )),
+            (InReportGroup.BATTERY, (
+                self.battery_level_percentage, self.battery_full, self.battery_charging, self.battery,
+            )),
+        )
+        # all states of a group are cycled at once
+        self._group_cycle_timestamps: Final[dict[InReportGroup, Reference[int]]] = {}
+        for group, states in self._group_states:
+            cycle_timestamp: Reference[int] = Reference(0)
+            self._group_cycle_timestamps[group] = cycle_timestamp
+            for state in states:
+                state.share_cycle_timestamp(cycle_timestamp)
+
     # #################### PRIVATE #######################
 
     def _create_and_register_state(
@@ -600,7 +673,7 @@ class ReadStates(BaseStates):
 
             # READ STATES
             value_calc_fn: StateValueFn = None,
-            in_report_lockable: Lockable[InReport] = None,
+            in_report_reference: Reference[InReport] = None,
             enforce_update: bool = False,
             can_update_itself: bool = True,
             depends_on: list[ReadState[Any]] = None,
@@ -620,7 +693,7 @@ class ReadStates(BaseStates):
             threshold=threshold,
         )
 
-        state: ReadState[StateValue] = ReadState[StateValue](
+        state: ReadState[StateValue] = ReadState(
             # BASE
             name=name,
             value=value,
@@ -629,31 +702,104 @@ class ReadStates(BaseStates):
             mapped_to_raw_fn=mapped_to_raw_fn,
             raw_to_mapped_fn=raw_to_mapped_fn,
             compare_fn=partial(compare_fn, **kwargs) if compare_fn is not None else None,
+            lock_free=self._lock_free,
             # READ STATE
             enforce_update=enforce_update,
             value_calc_fn=value_calc_fn,
             can_update_itself=can_update_itself,
-            in_report_lockable=in_report_lockable,
+            in_report_reference=in_report_reference,
             depends_on=depends_on,
             is_dependency_of=is_dependency_of,
+            on_listeners_changed=self._on_listeners_changed,
+            reader_thread_id_reference=self._reader_thread_id_reference,
         )
         self._register_state(name, state)
         return state
 
-    def _handle_state(
+    def _on_listeners_changed(self, added: bool) -> None:
+        if added:
+            self._has_new_listeners = True
+        self._listeners_version += 1
+
+    def _on_frame_changes_listeners_changed(self) -> None:
+        self._has_frame_changes_listeners = len(self._update_emitter.listeners(self._EVENT_FRAME_CHANGES)) > 0
+        self._on_listeners_changed(self._has_frame_changes_listeners)
+
+    def _build_update_plan(
             self,
-            state: ReadState[StateValue],
-    ) -> None:
-        state.set_cycle_timestamp(self._timestamp)
-        if state.is_updatable_from_outside:
-            state.calc_value(trigger_change_on_changed=False)
-            self._states_to_trigger_after_all_states_set.append(state)
+            connection_type: ConnectionType,
+            derived_update_plan: tuple[ReadState, ...],
+    ) -> _UpdatePlan:
+        # only states which are listened (or enforced) are calculated every time, states with dependencies whenever
+        # these have changed. Everything else is left to be calculated lazily on access.
+        # listened frame changes need all states to be calculated, calculated derived states all their inputs
+        groups: InReportGroup = _BT_01_GROUPS if connection_type == ConnectionType.BT_01 else InReportGroup.ALL
+        calc_all: bool = self._has_frame_changes_listeners
+        derived_inputs: set[ReadState] = self._get_inputs(derived_update_plan)
+        return [
+            (
+                group,
+                self._group_cycle_timestamps[group],
+                tuple(
+                    (state, not calc_all and not state.is_always_updatable_from_outside and state not in derived_inputs)
+                    for state in states
+                    if calc_all or state.is_always_updatable_from_outside or state.has_dependencies
+                    or state in derived_inputs
+                ),
+            )
+            for group, states in self._group_states
+            if group & groups
+        ]
+
+    def _build_derived_update_plan(self) -> tuple[ReadState, ...]:
+        # derived states used by calculated derived states are calculated as well
+        calc_all: bool = self._has_frame_changes_listeners
+        derived_inputs: set[ReadState] = set()
+        planned_states: list[ReadState] = []
+        for state in reversed(self._derived_states):
+            if calc_all or state.is_always_updatable_from_outside or state in derived_inputs:
+                planned_states.append(state)
+                derived_inputs.update(state.depends_on)
+        return tuple(reversed(planned_states))
+
+    @staticmethod
+    def _get_inputs(states: tuple[ReadState, ...]) -> set[ReadState]:
+        # all states the given ones are calculated from, directly or not
+        inputs: set[ReadState] = set()
+        states_to_visit: list[ReadState] = [input_state for state in states for input_state in state.depends_on]
+        while states_to_visit:
+            state: ReadState = states_to_visit.pop()
+            if state not in inputs:
+                inputs.add(state)
+                states_to_visit.extend(state.depends_on)
+        return inputs
+
+    def _remove_history_state(self, state: ReadState) -> None:
+        self._history_states = tuple(
+            history_state for history_state in self._history_states if history_state is not state
+        )
+
+    @staticmethod
+    def _calc_derived_value(derive_fn: DeriveFn, _in_report: InReport, *input_states: ReadState) -> Any:
+        return derive_fn(*(input_state.value for input_state in input_states))
 
     def _post_update(self):
         self._update_emitter.emit(self._EVENT_UPDATE)
-        for state in self._states_to_trigger_after_all_states_set:
+        states_to_trigger: list[ReadState] = self._states_to_trigger_after_all_states_set
+        for state in states_to_trigger:
             state.trigger_change_if_changed()
-        self._states_to_trigger_after_all_states_set.clear()
+        if self._has_frame_changes_listeners:
+            frame_changes: FrameChanges = tuple(
+                (state.name, state.last_value, state.value)
+                for state in states_to_trigger
+                if state.has_changed_since_last_set_value
+            )
+            if frame_changes:
+                self._update_emitter.emit(self._EVENT_FRAME_CHANGES, frame_changes)
+                # once listeners may have gone
+                if not self._update_emitter.listeners(self._EVENT_FRAME_CHANGES):
+                    self._on_frame_changes_listeners_changed()
+        states_to_trigger.clear()
 
     # #################### PUBLIC #######################
 
@@ -663,99 +809,179 @@ class ReadStates(BaseStates):
     def once_updated(self, callback: Callable[[], None]) -> None:
         self._update_emitter.once(self._EVENT_UPDATE, callback)
 
+    def enable_history(self, state_name: ReadStateName, capacity: int) -> StateHistory:
+        state: ReadState = self._get_state_by_name(state_name)
+        history: StateHistory = state.enable_history(capacity)
+        if state not in self._history_states:
+            self._history_states = (*self._history_states, state)
+        return history
+
+    def disable_history(self, state_name: ReadStateName) -> None:
+        state: ReadState = self._get_state_by_name(state_name)
+        self._remove_history_state(state)
+        state.disable_history()
+
+    # the state is calculated from the values of the input states by derive_fn, whenever one of them changed
+    def add_derived_state(self, name: str, inputs: list[StateName], derive_fn: DeriveFn) -> ReadState[Any]:
+        if name in self._states_dict:
+            raise ValueError(f'State {name} exists already')
+        # raises KeyError for unknown inputs, before the state is added to them
+        input_states: list[ReadState] = [self._get_state_by_name(input_name) for input_name in inputs]
+        state: ReadState[Any] = ReadState(
+            name=name,
+            ignore_none=False,
+            lock_free=self._lock_free,
+            value_calc_fn=partial(self._calc_derived_value, derive_fn),
+            in_report_reference=self._in_report_reference,
+            depends_on=input_states,
+            on_listeners_changed=self._on_listeners_changed,
+            reader_thread_id_reference=self._reader_thread_id_reference,
+        )
+        state.share_cycle_timestamp(self._derived_cycle_timestamp)
+        self._register_state(name, state)
+        self._derived_states = (*self._derived_states, state)
+        self._on_listeners_changed(False)
+        return state
+
+    def remove_derived_state(self, name: str) -> None:
+        state: ReadState = self._get_state_by_name(name)
+        if state not in self._derived_states:
+            raise ValueError(f'State {name} is not a derived state')
+        if any(state in derived_state.depends_on for derived_state in self._derived_states):
+            raise ValueError(f'State {name} is an input of another derived state')
+        self._derived_states = tuple(
+            derived_state for derived_state in self._derived_states if derived_state is not state
+        )
+        self._unregister_state(name)
+        self._remove_history_state(state)
+        for input_state in state.depends_on:
+            input_state.remove_as_dependency_of(state)
+        state.remove_all_change_listeners()
+
+    # called once per report with all changed states, after their own callbacks
+    def on_frame_changes(self, callback: FrameChangesCallback) -> None:
+        self._update_emitter.on(self._EVENT_FRAME_CHANGES, callback)
+        self._on_frame_changes_listeners_changed()
+
+    def once_frame_changes(self, callback: FrameChangesCallback) -> None:
+        self._update_emitter.once(self._EVENT_FRAME_CHANGES, callback)
+        self._on_frame_changes_listeners_changed()
+
+    def remove_frame_changes_listener(self, callback: FrameChangesCallback | None = None) -> None:
+        if callback is None:
+            self._update_emitter.remove_all_listeners(self._EVENT_FRAME_CHANGES)
+        else:
+            self._update_emitter.remove_listener(self._EVENT_FRAME_CHANGES, callback)
+        self._on_frame_changes_listeners_changed()
+
     def update(self, in_report: InReport, connection_type: ConnectionType) -> None:
+        timestamp: int = in_report.timestamp
+        self._in_report_reference.value = in_report
+        if self._lock_free:
+            self._reader_thread_id_reference.value = threading.get_ident()
+
+        # groups of states whose bytes have not changed since the previous report are skipped
+        update_all: bool = self._has_new_listeners
+        self._has_new_listeners = False
+        update_plan_key: tuple[int, ConnectionType] = (self._listeners_version, connection_type)
+        update_plan: _UpdatePlan = self._update_plan
+        if update_plan_key != self._update_plan_key:
+            # listeners changed while building lead to another build next time
+            self._derived_update_plan = self._build_derived_update_plan()
+            update_plan = self._update_plan = self._build_update_plan(connection_type, self._derived_update_plan)
+            self._update_plan_key = update_plan_key
+
+        states_to_trigger: list[ReadState] = self._states_to_trigger_after_all_states_set
+        for group, cycle_timestamp, planned_states in update_plan:
+            if not update_all and not in_report.has_changed(group):
+                continue
+            cycle_timestamp.value = timestamp
+            for state, only_on_changed_dependencies in planned_states:
+                if only_on_changed_dependencies and not state.has_changed_dependencies:
+                    continue
+                state.calc_value(trigger_change_on_changed=False)
+                states_to_trigger.append(state)
+        # after all states of the report, inputs first
+        self._derived_cycle_timestamp.value = timestamp
+        for state in self._derived_update_plan:
+            if update_all or state.has_changed_dependencies_at(timestamp):
+                state.calc_value(trigger_change_on_changed=False)
+                states_to_trigger.append(state)
+        # also unchanged values, to have one sample per report
+        for state in self._history_states:
+            state.record_history(timestamp)
+        self._post_update()
 
-        now_timestamp: int = time.perf_counter_ns()
-        diff_timestamp: int = now_timestamp - self._timestamp if self._timestamp is not None else 0
-        # print('diff_timestamp ns', diff_timestamp)
-
-        self._timestamp = now_timestamp
-        self._in_report_lockable.value = in_report
-
-        # #### ANALOG STICKS #####
-
-        self._handle_state(self.left_stick)
-        # use values from stick because deadzone_raw calc is done there
-        self._handle_state(self.left_stick_x)
-        self._handle_state(self.left_stick_y)
-
-        self._handle_state(self.right_stick)
-        # use values from stick because deadzone_raw calc is done there
-        self._handle_state(self.right_stick_x)
-        self._handle_state(self.right_stick_y)
-
-        # # ##### TRIGGERS #####
-        self._handle_state(self.left_trigger_value)
-        self._handle_state(self.right_trigger_value)
-        #
-        # # ##### BUTTONS #####
-        self._handle_state(self.dpad)
-        self._handle_state(self.btn_up)
-        self._handle_state(self.btn_down)
-        self._handle_state(self.btn_left)
-        self._handle_state(self.btn_right)
-
-        self._handle_state(self.btn_cross)
-        self._handle_state(self.btn_r1)
-        self._handle_state(self.btn_square)
-        self._handle_state(self.btn_circle)
-        self._handle_state(self.btn_triangle)
-        self._handle_state(self.btn_l1)
-        self._handle_state(self.btn_l2)
-        self._handle_state(self.btn_r2)
-        self._handle_state(self.btn_create)
-        self._handle_state(self.btn_options)
-        self._handle_state(self.btn_l3)
-        self._handle_state(self.btn_r3)
-        self._handle_state(self.btn_ps)
-        self._handle_state(self.btn_mute)
-        self._handle_state(self.btn_touchpad)
-
-        # following not supported for BT01
+    # from the values of the states, so the same as those of the properties. only called from the reader thread
+    # after update. values of parts of the report whose bytes did not change are taken from the previous snapshot,
+    # the others are calculated (which update did not do already for unlistened states)
+    def create_snapshot(
+            self,
+            connection_type: ConnectionType,
+            timestamps: ReportTimestamps,
+            previous: ControllerSnapshot | None = None,
+    ) -> ControllerSnapshot:
+        in_report: InReport = self._in_report_reference.value
+        sticks: bool = previous is None or in_report.has_changed(InReportGroup.STICKS)
+        triggers: bool = previous is None or in_report.has_changed(InReportGroup.TRIGGERS)
+        buttons: bool = previous is None or in_report.has_changed(InReportGroup.BUTTONS)
         if connection_type == ConnectionType.BT_01:
-            self._post_update()
-            return
-
-        # ##### GYRO #####
-
-        self._handle_state(self.gyroscope)
-        self._handle_state(self.gyroscope_x)
-        self._handle_state(self.gyroscope_y)
-        self._handle_state(self.gyroscope_z)
-        #
-        # ##### ACCEL #####
-        self._handle_state(self.accelerometer)
-        self._handle_state(self.accelerometer_x)
-        self._handle_state(self.accelerometer_y)
-        self._handle_state(self.accelerometer_z)
-        #
-        # ##### ORIENTATION #####
-        self._handle_state(self.orientation)
-        #
-        # ##### TOUCH 1 #####
-        self._handle_state(self.touch_finger_1_active)
-        self._handle_state(self.touch_finger_1_id)
-        self._handle_state(self.touch_finger_1_x)
-        self._handle_state(self.touch_finger_1_y)
-        self._handle_state(self.touch_finger_1)
-
-        # ##### TOUCH 2 #####
-        self._handle_state(self.touch_finger_2_active)
-        self._handle_state(self.touch_finger_2_id)
-        self._handle_state(self.touch_finger_2_x)
-        self._handle_state(self.touch_finger_2_y)
-        self._handle_state(self.touch_finger_2)
-
-        # ##### TRIGGER FEEDBACK INFO #####
-        self._handle_state(self.left_trigger_feedback_active)
-        self._handle_state(self.left_trigger_feedback_value)
-        self._handle_state(self.left_trigger_feedback)
-        self._handle_state(self.right_trigger_feedback_active)
-        self._handle_state(self.right_trigger_feedback_value)
-        self._handle_state(self.right_trigger_feedback)
-        # ##### BATTERY #####
-        self._handle_state(self.battery_level_percentage)
-        self._handle_state(self.battery_full)
-        self._handle_state(self.battery_charging)
-        self._handle_state(self.battery)
-        self._post_update()
+            gyroscope: Gyroscope | None = None
+            accelerometer: Accelerometer | None = None
+            orientation: Orientation | None = None
+            touch_finger_1: TouchFinger | None = None
+            touch_finger_2: TouchFinger | None = None
+            battery: Battery | None = None
+        else:
+            imu: bool = previous is None or in_report.has_changed(InReportGroup.IMU)
+            gyroscope = self.gyroscope.value if imu else previous.gyroscope
+            accelerometer = self.accelerometer.value if imu else previous.accelerometer
+            orientation = self.orientation.value if imu else previous.orientation
+            touch_finger_1 = (
+                self.touch_finger_1.value
+                if previous is None or in_report.has_changed(InReportGroup.TOUCH_1)
+                else previous.touch_finger_1
+            )
+            touch_finger_2 = (
+                self.touch_finger_2.value
+                if previous is None or in_report.has_changed(InReportGroup.TOUCH_2)
+                else previous.touch_finger_2
+            )
+            battery = (
+                self.battery.value
+                if previous is None or in_report.has_changed(InReportGroup.BATTERY)
+                else previous.battery
+            )
+        return ControllerSnapshot(
+            seq_num=in_report.frame.seq_num,
+            timestamps=timestamps,
+            left_stick=self.left_stick.value if sticks else previous.left_stick,
+            right_stick=self.right_stick.value if sticks else previous.right_stick,
+            left_trigger=self.left_trigger_value.value if triggers else previous.left_trigger,
+            right_trigger=self.right_trigger_value.value if triggers else previous.right_trigger,
+            btn_up=self.btn_up.value if buttons else previous.btn_up,
+            btn_down=self.btn_down.value if buttons else previous.btn_down,
+            btn_left=self.btn_left.value if buttons else previous.btn_left,
+            btn_right=self.btn_right.value if buttons else previous.btn_right,
+            btn_square=self.btn_square.value if buttons else previous.btn_square,
+            btn_cross=self.btn_cross.value if buttons else previous.btn_cross,
+            btn_circle=self.btn_circle.value if buttons else previous.btn_circle,
+            btn_triangle=self.btn_triangle.value if buttons else previous.btn_triangle,
+            btn_l1=self.btn_l1.value if buttons else previous.btn_l1,
+            btn_r1=self.btn_r1.value if buttons else previous.btn_r1,
+            btn_l2=self.btn_l2.value if buttons else previous.btn_l2,
+            btn_r2=self.btn_r2.value if buttons else previous.btn_r2,
+            btn_create=self.btn_create.value if buttons else previous.btn_create,
+            btn_options=self.btn_options.value if buttons else previous.btn_options,
+            btn_l3=self.btn_l3.value if buttons else previous.btn_l3,
+            btn_r3=self.btn_r3.value if buttons else previous.btn_r3,
+            btn_ps=self.btn_ps.value if buttons else previous.btn_ps,
+            btn_touchpad=self.btn_touchpad.value if buttons else previous.btn_touchpad,
+            btn_mute=self.btn_mute.value if buttons else previous.btn_mute,
+            gyroscope=gyroscope,
+            accelerometer=accelerometer,
+            orientation=orientation,
+            touch_finger_1=touch_finger_1,
+            touch_finger_2=touch_finger_2,
+            battery=battery,
+        )
@@ -0,0 +1,99 @@
+import math
+from array import array
+from typing import Final
+
+from dualsense_controller.core.state.typedef import Number
+
+
+class StateHistory:
+    """
+    Fixed number of the latest (timestamp, raw value) samples of a numeric state, one per report.
+    Appended by the reader thread only. Queries from other threads copy the samples and retry
+    if the reader has overwritten them meanwhile, so they take no lock.
+    Timestamps are nanoseconds (time.perf_counter_ns) when the reports were read, values are floats (NaN for None).
+    """
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return min(self._num_samples, self._capacity)
+
+    def __init__(self, capacity: int):
+        if capacity < 2:
+            raise ValueError(f'History needs a capacity of at least 2, got {capacity}')
+        self._capacity: Final[int] = capacity
+        # one spare slot, which is the one being written
+        self._size: Final[int] = capacity + 1
+        self._timestamps: Final[array] = array('q', bytes(8 * self._size))
+        self._values: Final[array] = array('d', bytes(8 * self._size))
+        # all samples ever appended, the next one goes to _num_samples % _size
+        self._num_samples: int = 0
+
+    def append(self, timestamp: int, value: Number | None) -> None:
+        index: int = self._num_samples % self._size
+        self._timestamps[index] = timestamp
+        self._values[index] = math.nan if value is None else value
+        # published after the sample has been written
+        self._num_samples += 1
+
+    def last(self, n: int) -> tuple[array, array]:
+        # timestamps and values of the latest n samples, oldest first
+        while True:
+            num_samples: int = self._num_samples
+            n = min(n, num_samples, self._capacity)
+            samples: tuple[array, array] = self._copy(num_samples - n, num_samples)
+            if self._is_valid(num_samples - n):
+                return samples
+
+    def window(self, ms: float) -> tuple[array, array]:
+        # timestamps and values of the samples within the given milliseconds before the latest one, oldest first
+        while True:
+            num_samples: int = self._num_samples
+            start: int = self._find_start(num_samples, ms)
+            samples: tuple[array, array] = self._copy(start, num_samples)
+            if self._is_valid(start):
+                return samples
+
+    def rate_of_change(self, ms: float | None = None) -> float:
+        # change of the value per second, between the latest two samples or over the given milliseconds
+        while True:
+            num_samples: int = self._num_samples
+            if num_samples < 2:
+                return 0.0
+            start: int = num_samples - 2 if ms is None else min(self._find_start(num_samples, ms), num_samples - 2)
+            first: int = start % self._size
+            latest: int = (num_samples - 1) % self._size
+            duration: int = self._timestamps[latest] - self._timestamps[first]
+            change: float = self._values[latest] - self._values[first]
+            if self._is_valid(start):
+                return change * 1e+9 / duration if duration > 0 else 0.0
+
+    # a sample is valid as long as the reader has not come around to its slot again
+    def _is_valid(self, sample: int) -> bool:
+        return self._num_samples - sample < self._size
+
+    def _find_start(self, num_samples: int, ms: float) -> int:
+        if num_samples == 0:
+            return 0
+        # binary search, timestamps increase with the samples
+        low: int = max(0, num_samples - self._capacity)
+        min_timestamp: int = self._timestamps[(num_samples - 1) % self._size] - int(ms * 1e+6)
+        high: int = num_samples - 1
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._timestamps[middle % self._size] < min_timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _copy(self, start: int, end: int) -> tuple[array, array]:
+        if start >= end:
+            return array('q'), array('d')
+        first: int = start % self._size
+        last: int = (end - 1) % self._size + 1
+        if first < last:
+            return self._timestamps[first:last], self._values[first:last]
+        return self._timestamps[first:] + self._timestamps[:last], self._values[first:] + self._values[:last]
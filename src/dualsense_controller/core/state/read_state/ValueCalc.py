@@ -1,6 +1,7 @@
 import math
 
 from dualsense_controller.core.report.in_report import InReport
+from dualsense_controller.core.report.in_report.InReportFrame import InReportFrame
 from dualsense_controller.core.state.State import State
 from dualsense_controller.core.state.read_state.value_type import Accelerometer, Battery, TriggerFeedback, Gyroscope, \
     JoyStick, \
@@ -56,7 +57,7 @@ class ValueCalc:
     # ########################################## GET ###############################################
     @classmethod
     def get_left_stick(cls, in_report: InReport) -> JoyStick:
-        return JoyStick(x=in_report.axes_0, y=in_report.axes_1)
+        return JoyStick(x=in_report.frame.left_stick_x, y=in_report.frame.left_stick_y)
 
     @classmethod
     def get_left_stick_x(cls, _: InReport, left_stick: State[JoyStick]) -> int:
@@ -68,7 +69,7 @@ class ValueCalc:
 
     @classmethod
     def get_right_stick(cls, in_report: InReport) -> JoyStick:
-        return JoyStick(x=in_report.axes_2, y=in_report.axes_3)
+        return JoyStick(x=in_report.frame.right_stick_x, y=in_report.frame.right_stick_y)
 
     @classmethod
     def get_right_stick_x(cls, _: InReport, right_stick: State[JoyStick]) -> int:
@@ -80,15 +81,15 @@ class ValueCalc:
 
     @classmethod
     def get_left_trigger_value(cls, in_report: InReport) -> int:
-        return in_report.axes_4
+        return in_report.frame.left_trigger
 
     @classmethod
     def get_right_trigger_value(cls, in_report: InReport) -> int:
-        return in_report.axes_5
+        return in_report.frame.right_trigger
 
     @classmethod
     def get_dpad(cls, in_report: InReport) -> int:
-        return in_report.buttons_0 & 0x0f
+        return in_report.frame.buttons & 0x0f
 
     @classmethod
     def get_btn_up(cls, _: InReport, dpad: State[int]) -> bool:
@@ -108,71 +109,68 @@ class ValueCalc:
 
     @classmethod
     def get_btn_cross(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_0 & 0x20)
+        return bool(in_report.frame.buttons & 0x000020)
 
     @classmethod
     def get_btn_r1(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x02)
+        return bool(in_report.frame.buttons & 0x000200)
 
     @classmethod
     def get_btn_square(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_0 & 0x10)
+        return bool(in_report.frame.buttons & 0x000010)
 
     @classmethod
     def get_btn_circle(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_0 & 0x40)
+        return bool(in_report.frame.buttons & 0x000040)
 
     @classmethod
     def get_btn_triangle(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_0 & 0x80)
+        return bool(in_report.frame.buttons & 0x000080)
 
     @classmethod
     def get_btn_l1(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x01)
+        return bool(in_report.frame.buttons & 0x000100)
 
     @classmethod
     def get_btn_l2(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x04)
+        return bool(in_report.frame.buttons & 0x000400)
 
     @classmethod
     def get_btn_r2(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x08)
+        return bool(in_report.frame.buttons & 0x000800)
 
     @classmethod
     def get_btn_create(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x10)
+        return bool(in_report.frame.buttons & 0x001000)
 
     @classmethod
     def btn_options(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x20)
+        return bool(in_report.frame.buttons & 0x002000)
 
     @classmethod
     def get_btn_l3(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x40)
+        return bool(in_report.frame.buttons & 0x004000)
 
     @classmethod
     def get_btn_r3(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_1 & 0x80)
+        return bool(in_report.frame.buttons & 0x008000)
 
     @classmethod
     def get_btn_ps(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_2 & 0x01)
+        return bool(in_report.frame.buttons & 0x010000)
 
     @classmethod
     def get_btn_mute(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_2 & 0x04)
+        return bool(in_report.frame.buttons & 0x040000)
 
     @classmethod
     def get_btn_touchpad(cls, in_report: InReport) -> bool:
-        return bool(in_report.buttons_2 & 0x02)
+        return bool(in_report.frame.buttons & 0x020000)
 
     @classmethod
     def get_gyroscope(cls, in_report: InReport) -> Gyroscope:
-        return Gyroscope(
-            x=cls._get_sensor_axis(in_report.gyro_x_1, in_report.gyro_x_0),
-            y=cls._get_sensor_axis(in_report.gyro_y_1, in_report.gyro_y_0),
-            z=cls._get_sensor_axis(in_report.gyro_z_1, in_report.gyro_z_0),
-        )
+        frame: InReportFrame = in_report.frame
+        return Gyroscope(x=frame.gyro_x, y=frame.gyro_y, z=frame.gyro_z)
 
     @classmethod
     def get_gyroscope_x(cls, _: InReport, gyroscope: State[Gyroscope]) -> int:
@@ -188,11 +186,8 @@ class ValueCalc:
 
     @classmethod
     def get_accelerometer(cls, in_report: InReport) -> Accelerometer:
-        return Accelerometer(
-            x=cls._get_sensor_axis(in_report.accel_x_1, in_report.accel_x_0),
-            y=cls._get_sensor_axis(in_report.accel_y_1, in_report.accel_y_0),
-            z=cls._get_sensor_axis(in_report.accel_z_1, in_report.accel_z_0),
-        )
+        frame: InReportFrame = in_report.frame
+        return Accelerometer(x=frame.accel_x, y=frame.accel_y, z=frame.accel_z)
 
     @classmethod
     def get_accelerometer_x(cls, _: InReport, accelerometer: State[Accelerometer]) -> int:
@@ -216,19 +211,19 @@ class ValueCalc:
 
     @classmethod
     def get_touch_finger_1_active(cls, in_report: InReport) -> bool:
-        return cls._get_touch_active(in_report.touch_1_0)
+        return in_report.frame.touch_1_active
 
     @classmethod
     def get_touch_finger_1_id(cls, in_report: InReport) -> int:
-        return cls._get_touch_id(in_report.touch_1_0)
+        return in_report.frame.touch_1_id
 
     @classmethod
     def get_touch_finger_1_x(cls, in_report: InReport) -> int:
-        return cls._get_touch_x(in_report.touch_1_2, in_report.touch_1_1)
+        return in_report.frame.touch_1_x
 
     @classmethod
     def get_touch_finger_1_y(cls, in_report: InReport) -> int:
-        return cls._get_touch_y(in_report.touch_1_3, in_report.touch_1_2)
+        return in_report.frame.touch_1_y
 
     @classmethod
     def get_touch_finger_1(
@@ -248,19 +243,19 @@ class ValueCalc:
 
     @classmethod
     def get_touch_finger_2_active(cls, in_report: InReport) -> bool:
-        return cls._get_touch_active(in_report.touch_2_0)
+        return in_report.frame.touch_2_active
 
     @classmethod
     def get_touch_finger_2_id(cls, in_report: InReport) -> int:
-        return cls._get_touch_id(in_report.touch_2_0)
+        return in_report.frame.touch_2_id
 
     @classmethod
     def get_touch_finger_2_x(cls, in_report: InReport) -> int:
-        return cls._get_touch_x(in_report.touch_2_2, in_report.touch_2_1)
+        return in_report.frame.touch_2_x
 
     @classmethod
     def get_touch_finger_2_y(cls, in_report: InReport) -> int:
-        return cls._get_touch_y(in_report.touch_2_3, in_report.touch_2_2)
+        return in_report.frame.touch_2_y
 
     @classmethod
     def get_touch_finger_2(
@@ -280,11 +275,11 @@ class ValueCalc:
 
     @classmethod
     def get_left_trigger_feedback_active(cls, in_report: InReport) -> bool:
-        return cls._get_trigger_feedback_active(in_report.left_trigger_feedback)
+        return cls._get_trigger_feedback_active(in_report.frame.left_trigger_feedback)
 
     @classmethod
     def get_left_trigger_feedback_value(cls, in_report: InReport) -> int:
-        return cls._get_trigger_feedback_value(in_report.left_trigger_feedback)
+        return cls._get_trigger_feedback_value(in_report.frame.left_trigger_feedback)
 
     @classmethod
     def get_left_trigger_feedback(cls, _: InReport, l2_feedback_active: State[bool],
@@ -296,11 +291,11 @@ class ValueCalc:
 
     @classmethod
     def get_right_trigger_feedback_active(cls, in_report: InReport) -> bool:
-        return cls._get_trigger_feedback_active(in_report.right_trigger_feedback)
+        return cls._get_trigger_feedback_active(in_report.frame.right_trigger_feedback)
 
     @classmethod
     def get_right_trigger_feedback_value(cls, in_report: InReport) -> int:
-        return cls._get_trigger_feedback_value(in_report.right_trigger_feedback)
+        return cls._get_trigger_feedback_value(in_report.frame.right_trigger_feedback)
 
     @classmethod
     def get_right_trigger_feedback(cls, _: InReport, r2_feedback_active: State[bool],
@@ -312,7 +307,7 @@ class ValueCalc:
 
     @classmethod
     def get_battery_level_percentage(cls, in_report: InReport) -> float:
-        batt_level_raw: int = in_report.battery_0 & 0x0f
+        batt_level_raw: int = in_report.frame.battery_0 & 0x0f
         if batt_level_raw > 8:
             batt_level_raw = 8
         batt_level: float = batt_level_raw / 8
@@ -320,11 +315,11 @@ class ValueCalc:
 
     @classmethod
     def get_battery_full(cls, in_report: InReport) -> bool:
-        return not not (in_report.battery_0 & 0x20)
+        return not not (in_report.frame.battery_0 & 0x20)
 
     @classmethod
     def battery_charging(cls, in_report: InReport) -> bool:
-        return not not (in_report.battery_1 & 0x08)
+        return not not (in_report.frame.battery_1 & 0x08)
 
     @classmethod
     def get_battery(
@@ -349,26 +344,3 @@ class ValueCalc:
     @classmethod
     def _get_trigger_feedback_value(cls, feedback: int) -> int:
         return feedback & 0xff
-
-    @classmethod
-    def _get_sensor_axis(cls, v1: int, v0: int) -> int:
-        res: int = ((v1 << 8) | v0)
-        if res > 0x7FFF:
-            res -= 0x10000
-        return res
-
-    @classmethod
-    def _get_touch_active(cls, t_0: int) -> bool:
-        return not (t_0 & 0x80)
-
-    @classmethod
-    def _get_touch_id(cls, t_0: int) -> int:
-        return t_0 & 0x7F
-
-    @classmethod
-    def _get_touch_x(cls, t_2: int, t_1: int) -> int:
-        return ((t_2 & 0x0F) << 8) | t_1
-
-    @classmethod
-    def _get_touch_y(cls, t_3: int, t_2: int) -> int:
-        return (t_3 << 4) | ((t_2 & 0xF0) >> 4)
@@ -15,6 +15,32 @@ class Connection:
     connection_type: ConnectionType = None
 
 
+@dataclass(frozen=True, slots=True)
+class Reconnection:
+    serial_number: str | None = None
+    # seconds from losing the connection until reconnected
+    duration: float = 0
+    attempts: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ReportTimestamps:
+    # nanoseconds (time.perf_counter_ns) when the report was read
+    host_timestamp: int = 0
+    # nanoseconds of the controller clock since connecting, None without sensor timestamps (Bluetooth simple mode)
+    device_timestamp: int | None = None
+    # nanoseconds from device to host clock, fitted over the recent reports
+    clock_offset: int | None = None
+    # parts per million the device clock runs slower than the host clock
+    clock_drift: float | None = None
+
+    @property
+    def device_timestamp_on_host(self) -> int | None:
+        if self.device_timestamp is None:
+            return None
+        return self.device_timestamp + self.clock_offset
+
+
 @dataclass(frozen=True, slots=True)
 class JoyStick:
     x: Number = _DEFAULT_NUMBER
@@ -67,3 +93,42 @@ class Orientation:
     pitch: float = _DEFAULT_NUMBER
     roll: float = _DEFAULT_NUMBER
     yaw: float | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class ControllerSnapshot:
+    """
+    All input values of one report, the same as the values of the properties (mapped, deadzones and thresholds
+    applied). IMU, orientation, touch and battery are None without sensor data (Bluetooth simple mode).
+    """
+    seq_num: int
+    timestamps: ReportTimestamps
+    left_stick: JoyStick
+    right_stick: JoyStick
+    left_trigger: Number
+    right_trigger: Number
+    btn_up: bool
+    btn_down: bool
+    btn_left: bool
+    btn_right: bool
+    btn_square: bool
+    btn_cross: bool
+    btn_circle: bool
+    btn_triangle: bool
+    btn_l1: bool
+    btn_r1: bool
+    btn_l2: bool
+    btn_r2: bool
+    btn_create: bool
+    btn_options: bool
+    btn_l3: bool
+    btn_r3: bool
+    btn_ps: bool
+    btn_touchpad: bool
+    btn_mute: bool
+    gyroscope: Gyroscope | None = None
+    accelerometer: Accelerometer | None = None
+    orientation: Orientation | None = None
+    touch_finger_1: TouchFinger | None = None
+    touch_finger_2: TouchFinger | None = None
+    battery: Battery | None = None
@@ -17,6 +17,9 @@ _StChCb2 = Callable[[Any, int | None], None]
 _StChCb3 = Callable[[Any, Any, int | None], None]
 _StChCb4 = Callable[[StateName, Any, Any, int | None], None]
 StateChangeCallback = _StChCb0 | _StChCb1 | _StChCb2 | _StChCb3 | _StChCb4
+# (state name, old value, new value) of all states changed by one report
+FrameChanges = tuple[tuple[StateName, Any, Any], ...]
+FrameChangesCallback = Callable[[FrameChanges], None]
 
 Number = int | float
 CompareResult = tuple[bool, StateValue]
@@ -24,3 +27,5 @@ _WrappedCompareFn = Callable[[StateValue, StateValue, ...], CompareResult]
 _CompareFn = Callable[[StateValue, StateValue], CompareResult]
 CompareFn = _WrappedCompareFn | _CompareFn
 StateValueFn = Callable[[InReport, ...], StateValue]
+# value of a derived state, from the values of its input states
+DeriveFn = Callable[..., Any]
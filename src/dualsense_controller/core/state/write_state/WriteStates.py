@@ -1,4 +1,6 @@
-from typing import Final
+from contextlib import contextmanager
+from threading import RLock
+from typing import Final, Generator
 
 from dualsense_controller.core.log import Log
 from dualsense_controller.core.report.out_report.OutReport import OutReport
@@ -8,6 +10,7 @@ from dualsense_controller.core.state.ValueCompare import ValueCompare
 from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
 from dualsense_controller.core.state.mapping.typedef import MapFn
 from dualsense_controller.core.state.typedef import CompareFn, StateChangeCallback, StateValue
+from dualsense_controller.core.typedef import EmptyCallback
 from dualsense_controller.core.state.write_state.enum import TriggerEffectMode, WriteStateName, LightbarPulseOptions, \
     PlayerLedsEnable, \
     FlagsPhysics, FlagsControls, LedOptions
@@ -23,7 +26,16 @@ class WriteStates(BaseStates):
     ):
         super().__init__(state_value_mapper)
 
-        self._has_changed: bool = False
+        # every committed change increments the change count, the out report is up-to-date,
+        # when it has been updated (and sent) with the current change count
+        self._change_count: int = 0
+        self._out_report_change_count: int = 0
+        self._sent_change_count: int = 0
+        self._change_depth: int = 0
+        self._changed_callbacks: Final[list[EmptyCallback]] = []
+        # changes (with all their part states) and building the out report exclude each other,
+        # so no out report gets only a part of a change
+        self._lock: Final[RLock] = RLock()
 
         # ################## MOTORS/RUMBLE
         self.left_motor: Final[State[int]] = self._create_and_register_state(
@@ -201,7 +213,10 @@ class WriteStates(BaseStates):
 
     @property
     def has_changed(self) -> bool:
-        return self._has_changed
+        return self._change_count != self._sent_change_count
+
+    def on_changed(self, callback: EmptyCallback) -> None:
+        self._changed_callbacks.append(callback)
 
     def set_value(self, name: WriteStateName, value: StateValue) -> None:
         state: State[StateValue] = self._get_state_by_name(name)
@@ -212,12 +227,20 @@ class WriteStates(BaseStates):
         state.set_value_without_triggering_change(value)
 
     def set_unchanged(self):
-        self._get_state_by_name(WriteStateName.FLAGS_CONTROLS).set_value_without_triggering_change(
-            FlagsControls.ALL_BUT_MUTE_LED
-        )
-        self._has_changed = False
+        with self._lock:
+            # changes committed after the last update_out_report stay pending for the next out report
+            if self._change_count == self._out_report_change_count:
+                self._get_state_by_name(WriteStateName.FLAGS_CONTROLS).set_value_without_triggering_change(
+                    FlagsControls.ALL_BUT_MUTE_LED
+                )
+            self._sent_change_count = self._out_report_change_count
 
     def update_out_report(self, out_report: OutReport):
+        with self._lock:
+            self._update_out_report(out_report)
+
+    def _update_out_report(self, out_report: OutReport):
+        self._out_report_change_count = self._change_count
         out_report.flags_physics = self.flags_physics.value_raw
         out_report.flags_controls = self.flags_controls.value_raw
 
@@ -282,7 +305,7 @@ class WriteStates(BaseStates):
             compare_fn: CompareFn = None,
             disable_change_detection: bool = False,
     ) -> State[StateValue]:
-        state: State[StateValue] = State[StateValue](
+        state: State[StateValue] = State(
             name=name,
             value=value,
             default_value=default_value,
@@ -296,52 +319,77 @@ class WriteStates(BaseStates):
         state.on_change(on_state_change_cb if on_state_change_cb is not None else self._on_state_change)
         return state
 
+    @contextmanager
+    def _change(self) -> Generator[None, None, None]:
+        # composed states set their part states first, callbacks are called once everything is set
+        is_committed: bool = False
+        try:
+            with self._lock:
+                self._change_depth += 1
+                try:
+                    yield
+                finally:
+                    self._change_depth -= 1
+                    self._change_count += 1
+                    is_committed = self._change_depth == 0
+        finally:
+            if is_committed:
+                for callback in self._changed_callbacks:
+                    callback()
+
     def _on_state_change(self) -> None:
-        self._has_changed = True
+        with self._change():
+            pass
 
+    # composed values are read again under the lock, so the latest one wins if set by several threads at once
     def _on_microphone_changed(self, mic: Microphone) -> None:
-        self.microphone_mute.value = mic.mute
-        self.microphone_led.value = mic.led
-        self._has_changed = True
+        with self._change():
+            mic = self.microphone.value
+            self.microphone_mute.value = mic.mute
+            self.microphone_led.value = mic.led
 
     def _on_player_leds_changed(self, leds: PlayerLeds) -> None:
-        self.player_leds_enable.value = leds.enable
-        self.player_leds_brightness.value = leds.brightness
-        self._has_changed = True
+        with self._change():
+            leds = self.player_leds.value
+            self.player_leds_enable.value = leds.enable
+            self.player_leds_brightness.value = leds.brightness
 
     def _on_lightbar_changed(self, lb: Lightbar) -> None:
-        self.lightbar_red.value = lb.red
-        self.lightbar_green.value = lb.green
-        self.lightbar_blue.value = lb.blue
-        self.lightbar_on_off.value = lb.is_on
-        self.lightbar_pulse_options.value = lb.pulse_options
-        self._has_changed = True
+        with self._change():
+            lb = self.lightbar.value
+            self.lightbar_red.value = lb.red
+            self.lightbar_green.value = lb.green
+            self.lightbar_blue.value = lb.blue
+            self.lightbar_on_off.value = lb.is_on
+            self.lightbar_pulse_options.value = lb.pulse_options
 
     def _on_microphone_led_changed(self) -> None:
-        # Remove mic control flag to allow setting brightness
-        self.flags_controls.set_value_without_triggering_change(FlagsControls.ALL)
-        self._has_changed = True
+        with self._change():
+            # Remove mic control flag to allow setting brightness
+            self.flags_controls.set_value_without_triggering_change(FlagsControls.ALL)
 
     def _on_left_trigger_effect_changed(self, left_trigger_effect: TriggerEffect) -> None:
         Log.verbose('_on_left_trigger_effect_changed', left_trigger_effect)
-        self.left_trigger_effect_mode.value = left_trigger_effect.mode
-        self.left_trigger_effect_param1.value = left_trigger_effect.param1
-        self.left_trigger_effect_param2.value = left_trigger_effect.param2
-        self.left_trigger_effect_param3.value = left_trigger_effect.param3
-        self.left_trigger_effect_param4.value = left_trigger_effect.param4
-        self.left_trigger_effect_param5.value = left_trigger_effect.param5
-        self.left_trigger_effect_param6.value = left_trigger_effect.param6
-        self.left_trigger_effect_param7.value = left_trigger_effect.param7
-        self._has_changed = True
+        with self._change():
+            left_trigger_effect = self.left_trigger_effect.value
+            self.left_trigger_effect_mode.value = left_trigger_effect.mode
+            self.left_trigger_effect_param1.value = left_trigger_effect.param1
+            self.left_trigger_effect_param2.value = left_trigger_effect.param2
+            self.left_trigger_effect_param3.value = left_trigger_effect.param3
+            self.left_trigger_effect_param4.value = left_trigger_effect.param4
+            self.left_trigger_effect_param5.value = left_trigger_effect.param5
+            self.left_trigger_effect_param6.value = left_trigger_effect.param6
+            self.left_trigger_effect_param7.value = left_trigger_effect.param7
 
     def _on_right_trigger_effect_changed(self, right_trigger_effect: TriggerEffect) -> None:
         Log.verbose('_on_right_trigger_effect_changed', right_trigger_effect)
-        self.right_trigger_effect_mode.value = right_trigger_effect.mode
-        self.right_trigger_effect_param1.value = right_trigger_effect.param1
-        self.right_trigger_effect_param2.value = right_trigger_effect.param2
-        self.right_trigger_effect_param3.value = right_trigger_effect.param3
-        self.right_trigger_effect_param4.value = right_trigger_effect.param4
-        self.right_trigger_effect_param5.value = right_trigger_effect.param5
-        self.right_trigger_effect_param6.value = right_trigger_effect.param6
-        self.right_trigger_effect_param7.value = right_trigger_effect.param7
-        self._has_changed = True
+        with self._change():
+            right_trigger_effect = self.right_trigger_effect.value
+            self.right_trigger_effect_mode.value = right_trigger_effect.mode
+            self.right_trigger_effect_param1.value = right_trigger_effect.param1
+            self.right_trigger_effect_param2.value = right_trigger_effect.param2
+            self.right_trigger_effect_param3.value = right_trigger_effect.param3
+            self.right_trigger_effect_param4.value = right_trigger_effect.param4
+            self.right_trigger_effect_param5.value = right_trigger_effect.param5
+            self.right_trigger_effect_param6.value = right_trigger_effect.param6
+            self.right_trigger_effect_param7.value = right_trigger_effect.param7
@@ -1,4 +1,4 @@
-from typing import Callable, TypeVar
+from typing import Callable, Protocol, TypeVar
 
 from dualsense_controller.core.Benchmarker import Benchmark
 
@@ -7,3 +7,13 @@ UpdateBenchmarkCallback = Callable[[Benchmark], None]
 EmptyCallback = Callable[[], None]
 BatteryLowCallback = Callable[[float], None]
 LockableValue = TypeVar('LockableValue')
+
+
+# device info of any transport (hidapi or hidraw)
+class DeviceInfo(Protocol):
+    path: bytes
+    vendor_id: int
+    product_id: int
+    serial_number: str | None
+    product_string: str | None
+    interface_number: int
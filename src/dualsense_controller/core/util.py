@@ -2,8 +2,9 @@ import inspect
 import statistics
 import traceback
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 from types import FrameType
-from typing import Any
+from typing import Any, Callable, Sequence, TypeVar
 
 
 def flag(bit: int) -> int:
@@ -22,6 +23,29 @@ def get_referencing_class() -> Any:
     return calling_frame.f_locals.get("self")
 
 
+_T = TypeVar('_T')
+
+
+def call_all_parallel(
+        items: Sequence[_T],
+        fn: Callable[[_T], Any],
+        rollback_fn: Callable[[_T], Any] | None = None,
+) -> None:
+    if len(items) == 0:
+        return
+    # one worker per item, the calls mostly wait for devices
+    with ThreadPoolExecutor(max_workers=len(items)) as executor:
+        futures: list[Future] = [executor.submit(fn, item) for item in items]
+    exceptions: list[BaseException] = [future.exception() for future in futures if future.exception() is not None]
+    if len(exceptions) == 0:
+        return
+    if rollback_fn is not None:
+        for item, future in zip(items, futures):
+            if future.exception() is None:
+                rollback_fn(item)
+    raise exceptions[0]
+
+
 _Num = int | float
 
 
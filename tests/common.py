@@ -1,4 +1,6 @@
+import time
 from dataclasses import dataclass
+from typing import Callable
 
 from dualsense_controller.api.DualSenseController import DualSenseController, Mapping
 from dualsense_controller.api.enum import UpdateLevel
@@ -17,9 +19,24 @@ class ControllerInstanceParams:
     gyroscope_threshold: int = 0
     orientation_threshold: int = 0
     accelerometer_threshold: int = 0
+    independent_writer: bool = False
+    max_write_rate: float | None = None
+    skip_queued_in_reports: bool = False
+    in_report_buffer_size: int = 0
+    lock_free_states: bool = False
 
 
 @dataclass
 class ControllerInstanceData:
     controller: DualSenseController
     mocked_hidapi_device: MockedHidapiMockedHidapiDevice
+
+
+# polls until the predicate holds, False on timeout
+def wait_for(predicate: Callable[[], bool], timeout: float = 2.0) -> bool:
+    deadline: float = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
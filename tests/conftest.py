@@ -1,3 +1,4 @@
+from pathlib import Path
 from typing import Generator
 from unittest.mock import MagicMock, Mock, patch
 
@@ -7,14 +8,17 @@ from pytest_mock import MockerFixture
 
 from dualsense_controller.api.DualSenseController import DualSenseController
 from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.hidraw import hidraw
 from tests.common import ControllerInstanceData, ControllerInstanceParams
 from tests.mock.MockedHidapiMockedHidapiDevice import MockedHidapiMockedHidapiDevice
 from tests.mock.common import DeviceInfoMock
 
 
 @pytest.fixture
-def fixture_device_info_mock() -> DeviceInfoMock:
-    return DeviceInfoMock()
+def fixture_device_info_mock(fixture_params_for_mocked_hidapi_device: ConnectionType | None) -> DeviceInfoMock:
+    # only USB devices have an interface number
+    is_usb: bool = fixture_params_for_mocked_hidapi_device in (None, ConnectionType.USB_01)
+    return DeviceInfoMock(interface_number=3 if is_usb else -1)
 
 
 @pytest.fixture
@@ -77,6 +81,11 @@ def fixture_controller_instance(
             gyroscope_threshold=params.gyroscope_threshold,
             orientation_threshold=params.orientation_threshold,
             accelerometer_threshold=params.accelerometer_threshold,
+            independent_writer=params.independent_writer,
+            max_write_rate=params.max_write_rate,
+            skip_queued_in_reports=params.skip_queued_in_reports,
+            in_report_buffer_size=params.in_report_buffer_size,
+            lock_free_states=params.lock_free_states,
         ),
 
         mocked_hidapi_device=fixture_mocked_hidapi_device
@@ -95,3 +104,42 @@ def fixture_activated_instance(
     yield fixture_controller_instance
     # deactivate
     fixture_controller_instance.controller.deactivate()
+
+
+def create_hidraw_node(sysfs_dir: Path, node_name: str, uevent: str, device_name: str | None = None) -> None:
+    device_dir: Path = sysfs_dir / node_name / 'device'
+    if device_name is None:
+        device_dir.mkdir(parents=True)
+    else:
+        # like in sysfs, where device links to the HID parent device
+        target_dir: Path = sysfs_dir / node_name / device_name
+        target_dir.mkdir(parents=True)
+        device_dir.symlink_to(target_dir)
+    (device_dir / 'uevent').write_text(uevent)
+
+
+@pytest.fixture
+def fixture_sysfs_hidraw_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    create_hidraw_node(tmp_path, 'hidraw10', (
+        'DRIVER=playstation\n'
+        'HID_ID=0005:0000054C:00000CE6\n'
+        'HID_NAME=DualSense Wireless Controller\n'
+        'HID_PHYS=a0:ab:51:00:00:01\n'
+        'HID_UNIQ=a0:ab:51:a2:8c:1c\n'
+    ))
+    create_hidraw_node(tmp_path, 'hidraw2', (
+        'DRIVER=playstation\n'
+        'HID_ID=0003:0000054C:00000CE6\n'
+        'HID_NAME=Sony Interactive Entertainment DualSense Wireless Controller\n'
+        'HID_PHYS=usb-0000:00:14.0-2/input3\n'
+        'HID_UNIQ=a0:ab:51:a2:8c:1b\n'
+    ))
+    create_hidraw_node(tmp_path, 'hidraw1', (
+        'DRIVER=hid-generic\n'
+        'HID_ID=0003:0000046D:0000C52B\n'
+        'HID_NAME=Logitech USB Receiver\n'
+        'HID_PHYS=usb-0000:00:14.0-1/input2\n'
+        'HID_UNIQ=\n'
+    ))
+    monkeypatch.setattr(hidraw, '_SYSFS_HIDRAW_DIR', str(tmp_path))
+    return tmp_path
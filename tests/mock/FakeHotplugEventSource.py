@@ -0,0 +1,30 @@
+import queue
+
+from dualsense_controller.core.hotplug.HotplugEventSource import HotplugAction, HotplugEvent, HotplugEventSource
+
+
+class FakeHotplugEventSource(HotplugEventSource):
+
+    def __init__(self):
+        self._events: queue.Queue[HotplugEvent | None] = queue.Queue()
+        self.is_opened: bool = False
+        self.num_waits: int = 0
+
+    def emit(self, action: HotplugAction, path: bytes | None = None) -> None:
+        self._events.put(HotplugEvent(action=action, path=path))
+
+    def open(self) -> None:
+        self.is_opened = True
+
+    def close(self) -> None:
+        self.is_opened = False
+
+    def next_event(self, timeout: float | None = None) -> HotplugEvent | None:
+        self.num_waits += 1
+        try:
+            return self._events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def wakeup(self) -> None:
+        self._events.put(None)
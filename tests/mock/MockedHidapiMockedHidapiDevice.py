@@ -1,3 +1,5 @@
+import time
+
 from dualsense_controller.core.enum import ConnectionType
 from dualsense_controller.core.report.in_report.InReport import InReport
 from dualsense_controller.core.report.in_report.Bt01InReport import Bt01InReport
@@ -11,6 +13,13 @@ class _BaseMockedHidapiDevice:
 
     def __init__(self, conn_type: ConnectionType = ConnectionType.USB_01):
         self._in_report: InReport | None = None
+        self.written: list[bytes] = []
+        # number of reports which can be read without blocking
+        self.num_queued_in_reports: int = 0
+        # simulates an unplugged device
+        self.disconnected: bool = False
+        # simulates a device which does not send any report
+        self.silent: bool = False
         match conn_type:
             case ConnectionType.USB_01:
                 self._in_report = Usb01InReport(raw_bytes=bytearray(
@@ -32,11 +41,29 @@ class _BaseMockedHidapiDevice:
                 ))
 
     def write(self, data: bytes):
-        pass
+        self.written.append(data)
 
-    def read(self, _: int, **kwargs) -> bytes:
+    def read(self, _: int, **kwargs) -> bytes | None:
+        if self.disconnected:
+            raise OSError('device disconnected')
+        if self.silent:
+            return None
         return self._in_report.raw_bytes
 
+    def readinto(self, buffer: bytearray, timeout_ms: int | None = None) -> int:
+        if self.disconnected:
+            raise OSError('device disconnected')
+        if self.silent:
+            time.sleep(0.001)
+            return 0
+        if timeout_ms == 0 and self.num_queued_in_reports == 0:
+            return 0
+        if timeout_ms == 0:
+            self.num_queued_in_reports -= 1
+        raw_bytes: bytearray = self._in_report.raw_bytes
+        buffer[:len(raw_bytes)] = raw_bytes
+        return len(raw_bytes)
+
     def close(self):
         pass
 
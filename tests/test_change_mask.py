@@ -0,0 +1,55 @@
+import pytest as pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.enum import InReportGroup
+from tests.common import ControllerInstanceData
+from tests.mock.MockedHidapiMockedHidapiDevice import MockedHidapiMockedHidapiDevice
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize('conn_type', [ConnectionType.USB_01, ConnectionType.BT_31])
+def test_changed_groups(conn_type: ConnectionType) -> None:
+    in_report: InReport = MockedHidapiMockedHidapiDevice(conn_type)._in_report
+    in_report.update(in_report.raw_bytes)
+    assert in_report.changed_groups == InReportGroup.ALL
+    in_report.update(in_report.raw_bytes)
+    assert in_report.changed_groups == InReportGroup(0)
+
+    in_report.timestamp_0 = (in_report.timestamp_0 + 1) & 0xff
+    in_report.gyro_y_1 = (in_report.gyro_y_1 + 1) & 0xff
+    in_report.update(in_report.raw_bytes)
+    assert in_report.changed_groups == InReportGroup.IMU
+    assert in_report.has_changed(InReportGroup.IMU)
+    assert not in_report.has_changed(InReportGroup.BUTTONS)
+
+    in_report.axes_5 = (in_report.axes_5 + 1) & 0xff
+    in_report.touch_2_3 = (in_report.touch_2_3 + 1) & 0xff
+    in_report.battery_1 = (in_report.battery_1 + 1) & 0xff
+    in_report.update(in_report.raw_bytes)
+    assert in_report.changed_groups == InReportGroup.TRIGGERS | InReportGroup.TOUCH_2 | InReportGroup.BATTERY
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_listener_added_while_unchanged(
+        fixture_params_for_mocked_hidapi_device: ConnectionType,
+        fixture_activated_instance: ControllerInstanceData,
+) -> None:
+    # the mocked device sends the same report all the time
+    fixture_activated_instance.controller.wait_until_updated()
+    fixture_activated_instance.controller.wait_until_updated()
+    assert fixture_activated_instance.controller.changed_in_report_groups == InReportGroup(0)
+
+    values: list[bool] = []
+    fixture_activated_instance.controller.btn_triangle.on_change(lambda pressed: values.append(pressed))
+    fixture_activated_instance.controller.wait_until_updated()
+    fixture_activated_instance.mocked_hidapi_device._in_report.buttons_0 |= 0x80
+    # two reports later the change has been processed for sure
+    fixture_activated_instance.controller.wait_until_updated()
+    fixture_activated_instance.controller.wait_until_updated()
+    assert values == [True]
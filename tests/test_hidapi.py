@@ -0,0 +1,88 @@
+import sys
+from types import ModuleType
+
+import pytest as pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.hidapi import Device, ffi
+from tests.mock.MockedHidapiMockedHidapiDevice import MockedHidapiMockedHidapiDevice
+
+hidapi_module: ModuleType = sys.modules['dualsense_controller.core.hidapi.hidapi']
+
+
+class MockedHidapiLib:
+
+    def __init__(self, in_report_bytes: bytes):
+        self.in_report_bytes: bytes = in_report_bytes
+        self.bufps: list = []
+        self.timeouts: list[int] = []
+
+    def hid_open_path(self, path: bytes) -> object:
+        return object()
+
+    def hid_close(self, device: object) -> None:
+        pass
+
+    def hid_read(self, device: object, bufp, length: int) -> int:
+        self.bufps.append(bufp)
+        size: int = min(length, len(self.in_report_bytes))
+        ffi.buffer(bufp, length)[:size] = self.in_report_bytes[:size]
+        return size
+
+    def hid_read_timeout(self, device: object, bufp, length: int, timeout_ms: int) -> int:
+        self.timeouts.append(timeout_ms)
+        return self.hid_read(device, bufp, length)
+
+
+@pytest.fixture
+def fixture_mocked_hidapi_lib(monkeypatch: pytest.MonkeyPatch) -> MockedHidapiLib:
+    in_report: bytes = bytes(MockedHidapiMockedHidapiDevice(ConnectionType.USB_01)._in_report.raw_bytes)
+    lib: MockedHidapiLib = MockedHidapiLib(in_report)
+    monkeypatch.setattr(hidapi_module, 'hidapi', lib)
+    return lib
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_device_readinto(fixture_mocked_hidapi_lib: MockedHidapiLib) -> None:
+    lib: MockedHidapiLib = fixture_mocked_hidapi_lib
+    device: Device = Device(path=b'/dev/hidraw0')
+    buffer: bytearray = bytearray(len(lib.in_report_bytes))
+
+    assert device.readinto(buffer) == len(lib.in_report_bytes)
+    assert buffer == lib.in_report_bytes
+
+    # smaller reports only fill the beginning of the buffer
+    lib.in_report_bytes = b'\x01\x80\x7f'
+    assert device.readinto(buffer, timeout_ms=0) == 3
+    assert buffer[:3] == b'\x01\x80\x7f'
+    assert lib.timeouts == [0]
+    device.close()
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_device_readinto_reuses_buffer_pointer(fixture_mocked_hidapi_lib: MockedHidapiLib) -> None:
+    lib: MockedHidapiLib = fixture_mocked_hidapi_lib
+    device: Device = Device(path=b'/dev/hidraw0')
+    front: bytearray = bytearray(64)
+    back: bytearray = bytearray(64)
+
+    device.readinto(front)
+    device.readinto(front)
+    assert lib.bufps[0] is lib.bufps[1]
+    assert len(device._readinto_bufps) == 1
+
+    device.readinto(back)
+    assert lib.bufps[2] is not lib.bufps[0]
+    assert len(device._readinto_bufps) == 2
+    assert back == front
+
+    # alternating between both buffers does not create new pointers
+    device.readinto(front)
+    device.readinto(back)
+    assert lib.bufps[3] is lib.bufps[0]
+    assert lib.bufps[4] is lib.bufps[2]
+    assert len(device._readinto_bufps) == 2
+    device.close()
+
+    with pytest.raises(IOError):
+        device.readinto(front)
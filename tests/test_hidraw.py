@@ -0,0 +1,109 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest as pytest
+
+from dualsense_controller.core.hidraw import hidraw
+from tests.conftest import create_hidraw_node
+
+# loading hidapi fails like without the native library, the hidraw transport must work nevertheless
+_OPEN_WITHOUT_HIDAPI_SCRIPT: str = '''
+import sys
+import threading
+
+
+class HidapiBlocker:
+
+    def find_spec(self, name, path, target=None):
+        if name == 'dualsense_controller.core.hidapi' or name.startswith('dualsense_controller.core.hidapi.'):
+            raise OSError('Could not find any hidapi library')
+        return None
+
+
+sys.meta_path.insert(0, HidapiBlocker())
+
+import dualsense_controller
+from dualsense_controller import HidTransport
+from dualsense_controller.core import hidraw
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+
+hidraw.hidraw._SYSFS_HIDRAW_DIR = sys.argv[1]
+hidraw.hidraw._DEV_DIR = sys.argv[2]
+
+device = HidControllerDevice(0, transport=HidTransport.HIDRAW)
+received = threading.Event()
+device.on_in_report(lambda in_report: received.set())
+device.open(timeout=1)
+with open(sys.argv[2] + '/hidraw2', 'wb', buffering=0) as node:
+    node.write(bytes([0x01]) + bytes(63))
+assert received.wait(2)
+assert device.transport == HidTransport.HIDRAW
+# not closed, the reader thread would wait for the next report of the fifo
+assert 'dualsense_controller.core.hidapi' not in sys.modules
+'''
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_enumerate(fixture_sysfs_hidraw_dir: Path) -> None:
+    assert [info.path for info in hidraw.enumerate()] == [b'/dev/hidraw1', b'/dev/hidraw2', b'/dev/hidraw10']
+
+    infos: list[hidraw.DeviceInfo] = hidraw.enumerate(vendor_id=0x054c, product_id=0x0ce6)
+    assert [info.path for info in infos] == [b'/dev/hidraw2', b'/dev/hidraw10']
+
+    usb, bluetooth = infos
+    assert usb.bus_type == hidraw.BUS_USB
+    assert usb.interface_number == 3
+    assert usb.serial_number == 'a0:ab:51:a2:8c:1b'
+    assert bluetooth.bus_type == hidraw.BUS_BLUETOOTH
+    assert bluetooth.interface_number == -1
+    assert bluetooth.serial_number == 'a0:ab:51:a2:8c:1c'
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_enumerate_filters_by_device_link(fixture_sysfs_hidraw_dir: Path) -> None:
+    # uevent pretends to be a DualSense, but the HID device name tells otherwise
+    create_hidraw_node(fixture_sysfs_hidraw_dir, 'hidraw3', (
+        'HID_ID=0003:0000054C:00000CE6\n'
+        'HID_UNIQ=ff:ff:ff:ff:ff:ff\n'
+    ), device_name='0003:0000046D:0000C52B.0004')
+    assert b'/dev/hidraw3' in [info.path for info in hidraw.enumerate()]
+    assert [info.path for info in hidraw.enumerate(vendor_id=0x054c, product_id=0x0ce6)] == [
+        b'/dev/hidraw2', b'/dev/hidraw10'
+    ]
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_device_read_write(tmp_path: Path) -> None:
+    fifo_path: Path = tmp_path / 'hidraw0'
+    os.mkfifo(fifo_path)
+    device: hidraw.Device = hidraw.Device(str(fifo_path))
+
+    buffer: bytearray = bytearray(8)
+    assert device.readinto(buffer, timeout_ms=0) == 0
+
+    device.write(b'\x01\x80\x81')
+    assert device.readinto(buffer, timeout_ms=100) == 3
+    assert buffer[:3] == b'\x01\x80\x81'
+
+    device.write(b'\x02\x7f')
+    assert device.read(8, timeout_ms=100) == b'\x02\x7f'
+    assert device.read(8, timeout_ms=1) is None
+
+    device.close()
+    with pytest.raises(OSError):
+        device.fileno()
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_open_without_hidapi_library(fixture_sysfs_hidraw_dir: Path, tmp_path_factory: pytest.TempPathFactory) -> None:
+    dev_dir: Path = tmp_path_factory.mktemp('dev')
+    os.mkfifo(dev_dir / 'hidraw2')
+    result: subprocess.CompletedProcess = subprocess.run(
+        [sys.executable, '-c', _OPEN_WITHOUT_HIDAPI_SCRIPT, str(fixture_sysfs_hidraw_dir), str(dev_dir)],
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,177 @@
+import threading
+
+import pytest as pytest
+
+from dualsense_controller.api.DualSenseController import DualSenseController
+from dualsense_controller.core.HidReactor import HidReactor
+from dualsense_controller.core.InReportDoubleBuffer import InReportDoubleBuffer
+from dualsense_controller.core.InReportRingBuffer import InReportRingBuffer, InReportRingBufferStats
+from dualsense_controller.core.enum import ConnectionType, HidTransport, InReportOverflowPolicy
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.Usb01InReport import Usb01InReport
+from dualsense_controller.core.report.in_report.enum import InReportGroup, InReportLength
+from tests.common import ControllerInstanceData, ControllerInstanceParams, wait_for
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device,fixture_params_for_controller_instance',
+    [
+        [ConnectionType.USB_01, ControllerInstanceParams(skip_queued_in_reports=True)],
+        [ConnectionType.BT_31, ControllerInstanceParams(skip_queued_in_reports=True)],
+        [ConnectionType.BT_01, ControllerInstanceParams(skip_queued_in_reports=True)],
+    ],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_skip_queued_in_reports(fixture_activated_instance: ControllerInstanceData) -> None:
+    controller = fixture_activated_instance.controller
+    mocked_hidapi_device = fixture_activated_instance.mocked_hidapi_device
+    assert controller.skipped_in_reports == 0
+
+    mocked_hidapi_device.set_left_trigger_raw(123)
+    mocked_hidapi_device.num_queued_in_reports = 5
+    assert wait_for(lambda: controller.skipped_in_reports == 5)
+    assert wait_for(lambda: controller.left_trigger.value == 123)
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_queued_in_reports_processed_by_default(fixture_activated_instance: ControllerInstanceData) -> None:
+    controller = fixture_activated_instance.controller
+    fixture_activated_instance.mocked_hidapi_device.num_queued_in_reports = 5
+    controller.wait_until_updated()
+    assert controller.skipped_in_reports == 0
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_ring_buffer_drop_oldest() -> None:
+    ring_buffer: InReportRingBuffer = InReportRingBuffer(size=3, slot_length=2)
+    for value in range(5):
+        ring_buffer.write_buffer[0] = value
+        assert ring_buffer.commit(1 if value == 4 else 2)
+    assert ring_buffer.occupancy == 3
+
+    assert [bytes(ring_buffer.take()) for _ in range(3)] == [b'\x02\x00', b'\x03\x00', b'\x04']
+    stats: InReportRingBufferStats = ring_buffer.stats
+    assert stats.num_committed == 5
+    assert stats.num_taken == 3
+    assert stats.num_overflows == 2
+    assert stats.max_occupancy == 3
+    assert stats.occupancy == 0
+
+    ring_buffer.close()
+    assert ring_buffer.take() is None
+    assert not ring_buffer.commit(2)
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_ring_buffer_newest_only() -> None:
+    ring_buffer: InReportRingBuffer = InReportRingBuffer(size=4, slot_length=1)
+    for value in range(3):
+        ring_buffer.write_buffer[0] = value
+        ring_buffer.commit(1)
+    assert bytes(ring_buffer.take(newest_only=True)) == b'\x02'
+    assert ring_buffer.num_skipped == 2
+    assert ring_buffer.occupancy == 0
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_ring_buffer_keeps_previous_slot() -> None:
+    ring_buffer: InReportRingBuffer = InReportRingBuffer(size=1, slot_length=1)
+    ring_buffer.write_buffer[0] = 1
+    ring_buffer.commit(1)
+    previous: memoryview = ring_buffer.take()
+    for value in range(2, 5):
+        ring_buffer.write_buffer[0] = value
+        ring_buffer.commit(1)
+        assert bytes(previous) == b'\x01'
+    assert bytes(ring_buffer.take()) == b'\x04'
+    assert bytes(previous) == b'\x01'
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_ring_buffer_block() -> None:
+    ring_buffer: InReportRingBuffer = InReportRingBuffer(
+        size=1, slot_length=1, overflow_policy=InReportOverflowPolicy.BLOCK
+    )
+    ring_buffer.write_buffer[0] = 1
+    ring_buffer.commit(1)
+    ring_buffer.write_buffer[0] = 2
+    committer: threading.Thread = threading.Thread(target=ring_buffer.commit, args=(1,))
+    committer.start()
+    assert wait_for(lambda: ring_buffer.stats.num_blocked == 1)
+    assert committer.is_alive()
+
+    assert bytes(ring_buffer.take()) == b'\x01'
+    committer.join(timeout=2)
+    assert not committer.is_alive()
+    assert bytes(ring_buffer.take()) == b'\x02'
+    assert ring_buffer.stats.num_overflows == 0
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device,fixture_params_for_controller_instance',
+    [
+        [ConnectionType.USB_01, ControllerInstanceParams(in_report_buffer_size=8)],
+        [ConnectionType.BT_31, ControllerInstanceParams(in_report_buffer_size=8)],
+        [ConnectionType.BT_01, ControllerInstanceParams(in_report_buffer_size=8)],
+    ],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_in_report_buffer(fixture_activated_instance: ControllerInstanceData) -> None:
+    controller = fixture_activated_instance.controller
+    fixture_activated_instance.mocked_hidapi_device.set_left_trigger_raw(42)
+    assert wait_for(lambda: controller.left_trigger.value == 42)
+
+    stats: InReportRingBufferStats = controller.in_report_buffer_stats
+    assert stats.size == 8
+    assert stats.num_taken > 0
+    assert stats.num_committed >= stats.num_taken
+
+    # still readable after closing
+    controller.deactivate()
+    assert controller.in_report_buffer_stats.num_taken >= stats.num_taken
+    controller.activate()
+    assert controller.in_report_buffer_stats.size == 8
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_block_rejected_with_reactor() -> None:
+    # a slow controller would block the reactor thread for all others
+    with pytest.raises(ValueError):
+        DualSenseController(
+            device_index_or_device_info=0,
+            transport=HidTransport.HIDRAW,
+            reactor=HidReactor(),
+            in_report_buffer_size=8,
+            in_report_overflow_policy=InReportOverflowPolicy.BLOCK,
+        )
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_double_buffer() -> None:
+    double_buffer: InReportDoubleBuffer = InReportDoubleBuffer(Usb01InReport, InReportLength.USB_01)
+    buffers: set[int] = set()
+    previous_value: int = 0
+    for value in (0x10, 0x20, 0x20):
+        buffers.add(id(double_buffer.back_buffer))
+        front: InReport = double_buffer.front
+        double_buffer.back_buffer[1] = value
+        # the front report is not touched while the back buffer gets filled
+        assert front.axes_0 == previous_value
+        published: InReport = double_buffer.commit(InReportLength.USB_01, 0)
+        assert published is double_buffer.front is not front
+        assert published.frame.left_stick_x == value
+        previous_value = value
+    # only two preallocated buffers, changes are compared across both reports
+    assert len(buffers) == 2
+    assert double_buffer.front.changed_groups == InReportGroup(0)
+
+    double_buffer.back_buffer[:] = bytes(double_buffer.front.raw_bytes)
+    double_buffer.back_buffer[6] = 0x80
+    assert double_buffer.commit(InReportLength.USB_01, 0).changed_groups == InReportGroup.TRIGGERS
@@ -2,6 +2,8 @@ import pytest as pytest
 
 from dualsense_controller.core.enum import ConnectionType
 from dualsense_controller.api.DualSenseController import Mapping
+from dualsense_controller.core.state.State import State
+from dualsense_controller.core.state.read_state.value_type import JoyStick
 from dualsense_controller.core.state.typedef import Number
 from tests.common import ControllerInstanceData, ControllerInstanceParams
 
@@ -307,3 +309,35 @@ def test_mapping_bt01(
     assert right_stick_y_mapped == pytest.approx(fixture_activated_instance.controller.right_stick_y.value, rel=1e-4)
     assert left_trigger_mapped == pytest.approx(fixture_activated_instance.controller.left_trigger.value, rel=1e-4)
     assert right_trigger_mapped == pytest.approx(fixture_activated_instance.controller.right_trigger.value, rel=1e-4)
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_mapped_values_cached_until_raw_value_changes() -> None:
+    calls: list[JoyStick] = []
+
+    def raw_to_mapped(value: JoyStick) -> JoyStick:
+        calls.append(value)
+        return JoyStick(value.x - 128, 127 - value.y)
+
+    state: State[JoyStick] = State('stick', value=JoyStick(128, 127), raw_to_mapped_fn=raw_to_mapped)
+    assert state.value is state.value
+    assert len(calls) == 1
+
+    changes: list[tuple[JoyStick, JoyStick]] = []
+    state.on_change(lambda last_value, value, timestamp: changes.append((last_value, value)))
+    state.set_value_raw_without_triggering_change(JoyStick(138, 117))
+    state.trigger_change_if_changed()
+    # the former value had been mapped already
+    assert changes == [(JoyStick(0, 0), JoyStick(10, 10))]
+    assert len(calls) == 2
+    assert state.value is changes[0][1]
+    assert state.last_value is changes[0][0]
+    assert len(calls) == 2
+
+    # equal, but another object
+    state.set_value_raw_without_triggering_change(JoyStick(138, 117))
+    assert state.value == JoyStick(10, 10)
+    assert len(calls) == 2
+    state.set_value_raw_without_triggering_change(JoyStick(148, 117))
+    assert state.value == JoyStick(20, 10)
+    assert len(calls) == 3
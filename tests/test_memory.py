@@ -0,0 +1,39 @@
+import gc
+import tracemalloc
+
+import pytest as pytest
+
+from dualsense_controller.api.DualSenseController import DualSenseController
+from dualsense_controller.api.property.base import Property
+from dualsense_controller.core.state.State import State
+from tests.mock.common import DeviceInfoMock
+
+# bytes per (not activated) controller, to notice regressions. Run this module to print the current value
+_MAX_BYTES_PER_CONTROLLER: int = 200_000
+
+
+def measure_bytes_per_controller(num_controllers: int = 20) -> int:
+    # the first one also loads modules and fills caches
+    DualSenseController(device_index_or_device_info=DeviceInfoMock())
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        controllers: list[DualSenseController] = [
+            DualSenseController(device_index_or_device_info=DeviceInfoMock()) for _ in range(num_controllers)
+        ]
+        gc.collect()
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert len(controllers) == num_controllers
+    return (after - before) // num_controllers
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_bytes_per_controller() -> None:
+    assert measure_bytes_per_controller() < _MAX_BYTES_PER_CONTROLLER
+
+
+if __name__ == '__main__':
+    print(f'{measure_bytes_per_controller()} bytes per controller')
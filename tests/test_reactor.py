@@ -0,0 +1,112 @@
+import os
+import threading
+from pathlib import Path
+
+import pytest as pytest
+
+from dualsense_controller.api.DualSenseController import DualSenseController
+from dualsense_controller.core.HidControllerDevice import HidControllerDevice
+from dualsense_controller.core.HidReactor import HidReactor
+from dualsense_controller.core.enum import HidTransport
+from dualsense_controller.core.hidraw import hidraw
+from tests.common import wait_for
+from tests.mock.common import DeviceInfoMock
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_reactor_dispatches_all_fds_in_one_thread() -> None:
+    reactor: HidReactor = HidReactor()
+    pipes: list[tuple[int, int]] = [os.pipe() for _ in range(4)]
+    received: dict[int, list[bytes]] = {read_fd: [] for read_fd, _ in pipes}
+    threads: set[threading.Thread] = set()
+
+    def create_callback(read_fd: int):
+        def callback() -> None:
+            threads.add(threading.current_thread())
+            received[read_fd].append(os.read(read_fd, 64))
+
+        return callback
+
+    try:
+        for read_fd, _ in pipes:
+            reactor.register(read_fd, create_callback(read_fd))
+        assert reactor.is_running
+        assert reactor.num_registered == 4
+
+        for index, (_, write_fd) in enumerate(pipes):
+            os.write(write_fd, bytes([index]))
+        assert wait_for(lambda: all(received.values()))
+        assert [received[read_fd] for read_fd, _ in pipes] == [[b'\x00'], [b'\x01'], [b'\x02'], [b'\x03']]
+        assert len(threads) == 1
+        assert threading.current_thread() not in threads
+
+        for read_fd, _ in pipes:
+            reactor.unregister(read_fd)
+        assert not reactor.is_running
+        assert reactor.num_registered == 0
+        # unregistering twice is fine
+        reactor.unregister(pipes[0][0])
+    finally:
+        for read_fd, write_fd in pipes:
+            os.close(read_fd)
+            os.close(write_fd)
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_reactor_callbacks_run_without_lock() -> None:
+    reactor: HidReactor = HidReactor()
+    read_fd, write_fd = os.pipe()
+    other_read_fd, other_write_fd = os.pipe()
+    entered: threading.Event = threading.Event()
+    release: threading.Event = threading.Event()
+    returned: list[bool] = []
+
+    def slow_callback() -> None:
+        os.read(read_fd, 64)
+        entered.set()
+        release.wait(2)
+        returned.append(True)
+
+    try:
+        reactor.register(read_fd, slow_callback)
+        os.write(write_fd, b'\x00')
+        assert entered.wait(2)
+        # not blocked by the running callback
+        reactor.register(other_read_fd, lambda: os.read(other_read_fd, 64))
+        assert reactor.num_registered == 2
+
+        unregistered: threading.Event = threading.Event()
+        unregister_thread: threading.Thread = threading.Thread(
+            target=lambda: (reactor.unregister(read_fd), unregistered.set())
+        )
+        unregister_thread.start()
+        # waits for the running callback of its fd
+        assert not unregistered.wait(0.05)
+        release.set()
+        assert unregistered.wait(2)
+        assert returned == [True]
+        unregister_thread.join()
+        reactor.unregister(other_read_fd)
+        assert not reactor.is_running
+    finally:
+        release.set()
+        for fd in (read_fd, write_fd, other_read_fd, other_write_fd):
+            os.close(fd)
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_reactor_rejects_hidapi_transport() -> None:
+    # hidapi devices have no file descriptor to wait on
+    with pytest.raises(ValueError):
+        DualSenseController(device_index_or_device_info=0, reactor=HidReactor())
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_reactor_does_not_fall_back_to_hidapi(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(hidraw, '_SYSFS_HIDRAW_DIR', str(tmp_path / 'missing'))
+    device: HidControllerDevice = HidControllerDevice(
+        DeviceInfoMock(), transport=HidTransport.HIDRAW, reactor=HidReactor()
+    )
+    with pytest.raises(OSError, match='hidraw is not available'):
+        device.open(timeout=1)
+    assert not device.is_opened
@@ -0,0 +1,130 @@
+import threading
+
+import pytest as pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.state.State import State
+from dualsense_controller.core.state.StateStorage import AtomicStateStorage, LockedStateStorage, StateRecord
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadState import ReadState
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from tests.common import ControllerInstanceData, ControllerInstanceParams
+from tests.mock.MockedHidapiMockedHidapiDevice import MockedHidapiMockedHidapiDevice
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize('lock_free', [False, True])
+def test_state_stores_record(lock_free: bool) -> None:
+    state: State[int] = State('test', value=1, lock_free=lock_free)
+    assert isinstance(state._storage, AtomicStateStorage if lock_free else LockedStateStorage)
+    changes: list[tuple[int, int]] = []
+    state.on_change(lambda last_value, value, timestamp: changes.append((last_value, value)))
+
+    state.value = 2
+    record: StateRecord = state.record
+    assert record.value_raw == 2
+    assert record.last_value_raw == 1
+    assert record.changed
+    assert record.change_timestamp > 0
+    assert changes == [(1, 2)]
+
+    state.value = 2
+    assert state.record.last_value_raw == 2
+    assert not state.has_changed_since_last_set_value
+    assert changes == [(1, 2)]
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_atomic_records_are_consistent() -> None:
+    storage: AtomicStateStorage[int] = AtomicStateStorage(0)
+    num_stores: int = 100_000
+    inconsistent: list[StateRecord] = []
+
+    def write() -> None:
+        for value in range(1, num_stores + 1):
+            storage.store(value, value - 1, value, value % 2 == 0)
+
+    writer: threading.Thread = threading.Thread(target=write)
+    writer.start()
+    while writer.is_alive():
+        record: StateRecord = storage.record
+        if record.value_raw == 0:
+            continue
+        if (
+                record.last_value_raw != record.value_raw - 1
+                or record.change_timestamp != record.value_raw
+                or record.changed != (record.value_raw % 2 == 0)
+        ):
+            inconsistent.append(record)
+    writer.join()
+    assert inconsistent == []
+    assert storage.value_raw == num_stores
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device,fixture_params_for_controller_instance',
+    [
+        [ConnectionType.USB_01, ControllerInstanceParams(lock_free_states=True)],
+        [ConnectionType.BT_31, ControllerInstanceParams(lock_free_states=True)],
+    ],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_lock_free_states(fixture_activated_instance: ControllerInstanceData) -> None:
+    controller = fixture_activated_instance.controller
+    mocked_hidapi_device = fixture_activated_instance.mocked_hidapi_device
+    read_states = controller._core.read_states
+    assert isinstance(read_states.left_trigger_value._storage, AtomicStateStorage)
+
+    values: list[int] = []
+    controller.left_trigger.on_change(values.append)
+    controller.wait_until_updated()
+    controller.wait_until_updated()
+    mocked_hidapi_device.set_left_trigger_raw(255)
+    mocked_hidapi_device.set_right_trigger_raw(255)
+    controller.wait_until_updated()
+    controller.wait_until_updated()
+    assert values == [255]
+
+    # not listened, calculated on access in this thread, but only stored by the reader
+    record: StateRecord = read_states.right_trigger_value.record
+    assert controller.right_trigger.value == 255
+    assert read_states.right_trigger_value.record == record
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_lock_free_values_calculated_once_per_cycle() -> None:
+    read_states: ReadStates = ReadStates(StateValueMapper(StateValueMapping.DEFAULT), lock_free=True)
+    in_report: InReport = MockedHidapiMockedHidapiDevice(ConnectionType.USB_01)._in_report
+    in_report.axes_5 = 0x40
+    in_report.update(in_report.raw_bytes)
+    state: ReadState[int] = read_states.right_trigger_value
+    num_calcs: int = 0
+    value_calc_fn = state._value_calc_fn
+
+    def counting_value_calc_fn(*args) -> int:
+        nonlocal num_calcs
+        num_calcs += 1
+        return value_calc_fn(*args)
+
+    state._value_calc_fn = counting_value_calc_fn
+    reader: threading.Thread = threading.Thread(target=read_states.update, args=(in_report, ConnectionType.USB_01))
+    reader.start()
+    reader.join()
+
+    # not the reader: calculated once per cycle, without storing
+    record: StateRecord = state.record
+    assert [state.value_raw for _ in range(3)] == [0x40] * 3
+    assert num_calcs == 1
+    assert state.record == record
+
+    # the reader stores
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert state.value_raw == 0x40
+    assert state.record.value_raw == 0x40
+    assert state.record.change_timestamp == in_report.timestamp
+    assert num_calcs == 2
+    assert state.value_raw == 0x40
+    assert num_calcs == 2
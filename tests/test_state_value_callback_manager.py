@@ -0,0 +1,95 @@
+import pytest as pytest
+
+from dualsense_controller.core.state.StateValueCallbackManager import StateValueCallbackManager
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_dispatch_by_number_of_args() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    assert not manager.has_listeners
+    calls: list[tuple] = []
+    manager.on_change(lambda: calls.append(()))
+    manager.on_change(lambda value: calls.append((value,)))
+    manager.on_change(lambda value, timestamp: calls.append((value, timestamp)))
+    manager.on_change(lambda old_value, value, timestamp: calls.append((old_value, value, timestamp)))
+    manager.on_change(lambda name, old_value, value, timestamp: calls.append((name, old_value, value, timestamp)))
+    assert manager.has_listeners
+
+    manager.emit_change(1, 2, 3)
+    assert calls == [(), (2,), (2, 3), (1, 2, 3), ('test', 1, 2, 3)]
+
+    with pytest.raises(Exception):
+        manager.on_change(lambda a, b, c, d, e: None)
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_once_and_remove() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    values: list[int] = []
+    once_values: list[int] = []
+
+    def callback(value: int) -> None:
+        values.append(value)
+
+    def once_callback(value: int) -> None:
+        once_values.append(value)
+
+    # registered only once
+    manager.on_change(callback)
+    manager.on_change(callback)
+    manager.once_change(once_callback)
+    manager.emit_change(0, 1, 0)
+    manager.emit_change(1, 2, 0)
+    assert values == [1, 2]
+    assert once_values == [1]
+
+    manager.remove_change_listener(callback)
+    assert not manager.has_listeners
+    manager.emit_change(2, 3, 0)
+    assert values == [1, 2]
+    with pytest.raises(KeyError):
+        manager.remove_change_listener(callback)
+
+    manager.once_change(once_callback)
+    manager.remove_change_listener()
+    manager.emit_change(3, 4, 0)
+    assert once_values == [1]
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_changes_during_emit() -> None:
+    manager: StateValueCallbackManager[int] = StateValueCallbackManager('test')
+    values: list[int] = []
+
+    def late_callback(value: int) -> None:
+        values.append(-value)
+
+    def once_callback(value: int) -> None:
+        values.append(value)
+
+    def remove_once_and_add(value: int) -> None:
+        manager.remove_change_listener(once_callback)
+        manager.on_change(late_callback)
+
+    nested: list[bool] = []
+
+    def emit_nested() -> None:
+        if not nested:
+            nested.append(True)
+            manager.emit_change(0, 1, 0)
+
+    manager.on_change(emit_nested)
+    manager.once_change(once_callback)
+    manager.emit_change(0, 1, 0)
+    # the nested emit took the once listener
+    assert values == [1]
+
+    manager.remove_all_change_listeners()
+    manager.on_change(remove_once_and_add)
+    manager.once_change(once_callback)
+    manager.emit_change(1, 2, 0)
+    # removed before its turn, added ones are called with the next change
+    assert values == [1]
+    manager.remove_change_listener(remove_once_and_add)
+    manager.emit_change(2, 3, 0)
+    assert values == [1, -3]
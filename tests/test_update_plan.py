@@ -0,0 +1,69 @@
+import pytest as pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.report.in_report.InReport import InReport
+from dualsense_controller.core.report.in_report.enum import InReportGroup
+from dualsense_controller.core.state.mapping.StateValueMapper import StateValueMapper
+from dualsense_controller.core.state.mapping.enum import StateValueMapping
+from dualsense_controller.core.state.read_state.ReadState import ReadState
+from dualsense_controller.core.state.read_state.ReadStates import ReadStates
+from tests.mock.MockedHidapiMockedHidapiDevice import MockedHidapiMockedHidapiDevice
+
+
+def _planned_states(read_states: ReadStates) -> dict[InReportGroup, list[ReadState]]:
+    return {
+        group: [state for state, _ in planned_states]
+        for group, _, planned_states in read_states._update_plan
+        if planned_states
+    }
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_plan_follows_listeners() -> None:
+    read_states: ReadStates = ReadStates(StateValueMapper(StateValueMapping.DEFAULT))
+    in_report: InReport = MockedHidapiMockedHidapiDevice(ConnectionType.USB_01)._in_report
+    in_report.update(in_report.raw_bytes)
+    read_states.update(in_report, ConnectionType.USB_01)
+    # only states depending on others, which are calculated just when these have changed
+    assert all(
+        only_on_changed_dependencies
+        for _, _, planned_states in read_states._update_plan
+        for _, only_on_changed_dependencies in planned_states
+    )
+
+    values: list[int] = []
+    read_states.left_stick_x.on_change(values.append)
+    read_states.btn_triangle.on_change(lambda: None)
+    read_states.update(in_report, ConnectionType.USB_01)
+    planned_states: dict[InReportGroup, list[ReadState]] = _planned_states(read_states)
+    # the stick is calculated before the listened axis depending on it
+    assert planned_states[InReportGroup.STICKS][:2] == [read_states.left_stick, read_states.left_stick_x]
+    assert read_states.btn_triangle in planned_states[InReportGroup.BUTTONS]
+    assert read_states.btn_cross not in planned_states[InReportGroup.BUTTONS]
+
+    in_report.axes_0 = 0x12
+    in_report.update(in_report.raw_bytes)
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert len(values) == 1
+    assert read_states.left_stick_x.value_raw == 0x12
+    # not planned, but calculated on access
+    in_report.axes_2 = 0x34
+    in_report.update(in_report.raw_bytes)
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.right_stick_x.value_raw == 0x34
+
+    read_states.btn_triangle.remove_all_change_listeners()
+    read_states.update(in_report, ConnectionType.USB_01)
+    assert read_states.btn_triangle not in _planned_states(read_states).get(InReportGroup.BUTTONS, [])
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_plan_bt01() -> None:
+    read_states: ReadStates = ReadStates(StateValueMapper(StateValueMapping.DEFAULT), enforce_update=True)
+    in_report: InReport = MockedHidapiMockedHidapiDevice(ConnectionType.BT_01)._in_report
+    in_report.update(in_report.raw_bytes)
+    read_states.update(in_report, ConnectionType.BT_01)
+    assert [group for group, _, _ in read_states._update_plan] == [
+        InReportGroup.STICKS, InReportGroup.TRIGGERS, InReportGroup.BUTTONS
+    ]
+    assert len(_planned_states(read_states)[InReportGroup.BUTTONS]) == 20
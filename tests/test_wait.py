@@ -0,0 +1,49 @@
+import threading
+
+import pytest as pytest
+
+from dualsense_controller.core.enum import ConnectionType
+from dualsense_controller.core.state.read_state.enum import ReadStateName
+from tests.common import ControllerInstanceData
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_wait_until_updated(fixture_activated_instance: ControllerInstanceData) -> None:
+    controller = fixture_activated_instance.controller
+    assert controller.wait_until_updated(timeout=2) is True
+    assert controller.wait_for_next_report(timeout=2) is True
+
+
+# @pytest.mark.skip(reason="temp disabled")
+def test_wait_until_updated_timeout(fixture_controller_instance: ControllerInstanceData) -> None:
+    # not activated, so no reports
+    assert fixture_controller_instance.controller.wait_until_updated(timeout=0.01) is False
+    assert fixture_controller_instance.controller.wait_for_next_report(timeout=0.01) is False
+
+
+# @pytest.mark.skip(reason="temp disabled")
+@pytest.mark.parametrize(
+    'fixture_params_for_mocked_hidapi_device',
+    [ConnectionType.USB_01, ConnectionType.BT_31, ConnectionType.BT_01],
+    indirect=['fixture_params_for_mocked_hidapi_device']
+)
+def test_wait_for_state(fixture_activated_instance: ControllerInstanceData) -> None:
+    controller = fixture_activated_instance.controller
+    mocked_hidapi_device = fixture_activated_instance.mocked_hidapi_device
+    state = controller._core.read_states.get_state(ReadStateName.LEFT_TRIGGER_VALUE)
+
+    assert controller.wait_for_state(ReadStateName.LEFT_TRIGGER_VALUE, lambda value: value == 77, timeout=0.05) is False
+    assert not state.has_listeners
+
+    timer: threading.Timer = threading.Timer(0.02, mocked_hidapi_device.set_left_trigger_raw, args=(77,))
+    timer.start()
+    assert controller.wait_for_state(ReadStateName.LEFT_TRIGGER_VALUE, lambda value: value == 77, timeout=2) is True
+    assert not state.has_listeners
+    # already fulfilled
+    assert controller.wait_for_state(ReadStateName.LEFT_TRIGGER_VALUE, lambda value: value == 77, timeout=0) is True
+    timer.join()